@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+""" Benchmark du codage adaptatif (type 5) face au codage statique (types 2 et 3)
+
+compare débits, tailles compressées et délai avant le premier octet produit, sur
+des données stationnaires et sur des données dont la distribution change en cours
+de route
+
+usage : python -m benchmarks.bench_adaptatif [taille_en_octets]
+"""
+import io
+import random
+import sys
+import time
+from huffman.compresseur import compresser, decompresser
+from huffman.adaptatif import compresser_adaptatif, EncodeurAdaptatif
+
+def donnees_stationnaires(taille: int) -> bytes:
+    """ retourne des octets dont la distribution ressemble à celle d'un texte """
+    generateur = random.Random(0)
+    return bytes(generateur.choices(range(256), weights=[(i % 64 + 1) ** 2 for i in range(256)],
+                                    k=taille))
+
+def donnees_changeantes(taille: int) -> bytes:
+    """ retourne des octets dont l'alphabet change à chaque quart """
+    generateur = random.Random(0)
+    quarts = [bytes(generateur.choices(range(64 * i, 64 * i + 64),
+                                       weights=[(j + 1) ** 2 for j in range(64)],
+                                       k=taille // 4)) for i in range(4)]
+    return b"".join(quarts)
+
+def mesurer(nom: str, fonction, taille: int) -> float:
+    """ exécute fonction et affiche son débit """
+    debut = time.perf_counter()
+    fonction()
+    duree = time.perf_counter() - debut
+    print(f"  {nom:<34} {duree:8.3f} s {taille / duree / 1e6:8.2f} Mo/s")
+    return duree
+
+def comparer(nom: str, octets: bytes) -> None:
+    """ compresse et décompresse octets avec chaque mode """
+    print(f"{nom} ({len(octets)} octets)")
+    modes = {"statique": lambda d, s: compresser(d, s),
+             "statique canonique": lambda d, s: compresser(d, s, canonique=True),
+             "adaptatif": compresser_adaptatif}
+    for mode, compression in modes.items():
+        flux_compresse = io.BytesIO()
+        mesurer(f"compression {mode}", lambda: compression(flux_compresse, io.BytesIO(octets)),
+                len(octets))
+        flux_decompresse = io.BytesIO()
+        mesurer(f"décompression {mode}", lambda: decompresser(flux_decompresse, flux_compresse),
+                len(octets))
+        assert flux_decompresse.getvalue() == octets
+        print(f"  {'taille ' + mode:<34} {len(flux_compresse.getvalue()):8} octets")
+
+def premier_octet(octets: bytes) -> None:
+    """ mesure le délai avant que chaque mode ne produise son premier octet compressé """
+    debut = time.perf_counter()
+    compresser(io.BytesIO(), io.BytesIO(octets))    # les statistiques lisent toute la source
+    print(f"premier octet statique  : {(time.perf_counter() - debut) * 1e3:8.2f} ms")
+    debut = time.perf_counter()
+    EncodeurAdaptatif().encoder(octets[:64])
+    print(f"premier octet adaptatif : {(time.perf_counter() - debut) * 1e3:8.2f} ms")
+
+def main():
+    """ programme principal du benchmark """
+    taille = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    comparer("données stationnaires", donnees_stationnaires(taille))
+    comparer("données changeantes", donnees_changeantes(taille))
+    premier_octet(donnees_stationnaires(taille))
+
+if __name__ == "__main__":
+    main()
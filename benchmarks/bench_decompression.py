@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+""" Benchmark de la décompression du cas général (type 2)
+
+compare le parcours de l'arbre bit à bit à la table de décodage multi-bits
+
+usage : python -m benchmarks.bench_decompression [taille_en_octets]
+"""
+import io
+import random
+import sys
+import time
+from huffman.compresseur import arbre_de_huffman, compresser, statistiques, codes_binaire
+from huffman.arbre_huffman import ArbreHuffman
+from huffman.decodeur import TableDeDecodage
+
+def donnees_de_test(taille: int) -> bytes:
+    """ retourne des octets dont la distribution ressemble à celle d'un texte """
+    generateur = random.Random(0)
+    return bytes(generateur.choices(range(256), weights=[(i % 64 + 1) ** 2 for i in range(256)],
+                                    k=taille))
+
+def decoder_bit_a_bit(destination: io.RawIOBase, source: io.RawIOBase,
+                      arbre: ArbreHuffman, longueur: int) -> None:
+    """ décodage de référence : parcours de l'arbre un bit à la fois """
+    octet_courant: bytes = source.readline(1)
+    bit_courant: int = 0
+    arbre_courant: ArbreHuffman = arbre
+    for _ in range(longueur):
+        while not arbre_courant.est_une_feuille:
+            if bit_courant > 7:
+                bit_courant = 0
+                octet_courant = source.readline(1)
+            if (int.from_bytes(octet_courant, byteorder='big') & 2**bit_courant) == 0:
+                arbre_courant = arbre_courant.fils_gauche
+            else:
+                arbre_courant = arbre_courant.fils_droit
+            bit_courant += 1
+        destination.write(arbre_courant.element.to_bytes(1, 'big'))
+        arbre_courant = arbre
+
+def mesurer(nom: str, fonction, taille: int) -> float:
+    """ exécute fonction et affiche son débit """
+    debut = time.perf_counter()
+    fonction()
+    duree = time.perf_counter() - debut
+    print(f"{nom:<24} {duree:8.3f} s {taille / duree / 1e6:8.2f} Mo/s")
+    return duree
+
+def main():
+    """ programme principal du benchmark """
+    taille = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    octets = donnees_de_test(taille)
+    flux_compresse = io.BytesIO()
+    compresser(flux_compresse, io.BytesIO(octets))
+    debut_des_codes = 3 + 4 + 256 * 4
+    stats, longueur = statistiques(io.BytesIO(octets))
+    arbre = arbre_de_huffman(stats)
+    table = TableDeDecodage(codes_binaire(arbre))
+
+    def par_arbre():
+        flux_compresse.seek(debut_des_codes)
+        destination = io.BytesIO()
+        decoder_bit_a_bit(destination, flux_compresse, arbre, longueur)
+        assert destination.getvalue() == octets
+
+    def par_table():
+        flux_compresse.seek(debut_des_codes)
+        destination = io.BytesIO()
+        table.decoder(destination, flux_compresse, longueur)
+        assert destination.getvalue() == octets
+
+    print(f"décodage de {taille} octets")
+    duree_arbre = mesurer("arbre bit à bit", par_arbre, taille)
+    duree_table = mesurer("table multi-bits", par_table, taille)
+    print(f"gain : x{duree_arbre / duree_table:.1f}")
+
+if __name__ == "__main__":
+    main()
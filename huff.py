@@ -3,13 +3,26 @@
 # -*- coding: utf-8 -*-
 """Module main du compresseur de huffman"""
 import argparse
+import contextlib
+import io
 import logging
 import os
+import stat
+import sys
 from huffman.compresseur import compresser
 from huffman.compresseur import decompresser
+from huffman.decodeur import DecodageErreur
+from huffman.adaptatif import compresser_adaptatif
+from huffman.blocs import compresser_blocs, decompresser_fichier_blocs, lire_index, \
+    IndexDeBlocsErreur, TAILLE_BLOC
+from huffman.modele import Modele, ModeleErreur, entrainer_modele, compresser_avec_modele
+from huffman.projection import projeter_en_lecture, projeter_en_ecriture, taille_decompressee
+from huffman.archive import ArchiveErreur, creer_archive, lister_archive, extraire_archive
 
 logger = logging.getLogger()
 
+FLUX_STANDARD = '-'
+
 class CustomFormatter(logging.Formatter):
     """Formatter de logging customisé"""
 
@@ -33,43 +46,242 @@ class CustomFormatter(logging.Formatter):
         formatter = logging.Formatter(log_format)
         return formatter.format(record)
 
-def compresser_fichier(nom_fichier_source, nom_fichier_destination):
+class CompteurDErreurs(logging.Handler):
+    """Handler comptant les erreurs signalées, pour le code
+    de retour du programme"""
+
+    def __init__(self):
+        super().__init__(logging.ERROR)
+        self.nb_erreurs = 0
+
+    def emit(self, record):
+        self.nb_erreurs += 1
+
+@contextlib.contextmanager
+def supprimer_en_cas_d_erreur(nom_fichier):
+    """Permet de supprimer le fichier destination (sauf la
+    sortie standard) si son écriture est interrompue par une
+    exception : un fichier projeté, dimensionné à l'avance,
+    paraîtrait sinon complet"""
+    try:
+        yield
+    except BaseException:
+        if nom_fichier != FLUX_STANDARD and os.path.exists(nom_fichier):
+            os.remove(nom_fichier)
+        raise
+
+def ouvrir(nom_fichier, mode):
+    """Permet d'ouvrir un fichier binaire, FLUX_STANDARD désignant
+    l'entrée standard en lecture et la sortie standard en écriture"""
+    if nom_fichier == FLUX_STANDARD:
+        return contextlib.nullcontext(sys.stdin.buffer if 'r' in mode else sys.stdout.buffer)
+    return open(nom_fichier, mode)
+
+def projection_possible(nom_fichier_source, nom_fichier_destination):
+    """Permet de savoir si la source est un fichier régulier
+    non vide pouvant être projeté en mémoire (mmap) et si la
+    destination n'est pas la sortie standard"""
+    if FLUX_STANDARD in (nom_fichier_source, nom_fichier_destination):
+        return False
+    etat = os.stat(nom_fichier_source)
+    return stat.S_ISREG(etat.st_mode) and etat.st_size > 0
+
+def compresser_fichier(nom_fichier_source, nom_fichier_destination,
+                       nb_processus=None, taille_bloc=None, adaptatif=False,
+                       nb_processus_statistiques=1, modele=None):
     """Permet de compresser le fichier source en
-    écrivant dans le fichier destination"""
+    écrivant dans le fichier destination, en une passe
+    avec le codage adaptatif si adaptatif est vrai, par
+    blocs si nb_processus ou taille_bloc est donné ou si
+    la source n'est pas positionnable (tube, entrée standard) ;
+    un fichier régulier est sinon projeté en mémoire, ses
+    octets étant comptés par nb_processus_statistiques processus ;
+    avec un modele pré-entraîné, seul son identifiant est écrit"""
 # @u:start compresser_fichier
 
-    with open(nom_fichier_source, 'rb') as fichier_source:
-        with open(nom_fichier_destination, 'wb') as fichier_destination:
-            compresser(fichier_destination, fichier_source)
+    if modele is not None:
+        with ouvrir(nom_fichier_source, 'rb') as fichier_source:
+            with ouvrir(nom_fichier_destination, 'wb') as fichier_destination:
+                compresser_avec_modele(fichier_destination, fichier_source if fichier_source.seekable()
+                                       else io.BytesIO(fichier_source.read()), modele)
+        return
+    if not adaptatif and nb_processus is None and taille_bloc is None \
+        and projection_possible(nom_fichier_source, nom_fichier_destination):
+        with projeter_en_lecture(nom_fichier_source) as fichier_source:
+            with open(nom_fichier_destination, 'wb') as fichier_destination:
+                compresser(fichier_destination, fichier_source,
+                           nb_processus=nb_processus_statistiques)
+        return
+    with ouvrir(nom_fichier_source, 'rb') as fichier_source:
+        with ouvrir(nom_fichier_destination, 'wb') as fichier_destination:
+            if adaptatif:
+                compresser_adaptatif(fichier_destination, fichier_source)
+            elif nb_processus is None and taille_bloc is None and fichier_source.seekable():
+                compresser(fichier_destination, fichier_source,
+                           nb_processus=nb_processus_statistiques)
+            else:
+                compresser_blocs(fichier_destination, fichier_source,
+                                 taille_bloc=taille_bloc or TAILLE_BLOC,
+                                 nb_processus=nb_processus or 1)
 
 # @u:end compresser_fichier
 
-def decompresser_fichier(nom_fichier_source, nom_fichier_destination):
+def decompresser_fichier(nom_fichier_source, nom_fichier_destination, nb_processus=None,
+                         modele=None):
     """Permet de décompresser le fichier source en
-    écrivant dans le fichier destination"""
+    écrivant dans le fichier destination, les blocs d'un
+    fichier indexé étant décodés par nb_processus processus ;
+    entre fichiers réguliers, la source et la destination
+    (dimensionnée d'après l'entête) sont projetées en mémoire ;
+    modele est le modèle pré-entraîné d'un fichier de type 6"""
+    modeles = () if modele is None else (modele,)
 # @u:start decompresser_fichier
 
-    with open(nom_fichier_source, 'rb') as fichier_source:
-        with open(nom_fichier_destination, 'wb') as fichier_destination:
-            decompresser(fichier_destination, fichier_source)
+    with supprimer_en_cas_d_erreur(nom_fichier_destination):
+        if nb_processus is not None and nb_processus > 1 \
+            and FLUX_STANDARD not in (nom_fichier_source, nom_fichier_destination):
+            try:
+                with open(nom_fichier_source, 'rb') as fichier_source:
+                    lire_index(fichier_source)
+                decompresser_fichier_blocs(nom_fichier_source, nom_fichier_destination, nb_processus)
+                return
+            except IndexDeBlocsErreur:
+                logger.info("Fichier sans index de blocs : décompression séquentielle")
+        if projection_possible(nom_fichier_source, nom_fichier_destination):
+            with projeter_en_lecture(nom_fichier_source) as fichier_source:
+                taille = taille_decompressee(fichier_source)
+                if taille:
+                    with projeter_en_ecriture(nom_fichier_destination, taille) as fichier_destination:
+                        decompresser(fichier_destination, fichier_source, modeles=modeles)
+                    return
+        with ouvrir(nom_fichier_source, 'rb') as fichier_source:
+            with ouvrir(nom_fichier_destination, 'wb') as fichier_destination:
+                decompresser(fichier_destination, fichier_source, modeles=modeles)
 
 # @u:end decompresser_fichier
 
+def entrainer_modele_fichier(nom_fichier_source, nom_fichier_destination):
+    """Permet d'entraîner un modèle sur le fichier source
+    et de l'enregistrer dans le fichier destination ; l'entrée
+    standard, non positionnable, est lue en une seule passe"""
+    with ouvrir(nom_fichier_source, 'rb') as fichier_source:
+        modele = entrainer_modele([fichier_source])
+    with ouvrir(nom_fichier_destination, 'wb') as fichier_destination:
+        modele.ecrire(fichier_destination)
+    logger.info("Modèle %08x enregistré", modele.identifiant)
+
+def afficher_archive(nom_archive):
+    """Permet d'afficher les membres de l'archive (longueur,
+    taille compressée et nom), en ne lisant que son répertoire"""
+    for membre in lister_archive(nom_archive):
+        print(f"{membre.longueur:>12} {membre.taille:>12} {membre.nom}")
+
+def executer_commande(args):
+    """Permet d'exécuter la commande demandée, les erreurs
+    étant signalées par le logger"""
+    if args.commande == 'a':
+        manquants = [nom for nom in args.noms if not os.path.exists(nom)]
+        if manquants:
+            logger.error("Les fichiers '%s' n'existent pas !", "', '".join(manquants))
+            return
+        if os.path.exists(args.nom_fichier_source):
+            logger.error("L'archive '%s' existe déjà !", args.nom_fichier_source)
+            return
+        try:
+            creer_archive(args.nom_fichier_source, args.noms)
+        except (ArchiveErreur, OSError) as erreur:
+            logger.error("%s", erreur)
+        return
+    if args.commande in ('l', 'x'):
+        if not os.path.isfile(args.nom_fichier_source):
+            logger.error("L'archive '%s' n'existe pas !", args.nom_fichier_source)
+            return
+        try:
+            if args.commande == 'l':
+                afficher_archive(args.nom_fichier_source)
+            else:
+                extraire_archive(args.nom_fichier_source, args.noms or None)
+        except FileExistsError as erreur:
+            logger.error("Le fichier destination '%s' existe déjà !", erreur.filename)
+        except ArchiveErreur as erreur:
+            logger.error("%s", erreur)
+        return
+
+    nom_fichier_source = args.nom_fichier_source
+    nom_fichier_destination = args.noms[0]
+
+    if nom_fichier_source != FLUX_STANDARD and not os.path.exists(nom_fichier_source):
+        logger.error("Le fichier source '%s' n'existe pas !", nom_fichier_source)
+        return
+    if nom_fichier_destination != FLUX_STANDARD and os.path.exists(nom_fichier_destination):
+        logger.error("Le fichier destination '%s' existe déjà !", nom_fichier_destination)
+        return
+
+    try:
+        modele = None if args.modele is None else Modele.charger(args.modele)
+        if args.commande == 'c':
+            compresser_fichier(nom_fichier_source, nom_fichier_destination, args.jobs,
+                               None if args.taille_bloc is None else args.taille_bloc << 20,
+                               args.adaptatif, args.statistiques_paralleles, modele)
+        elif args.commande == 'd':
+            decompresser_fichier(nom_fichier_source, nom_fichier_destination, args.jobs, modele)
+        elif args.commande == 'e':
+            entrainer_modele_fichier(nom_fichier_source, nom_fichier_destination)
+    except (ModeleErreur, DecodageErreur) as erreur:
+        logger.error("%s", erreur)
+
 def main():
-    """progamme principal"""
+    """progamme principal, retourne le code de retour du
+    programme (1 si une erreur a été signalée)"""
 # @u:start main
 
     parser = argparse.ArgumentParser(description="Compresseur/décompresseur d’huffman")
     parser.add_argument("-v", "--verbose", action="count", default=0,
                         help="""affiche des informations lors des
                             phases de compression de de décompression""")
-    parser.add_argument("commande", choices=['c', 'd'],
-                        help="commande : c pour compression, d pour décompression")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="""compresse par blocs indépendants
+                            répartis sur JOBS processus, ou décode
+                            les blocs d'un fichier indexé sur JOBS processus""")
+    parser.add_argument("-b", "--taille-bloc", type=int, default=None,
+                        choices=range(1, 17), metavar="{1..16}",
+                        help=f"""taille des blocs en Mo (défaut :
+                            {TAILLE_BLOC >> 20}), implique la compression par blocs""")
+    parser.add_argument("-a", "--adaptatif", action="store_true",
+                        help="""compresse en une seule passe avec le
+                            codage de Huffman adaptatif (sans table
+                            des fréquences)""")
+    parser.add_argument("-s", "--statistiques-paralleles", type=int, default=1,
+                        metavar="JOBS",
+                        help="""compte les octets du fichier à compresser
+                            par tranches réparties sur JOBS processus
+                            (compression hors blocs)""")
+    parser.add_argument("-m", "--modele", default=None,
+                        help="""fichier du modèle pré-entraîné avec
+                            lequel compresser ou décompresser""")
+    parser.add_argument("commande", choices=['c', 'd', 'e', 'a', 'l', 'x'],
+                        help="""commande : c pour compression, d pour
+                            décompression, e pour entraîner un modèle,
+                            a pour créer une archive, l pour la lister,
+                            x pour en extraire des membres""")
     parser.add_argument("nom_fichier_source",
-                        help="nom du fichier à compresser ou décompresser")
-    parser.add_argument("nom_fichier_destination",
-                        help="nom du fichier à créer")
+                        help="""nom du fichier à compresser ou décompresser
+                            (- pour l'entrée standard), ou de l'archive""")
+    parser.add_argument("noms", nargs='*', metavar="nom_fichier_destination",
+                        help="""nom du fichier à créer (- pour la sortie
+                            standard), fichiers et dossiers à archiver (a)
+                            ou membres à extraire (x, tous par défaut)""")
     args = parser.parse_args()
+    if args.commande in ('c', 'd', 'e') and len(args.noms) != 1:
+        parser.error(f"la commande {args.commande} attend un fichier source et un fichier destination")
+    if args.commande == 'a' and not args.noms:
+        parser.error("la commande a attend les fichiers ou dossiers à archiver")
+    if args.commande == 'c' and args.modele is not None \
+        and (args.adaptatif or args.jobs is not None or args.taille_bloc is not None
+             or args.statistiques_paralleles != 1):
+        parser.error("l'option -m ne peut pas être combinée avec -a, -j, -b ou -s")
+    if args.commande == 'l' and args.noms:
+        parser.error("la commande l n'attend que le nom de l'archive")
 
     sortie_standard = logging.StreamHandler()
     logger.setLevel(logging.DEBUG)
@@ -81,22 +293,12 @@ def main():
     sortie_standard.setFormatter(CustomFormatter())
     logger.addHandler(sortie_standard)
 
-    nom_fichier_source = args.nom_fichier_source
-    nom_fichier_destination = args.nom_fichier_destination
-
-    if not os.path.exists(nom_fichier_source):
-        logger.error("Le fichier source '%s' n'existe pas !", nom_fichier_source)
-        return
-    if os.path.exists(nom_fichier_destination):
-        logger.error("Le fichier destination '%s' existe déjà !", nom_fichier_destination)
-        return
-
-    if args.commande == 'c':
-        compresser_fichier(nom_fichier_source, nom_fichier_destination)
-    elif args.commande == 'd':
-        decompresser_fichier(nom_fichier_source, nom_fichier_destination)
+    compteur_d_erreurs = CompteurDErreurs()
+    logger.addHandler(compteur_d_erreurs)
+    executer_commande(args)
+    return 1 if compteur_d_erreurs.nb_erreurs else 0
 
 # @u:end main
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
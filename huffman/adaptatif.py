@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+""" Module proposant le codage de Huffman adaptatif (algorithme FGK, type 5)
+
+L'arbre est mis à jour après chaque symbole, à l'identique par le codeur et le
+décodeur : aucune statistique n'est écrite et le codage commence dès le premier
+octet. Un octet jamais vu est codé par le code de la feuille NYT (« not yet
+transmitted ») suivi de ses NB_BITS_BRUTS bits ; la valeur FIN marque la fin du flux.
+
+    34 32 05 puis les codes, bits de poids faible en premier
+"""
+import io
+import logging
+from typing import Self
+from huffman.compteur import Compteur
+
+LOGGER = logging.getLogger()
+
+NB_BITS_BRUTS = 9
+FIN = 256
+TAILLE_LECTURE = 1 << 16
+
+class NoeudAdaptatif:
+    """ noeud d'un arbre de Huffman adaptatif, numéroté selon l'ordre de FGK """
+    __slots__ = ("nb_occurrences", "element", "parent", "fils_gauche", "fils_droit", "numero")
+
+    def __init__(self, numero: int, element: int = None, parent: Self = None) -> None:
+        self.nb_occurrences: int = 0
+        self.element = element
+        self.parent = parent
+        self.fils_gauche: Self = None
+        self.fils_droit: Self = None
+        self.numero = numero
+
+    @property
+    def est_une_feuille(self) -> bool:
+        """permet de savoir si le noeud est une feuille"""
+        return self.fils_gauche is None
+
+class ArbreHuffmanAdaptatif:
+    """ ArbreHuffmanAdaptatif maintient un arbre de Huffman pour les symboles déjà vus
+
+    les noeuds sont numérotés de sorte que les nombres d'occurrences croissent avec
+les numéros et que deux frères aient des numéros consécutifs (propriété de fratrie)
+    """
+
+    def __init__(self) -> None:
+        numero_racine: int = 2 * (FIN + 1)
+        self._racine = NoeudAdaptatif(numero_racine)
+        self._nyt: NoeudAdaptatif = self._racine
+        self._feuilles: dict[int, NoeudAdaptatif] = {}
+        self._par_numero: list[NoeudAdaptatif] = [None] * (numero_racine + 1)
+        self._par_numero[numero_racine] = self._racine
+
+    @property
+    def racine(self) -> NoeudAdaptatif:
+        """ permet d'obtenir la racine de l'arbre """
+        return self._racine
+
+    @property
+    def nyt(self) -> NoeudAdaptatif:
+        """ permet d'obtenir la feuille des symboles pas encore vus """
+        return self._nyt
+
+    @property
+    def compteur(self) -> Compteur:
+        """ permet d'obtenir le nombre d'occurrences des symboles déjà vus """
+        return Compteur({element: feuille.nb_occurrences \
+                         for element, feuille in self._feuilles.items()})
+
+    def feuille(self, element: int) -> NoeudAdaptatif:
+        """ retourne la feuille de element, ou None s'il n'a pas encore été vu """
+        return self._feuilles.get(element)
+
+    def code(self, noeud: NoeudAdaptatif) -> tuple[int, int]:
+        """ retourne le code (valeur dont le bit i est le i-ème bit du code, longueur)
+du chemin de la racine à noeud """
+        valeur: int = 0
+        longueur: int = 0
+        while noeud.parent is not None:
+            valeur = (valeur << 1) | (noeud is noeud.parent.fils_droit)
+            longueur += 1
+            noeud = noeud.parent
+        return valeur, longueur
+
+    def _echanger(self, noeud1: NoeudAdaptatif, noeud2: NoeudAdaptatif) -> None:
+        """ échange les positions (et numéros) de deux sous-arbres disjoints """
+        parent1, parent2 = noeud1.parent, noeud2.parent
+        if parent1 is parent2:
+            parent1.fils_gauche, parent1.fils_droit = parent1.fils_droit, parent1.fils_gauche
+        else:
+            if parent1.fils_gauche is noeud1:
+                parent1.fils_gauche = noeud2
+            else:
+                parent1.fils_droit = noeud2
+            if parent2.fils_gauche is noeud2:
+                parent2.fils_gauche = noeud1
+            else:
+                parent2.fils_droit = noeud1
+            noeud1.parent, noeud2.parent = parent2, parent1
+        noeud1.numero, noeud2.numero = noeud2.numero, noeud1.numero
+        self._par_numero[noeud1.numero] = noeud1
+        self._par_numero[noeud2.numero] = noeud2
+
+    def incrementer(self, element: int) -> None:
+        """ ajoute une occurrence de element et rétablit la propriété de fratrie """
+        noeud = self._feuilles.get(element)
+        if noeud is None:
+            ancien_nyt = self._nyt
+            self._nyt = NoeudAdaptatif(ancien_nyt.numero - 2, parent=ancien_nyt)
+            noeud = NoeudAdaptatif(ancien_nyt.numero - 1, element, ancien_nyt)
+            ancien_nyt.fils_gauche, ancien_nyt.fils_droit = self._nyt, noeud
+            self._par_numero[self._nyt.numero] = self._nyt
+            self._par_numero[noeud.numero] = noeud
+            self._feuilles[element] = noeud
+        par_numero = self._par_numero
+        while noeud is not None:
+            numero_chef: int = noeud.numero
+            while numero_chef + 1 < len(par_numero) and \
+                par_numero[numero_chef + 1].nb_occurrences == noeud.nb_occurrences:
+                numero_chef += 1
+            chef = par_numero[numero_chef]
+            if chef is not noeud and chef is not noeud.parent:
+                self._echanger(noeud, chef)
+            noeud.nb_occurrences += 1
+            noeud = noeud.parent
+
+class EncodeurAdaptatif:
+    """ EncodeurAdaptatif code des octets au fur et à mesure qu'ils arrivent """
+
+    def __init__(self) -> None:
+        self._arbre = ArbreHuffmanAdaptatif()
+        self._accumulateur: int = 0
+        self._nb_bits: int = 0
+
+    def _ecrire(self, valeur: int, longueur: int) -> None:
+        self._accumulateur |= valeur << self._nb_bits
+        self._nb_bits += longueur
+
+    def _ecrire_symbole(self, symbole: int) -> None:
+        feuille = self._arbre.feuille(symbole)
+        if feuille is None:
+            self._ecrire(*self._arbre.code(self._arbre.nyt))
+            self._ecrire(symbole, NB_BITS_BRUTS)
+        else:
+            self._ecrire(*self._arbre.code(feuille))
+
+    def _octets_complets(self) -> bytes:
+        nb_octets: int = self._nb_bits // 8
+        octets: bytes = (self._accumulateur & ((1 << (8 * nb_octets)) - 1)) \
+            .to_bytes(nb_octets, 'little')
+        self._accumulateur >>= 8 * nb_octets
+        self._nb_bits -= 8 * nb_octets
+        return octets
+
+    def encoder(self, donnees: bytes) -> bytes:
+        """ code donnees et retourne les octets complets produits """
+        sortie = bytearray()
+        for octet in donnees:
+            self._ecrire_symbole(octet)
+            self._arbre.incrementer(octet)
+            if self._nb_bits >= 64:    # l'accumulateur reste un petit entier
+                sortie += self._octets_complets()
+        sortie += self._octets_complets()
+        return bytes(sortie)
+
+    def terminer(self) -> bytes:
+        """ code la fin du flux et retourne les derniers octets """
+        self._ecrire(*self._arbre.code(self._arbre.nyt))
+        self._ecrire(FIN, NB_BITS_BRUTS)
+        self._nb_bits += -self._nb_bits % 8
+        return self._octets_complets()
+
+class DecodeurAdaptatif:
+    """ DecodeurAdaptatif décode des données au fur et à mesure qu'elles arrivent """
+
+    def __init__(self) -> None:
+        self._arbre = ArbreHuffmanAdaptatif()
+        self._noeud: NoeudAdaptatif = self._arbre.racine
+        self._accumulateur: int = 0
+        self._nb_bits: int = 0
+        self._est_termine: bool = False
+
+    @property
+    def est_termine(self) -> bool:
+        """ permet de savoir si la fin du flux a été décodée """
+        return self._est_termine
+
+    def decoder(self, donnees: bytes) -> bytes:
+        """ décode donnees et retourne les octets obtenus ; les bits d'un code incomplet
+sont conservés jusqu'au prochain appel """
+        sortie = bytearray()
+        arbre = self._arbre
+        noeud = self._noeud
+        accumulateur, nb_bits = self._accumulateur, self._nb_bits
+        position: int = 0
+        while not self._est_termine:
+            if nb_bits < 64 and position < len(donnees):    # l'accumulateur reste un petit entier
+                morceau: bytes = donnees[position:position + 8]
+                accumulateur |= int.from_bytes(morceau, 'little') << nb_bits
+                nb_bits += 8 * len(morceau)
+                position += len(morceau)
+            while not noeud.est_une_feuille and nb_bits > 0:
+                noeud = noeud.fils_droit if accumulateur & 1 else noeud.fils_gauche
+                accumulateur >>= 1
+                nb_bits -= 1
+            if not noeud.est_une_feuille:
+                if position < len(donnees):
+                    continue
+                break
+            if noeud is arbre.nyt:
+                if nb_bits < NB_BITS_BRUTS:
+                    if position < len(donnees):
+                        continue
+                    break
+                symbole: int = accumulateur & ((1 << NB_BITS_BRUTS) - 1)
+                accumulateur >>= NB_BITS_BRUTS
+                nb_bits -= NB_BITS_BRUTS
+                if symbole == FIN:
+                    self._est_termine = True
+                    break
+            else:
+                symbole = noeud.element
+            sortie.append(symbole)
+            arbre.incrementer(symbole)
+            noeud = arbre.racine
+        self._noeud = noeud
+        self._accumulateur, self._nb_bits = accumulateur, nb_bits
+        return bytes(sortie)
+
+def compresser_adaptatif(destination: io.RawIOBase, source: io.RawIOBase,
+                         taille_lecture: int = TAILLE_LECTURE) -> None:
+    """ fonction qui compresse source dans destination en une seule passe, chaque
+morceau lu étant codé et écrit immédiatement """
+    LOGGER.info("Compression adaptative")
+    encodeur = EncodeurAdaptatif()
+    destination.write(b"\x34\x32\x05")
+    while donnees := source.read(taille_lecture):
+        destination.write(encodeur.encoder(donnees))
+    destination.write(encodeur.terminer())
+    LOGGER.debug("Fin de l'écriture")
+
+def decompresser_adaptatif(destination: io.RawIOBase, source: io.RawIOBase,
+                           taille_lecture: int = TAILLE_LECTURE) -> None:
+    """ fonction qui décompresse dans destination les codes adaptatifs de source
+(placée après le type de fichier) """
+    LOGGER.info("Décompression adaptative")
+    decodeur = DecodeurAdaptatif()
+    while not decodeur.est_termine and (donnees := source.read(taille_lecture)):
+        destination.write(decodeur.decoder(donnees))
+    LOGGER.debug("Fin de l'écriture")
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+""" Module proposant la classe ArbreCompact """
+from array import array
+from typing import Dict, Self
+from huffman.arbre_huffman import ArbreHuffman
+from huffman.code_binaire import CodeBinaireCompact
+
+FEUILLE = 0xFFFFFFFF
+
+class ArbreCompact:
+    """ ArbreCompact représente un arbre de Huffman (d'éléments entiers positifs) par
+des tableaux typés indexés par numéro de noeud
+
+    les noeuds sont numérotés en ordre préfixe, la racine ayant le numéro 0 ; le fils
+gauche et le fils droit d'une feuille valent FEUILLE
+
+    arguments:
+    fils_gauches, fils_droits -- numéros des fils de chaque noeud (array('I'))
+    elements -- élément de chaque feuille, 0 pour un noeud (array('I'))
+    nb_occurrences -- nombre d'occurrences de chaque noeud (array('Q'))
+    """
+    __slots__ = ("_fils_gauches", "_fils_droits", "_elements", "_nb_occurrences")
+
+    def __init__(self, fils_gauches: array, fils_droits: array,
+                 elements: array, nb_occurrences: array) -> None:
+        if not len(fils_gauches) == len(fils_droits) == len(elements) == len(nb_occurrences):
+            raise ValueError("les tableaux de l'arbre compact n'ont pas la même taille")
+        self._fils_gauches = fils_gauches
+        self._fils_droits = fils_droits
+        self._elements = elements
+        self._nb_occurrences = nb_occurrences
+
+    @classmethod
+    def depuis_arbre(cls, arbre: ArbreHuffman) -> Self:
+        """ retourne la forme compacte de arbre """
+        fils_gauches, fils_droits = array('I'), array('I')
+        elements, nb_occurrences = array('I'), array('Q')
+        a_visiter: list[tuple[ArbreHuffman, int]] = [(arbre, -1)]    # (noeud, numéro du parent)
+        while a_visiter:
+            noeud, parent = a_visiter.pop()
+            numero: int = len(elements)
+            if parent >= 0:
+                if fils_gauches[parent] == FEUILLE:
+                    fils_gauches[parent] = numero
+                else:
+                    fils_droits[parent] = numero
+            nb_occurrences.append(noeud.nb_occurrences)
+            fils_gauches.append(FEUILLE)
+            fils_droits.append(FEUILLE)
+            if noeud.est_une_feuille:
+                elements.append(noeud.element)
+            else:
+                elements.append(0)
+                a_visiter.append((noeud.fils_droit, numero))
+                a_visiter.append((noeud.fils_gauche, numero))
+        return cls(fils_gauches, fils_droits, elements, nb_occurrences)
+
+    def en_arbre(self) -> ArbreHuffman:
+        """ retourne l'ArbreHuffman correspondant """
+        arbres: list[ArbreHuffman] = [None] * len(self)
+        for numero in range(len(self) - 1, -1, -1):    # les fils ont des numéros plus grands
+            if self._fils_gauches[numero] == FEUILLE:
+                arbres[numero] = ArbreHuffman(element=self._elements[numero], \
+                                              nb_occurrences=self._nb_occurrences[numero])
+            else:
+                arbres[numero] = arbres[self._fils_gauches[numero]] + \
+                    arbres[self._fils_droits[numero]]
+        return arbres[0]
+
+    @property
+    def fils_gauches(self) -> array:
+        """ permet d'obtenir le numéro du fils gauche de chaque noeud """
+        return self._fils_gauches
+
+    @property
+    def fils_droits(self) -> array:
+        """ permet d'obtenir le numéro du fils droit de chaque noeud """
+        return self._fils_droits
+
+    @property
+    def elements(self) -> array:
+        """ permet d'obtenir l'élément de chaque feuille """
+        return self._elements
+
+    @property
+    def nb_occurrences(self) -> array:
+        """ permet d'obtenir le nombre d'occurrences de chaque noeud """
+        return self._nb_occurrences
+
+    def est_une_feuille(self, numero: int) -> bool:
+        """ permet de savoir si le noeud numero est une feuille """
+        return self._fils_gauches[numero] == FEUILLE
+
+    @property
+    def hauteur(self) -> int:
+        """ permet d'obtenir la hauteur de l'arbre """
+        return max(self.profondeurs(), default=0)
+
+    def profondeurs(self) -> array:
+        """ retourne la profondeur de chaque noeud """
+        profondeurs = array('I', bytes(4 * len(self)))
+        for numero in range(len(self)):    # un parent précède toujours ses fils
+            if self._fils_gauches[numero] != FEUILLE:
+                profondeurs[self._fils_gauches[numero]] = profondeurs[numero] + 1
+                profondeurs[self._fils_droits[numero]] = profondeurs[numero] + 1
+        return profondeurs
+
+    def longueurs(self) -> Dict[int, int]:
+        """ retourne la longueur du code de chaque élément (1 pour un arbre réduit à une feuille) """
+        if len(self) == 1:
+            return {self._elements[0]: 1}
+        profondeurs = self.profondeurs()
+        return {self._elements[numero]: profondeurs[numero] for numero in range(len(self)) \
+                if self._fils_gauches[numero] == FEUILLE}
+
+    def codes(self) -> Dict[int, CodeBinaireCompact]:
+        """ retourne le code binaire de chaque élément (arbre non réduit à une feuille) """
+        valeurs: list[int] = [0] * len(self)    # bit i : i-ème bit du chemin (plus de 64 bits possibles)
+        profondeurs = self.profondeurs()
+        table: Dict[int, CodeBinaireCompact] = {}
+        for numero in range(len(self)):
+            gauche: int = self._fils_gauches[numero]
+            if gauche == FEUILLE:
+                table[self._elements[numero]] = \
+                    CodeBinaireCompact.depuis_valeur(valeurs[numero], profondeurs[numero])
+            else:
+                valeurs[gauche] = valeurs[numero]
+                valeurs[self._fils_droits[numero]] = valeurs[numero] | 1 << profondeurs[numero]
+        return table
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def __eq__(self, autre) -> bool:
+        if not isinstance(autre, self.__class__):
+            return False
+        return self._fils_gauches == autre.fils_gauches and self._fils_droits == autre.fils_droits \
+            and self._elements == autre.elements and self._nb_occurrences == autre.nb_occurrences
+
+    def __repr__(self) -> str:
+        return f"ArbreCompact({self._fils_gauches!r}, {self._fils_droits!r}, " \
+            f"{self._elements!r}, {self._nb_occurrences!r})"
@@ -88,6 +88,16 @@ class ArbreHuffman[T]:
                 and self._fils_gauche.equivalent(autre.fils_gauche)
         return False
 
+    def en_arbre_compact(self):
+        """retourne la forme compacte (tableaux typés) de l'arbre"""
+        from huffman.arbre_compact import ArbreCompact    # huffman.arbre_compact dépend de ce module
+        return ArbreCompact.depuis_arbre(self)
+
+    @staticmethod
+    def depuis_arbre_compact(arbre_compact) -> 'ArbreHuffman':
+        """retourne l'arbre correspondant à une forme compacte"""
+        return arbre_compact.en_arbre()
+
     def __eq__(self, autre) -> bool:
         """permet de tester si l'arbre est égal à un autre"""
         return self.equivalent(autre)
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+""" Module proposant les archives (type 7) : plusieurs fichiers compressés
+indépendamment, suivis d'un répertoire central
+
+    34 32 07
+    pour chaque membre : le membre compressé (fichier complet 34 32 type ...)
+    répertoire : pour chaque membre, position dans l'archive, taille compressée et
+longueur décodée (entiers de NB_OCTETS_REPERTOIRE octets), longueur du nom
+(NB_OCTETS_NOM octets) puis nom (UTF-8, séparateur /)
+    position du répertoire (NB_OCTETS_REPERTOIRE octets) puis SIGNATURE_REPERTOIRE
+
+Lister une archive ne lit que sa fin et son répertoire ; extraire un membre ne lit
+que ce membre.
+"""
+from typing import Iterable, Iterator, NamedTuple
+import errno
+import io
+import logging
+import os
+from huffman.compresseur import statistiques, compresser_statistiques, decompresser
+from huffman.projection import projeter_en_lecture
+
+LOGGER = logging.getLogger()
+
+NB_OCTETS_REPERTOIRE = 8
+NB_OCTETS_NOM = 2
+SIGNATURE_REPERTOIRE = b"\x34\x32AR"
+
+class ArchiveErreur(Exception):
+    """Erreurs relatives aux archives"""
+
+
+class RepertoireErreur(ArchiveErreur):
+    """Erreur lorsqu'une archive n'a pas de répertoire valide"""
+
+
+class MembreErreur(ArchiveErreur):
+    """Erreur lorsqu'un membre est absent d'une archive ou a un nom invalide"""
+
+
+class Membre(NamedTuple):
+    """ Membre décrit un fichier d'une archive : son nom, sa position dans l'archive,
+sa taille compressée et sa longueur décodée """
+    nom: str
+    position: int
+    taille: int
+    longueur: int
+
+
+def verifier_nom(nom: str) -> None:
+    """ fonction qui lève MembreErreur si nom n'est pas un chemin relatif restant
+dans le dossier d'extraction """
+    parties: list[str] = nom.split("/")
+    if not nom or nom.startswith("/") or any(partie in ("", ".", "..") for partie in parties) \
+        or "\\" in nom or len(nom.encode()) >= 1 << (8 * NB_OCTETS_NOM):
+        raise MembreErreur(f"nom de membre invalide : {nom!r}")
+
+def fichiers_a_archiver(chemins: Iterable[str],
+                        exclu: os.stat_result = None) -> Iterator[tuple[str, str]]:
+    """ retourne les couples (nom dans l'archive, nom du fichier) des fichiers désignés
+par chemins, les dossiers étant parcourus récursivement (par ordre alphabétique) ; un
+nom est relatif au dossier parent du chemin donné ; le fichier exclu (l'archive en
+cours d'écriture) est ignoré """
+    for chemin in chemins:
+        chemin = os.path.normpath(chemin)
+        parent: str = os.path.dirname(os.path.abspath(chemin))
+        if os.path.isdir(chemin):
+            for dossier, sous_dossiers, fichiers in os.walk(chemin):
+                sous_dossiers.sort()
+                for fichier in sorted(fichiers):
+                    nom_fichier: str = os.path.join(dossier, fichier)
+                    if exclu is None or not os.path.samestat(os.stat(nom_fichier), exclu):
+                        yield os.path.relpath(os.path.abspath(nom_fichier), parent) \
+                            .replace(os.sep, "/"), nom_fichier
+        elif exclu is None or not os.path.samestat(os.stat(chemin), exclu):
+            yield os.path.basename(chemin), chemin
+
+def ecrire_archive(destination: io.RawIOBase, fichiers: Iterable[tuple[str, str]]) -> list[Membre]:
+    """ fonction qui écrit dans destination (positionnable, vide) l'archive des fichiers
+(nom dans l'archive, nom du fichier), chacun compressé à la suite du précédent avec
+des codes canoniques, et retourne ses membres """
+    LOGGER.info("Création d'une archive")
+    destination.write(b"\x34\x32\x07")
+    position: int = destination.tell()
+    membres: list[Membre] = []
+    noms: set[str] = set()
+    for nom, nom_fichier in fichiers:
+        verifier_nom(nom)
+        if nom in noms:
+            raise MembreErreur(f"membre en double : {nom!r}")
+        noms.add(nom)
+        LOGGER.debug("Ajout de %s", nom)
+        with open(nom_fichier, 'rb') as source:
+            stats, longueur = statistiques(source)
+            destination.write(b"\x34\x32")
+            compresser_statistiques(destination, source, stats, longueur, canonique=True)
+        fin: int = destination.tell()
+        membres.append(Membre(nom, position, fin - position, longueur))
+        position = fin
+    LOGGER.debug("Écriture du répertoire des %s membres", len(membres))
+    destination.write(b"".join(membre_en_octets(membre) for membre in membres))
+    destination.write(position.to_bytes(NB_OCTETS_REPERTOIRE, 'big'))
+    destination.write(SIGNATURE_REPERTOIRE)
+    return membres
+
+def membre_en_octets(membre: Membre) -> bytes:
+    """ fonction qui retourne l'entrée du répertoire décrivant membre """
+    nom: bytes = membre.nom.encode()
+    return b"".join(valeur.to_bytes(NB_OCTETS_REPERTOIRE, 'big') \
+                    for valeur in (membre.position, membre.taille, membre.longueur)) + \
+        len(nom).to_bytes(NB_OCTETS_NOM, 'big') + nom
+
+def lire_repertoire(source: io.RawIOBase) -> list[Membre]:
+    """ fonction qui retourne les membres d'une archive en ne lisant que son entête,
+sa fin et son répertoire """
+    source.seek(0)
+    if bytes(source.read(3)) != b"\x34\x32\x07":
+        raise RepertoireErreur("le fichier n'est pas une archive")
+    fin: int = source.seek(0, io.SEEK_END)
+    taille_fin: int = NB_OCTETS_REPERTOIRE + len(SIGNATURE_REPERTOIRE)
+    if fin < 3 + taille_fin:
+        raise RepertoireErreur("l'archive n'a pas de répertoire")
+    source.seek(fin - taille_fin)
+    queue: bytes = bytes(source.read(taille_fin))
+    if queue[NB_OCTETS_REPERTOIRE:] != SIGNATURE_REPERTOIRE:
+        raise RepertoireErreur("l'archive n'a pas de répertoire")
+    debut: int = int.from_bytes(queue[:NB_OCTETS_REPERTOIRE], 'big')
+    if not 3 <= debut <= fin - taille_fin:
+        raise RepertoireErreur("répertoire d'archive incohérent")
+    source.seek(debut)
+    repertoire: bytes = bytes(source.read(fin - taille_fin - debut))
+    membres: list[Membre] = []
+    i: int = 0
+    taille_entree: int = 3 * NB_OCTETS_REPERTOIRE + NB_OCTETS_NOM
+    while i < len(repertoire):
+        if i + taille_entree > len(repertoire):
+            raise RepertoireErreur("répertoire d'archive incohérent")
+        position, taille, longueur = (int.from_bytes(repertoire[j:j + NB_OCTETS_REPERTOIRE], 'big') \
+            for j in range(i, i + 3 * NB_OCTETS_REPERTOIRE, NB_OCTETS_REPERTOIRE))
+        i += 3 * NB_OCTETS_REPERTOIRE
+        longueur_nom: int = int.from_bytes(repertoire[i:i + NB_OCTETS_NOM], 'big')
+        i += NB_OCTETS_NOM
+        nom: bytes = repertoire[i:i + longueur_nom]
+        i += longueur_nom
+        if len(nom) != longueur_nom or position < 3 or position + taille > debut:
+            raise RepertoireErreur("répertoire d'archive incohérent")
+        membres.append(Membre(nom.decode(), position, taille, longueur))
+    return membres
+
+class FluxDuMembre(io.RawIOBase):
+    """ FluxDuMembre est une fenêtre positionnable, en lecture, sur les octets d'un
+membre d'une archive : les lectures sont transmises à la source sans dépasser le
+membre (elles sont sans copie si la source est un FluxProjete)
+
+    arguments:
+    source -- archive (flux positionnable)
+    membre -- membre lu
+    """
+
+    def __init__(self, source: io.RawIOBase, membre: Membre) -> None:
+        super().__init__()
+        self._source = source
+        self._debut: int = membre.position
+        self._taille: int = membre.taille
+        self._position: int = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, position: int, origine: int = io.SEEK_SET) -> int:
+        if origine == io.SEEK_CUR:
+            position += self._position
+        elif origine == io.SEEK_END:
+            position += self._taille
+        if position < 0:
+            raise ValueError("position négative")
+        self._position = position
+        return position
+
+    def read(self, taille: int = -1):
+        """ retourne au plus taille octets du membre à partir de la position courante """
+        restant: int = max(0, self._taille - self._position)
+        taille = restant if taille is None or taille < 0 else min(taille, restant)
+        if taille == 0:
+            return b""
+        self._source.seek(self._debut + self._position)
+        donnees = self._source.read(taille)
+        self._position += len(donnees)
+        return donnees
+
+    def readinto(self, tampon) -> int:
+        donnees = self.read(len(tampon))
+        tampon[:len(donnees)] = donnees
+        return len(donnees)
+
+
+def extraire_membre(source: io.RawIOBase, membre: Membre, destination: io.RawIOBase) -> None:
+    """ fonction qui décompresse dans destination le membre de l'archive source, lu par
+morceaux au travers d'un FluxDuMembre, sans lire les autres membres """
+    LOGGER.debug("Extraction de %s", membre.nom)
+    with FluxDuMembre(source, membre) as flux_membre:
+        decompresser(destination, flux_membre)
+    if destination.seekable():    # retire la fin de ligne ajoutée au décodage d'un type 1
+        destination.truncate(membre.longueur)
+
+def creer_archive(nom_archive: str, chemins: Iterable[str]) -> list[Membre]:
+    """ fonction qui crée l'archive nom_archive des fichiers et dossiers chemins (sans
+l'y inclure elle-même) ; l'archive incomplète est supprimée en cas d'erreur """
+    with open(nom_archive, 'wb') as destination:
+        try:
+            return ecrire_archive(destination, \
+                                  fichiers_a_archiver(chemins, os.fstat(destination.fileno())))
+        except BaseException:
+            destination.close()
+            os.remove(nom_archive)
+            raise
+
+def lister_archive(nom_archive: str) -> list[Membre]:
+    """ fonction qui retourne les membres de l'archive nom_archive """
+    with open(nom_archive, 'rb') as source:
+        return lire_repertoire(source)
+
+def extraire_archive(nom_archive: str, noms: Iterable[str]=None, dossier: str=".") -> list[Membre]:
+    """ fonction qui extrait dans dossier les membres noms (tous par défaut) de l'archive
+nom_archive, projetée en mémoire (lue sans copie), sans remplacer de fichier existant,
+et retourne les membres extraits """
+    if os.path.getsize(nom_archive) == 0:    # un fichier vide ne peut être projeté
+        raise RepertoireErreur("le fichier n'est pas une archive")
+    with projeter_en_lecture(nom_archive) as source:
+        membres: list[Membre] = lire_repertoire(source)
+        if noms is not None:
+            par_nom = {membre.nom: membre for membre in membres}
+            absents = [nom for nom in noms if nom not in par_nom]
+            if absents:
+                raise MembreErreur(f"membres absents de l'archive : {', '.join(absents)}")
+            membres = [par_nom[nom] for nom in dict.fromkeys(noms)]
+        for membre in membres:
+            verifier_nom(membre.nom)
+        noms_fichiers: list[str] = [os.path.join(dossier, *membre.nom.split("/")) for membre in membres]
+        for nom_fichier in noms_fichiers:    # vérifié avant d'extraire le premier membre
+            if os.path.lexists(nom_fichier):
+                raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), nom_fichier)
+        for membre, nom_fichier in zip(membres, noms_fichiers):
+            os.makedirs(os.path.dirname(nom_fichier) or ".", exist_ok=True)
+            with open(nom_fichier, 'xb') as destination:
+                extraire_membre(source, membre, destination)
+    return membres
+
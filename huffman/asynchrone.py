@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+""" Module proposant la compression et la décompression asynchrones (asyncio) sur des
+flux asyncio.StreamReader / asyncio.StreamWriter
+
+La compression produit un fichier par blocs (type 4), identique à celui de
+compresser_blocs : les données sont lues par blocs, chaque bloc est codé dans un
+exécuteur partagé pendant que la boucle d'événements continue de servir les autres
+flux, et au plus nb_blocs_en_cours blocs par flux sont en mémoire. L'écriture attend
+que writer se vide (drain) après chaque bloc : un lecteur lent ralentit la lecture
+de la source plutôt que de laisser les données s'accumuler.
+
+L'exécuteur partagé par défaut est un ProcessPoolExecutor d'au plus
+NB_PROCESSUS_MAX processus : le codage d'un bloc, en Python, garde le GIL et ne
+progresserait pas en parallèle dans des threads. Les fichiers adaptatifs (type 5)
+et ceux d'autres types, dont le décodage dépend de ce qui précède, sont décodés au fil
+de l'eau dans les threads de l'exécuteur par défaut de la boucle : ces décodages
+partagent le GIL entre eux et avec la boucle.
+"""
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Iterable
+import asyncio
+import io
+import logging
+import multiprocessing
+import os
+import threading
+from huffman.adaptatif import DecodeurAdaptatif
+from huffman.blocs import compresser_bloc, decompresser_bloc, verifier_taille_bloc, \
+    ConteneurDeBlocs, TAILLE_BLOC, NB_OCTETS_INDEX, SIGNATURE_INDEX, IndexDeBlocsErreur
+from huffman.compresseur import decompresser, MOTEUR_FILE_DE_PRIORITE
+from huffman.decodeur import TAILLE_LECTURE
+
+LOGGER = logging.getLogger()
+
+NB_PROCESSUS_MAX = os.cpu_count() or 1
+NB_BLOCS_EN_COURS = 2
+
+_executeur_partage: ProcessPoolExecutor = None
+_verrou = threading.Lock()
+
+def executeur_partage() -> ProcessPoolExecutor:
+    """ retourne l'exécuteur (créé au premier appel) partagé par tous les flux, qui
+limite à NB_PROCESSUS_MAX le nombre de blocs codés simultanément ; ses processus sont
+démarrés par spawn : issus de fork, ils garderaient ouvertes les sockets de la boucle,
+dont la fermeture n'atteindrait plus le pair """
+    global _executeur_partage
+    with _verrou:
+        if _executeur_partage is None:
+            _executeur_partage = ProcessPoolExecutor(NB_PROCESSUS_MAX, \
+                                                     multiprocessing.get_context("spawn"))
+        return _executeur_partage
+
+def arreter_executeur_partage() -> None:
+    """ arrête l'exécuteur partagé après ses tâches en cours (un nouvel exécuteur
+sera créé au prochain appel de executeur_partage) """
+    global _executeur_partage
+    with _verrou:
+        executeur, _executeur_partage = _executeur_partage, None
+    if executeur is not None:
+        executeur.shutdown()
+
+async def lire_bloc(reader: asyncio.StreamReader, taille: int) -> bytes:
+    """ retourne les taille octets suivants de reader, moins à la fin du flux """
+    try:
+        return await reader.readexactly(taille)
+    except asyncio.IncompleteReadError as erreur:
+        return erreur.partial
+
+async def compresser_async(reader: asyncio.StreamReader,
+                           writer: asyncio.StreamWriter,
+                           taille_bloc: int=TAILLE_BLOC,
+                           longueur_max_code: int=None,
+                           nb_octets_pour_serialisation_des_int: int=4,
+                           ordre_pour_serialisation_des_int='big',
+                           moteur: str=MOTEUR_FILE_DE_PRIORITE,
+                           executeur: Executor=None,
+                           nb_blocs_en_cours: int=NB_BLOCS_EN_COURS) -> None:
+    """ fonction qui compresse les données de reader (jusqu'à la fin du flux) dans
+writer par blocs indépendants de taille_bloc octets (fichier de type 4)
+
+    executeur -- exécuteur codant les blocs (défaut : executeur_partage(), dont les
+processus sont partagés par tous les flux)
+    nb_blocs_en_cours -- nombre maximal de blocs lus mais pas encore écrits
+
+    writer n'est pas fermé ; voir compresser_blocs pour les autres arguments """
+    verifier_taille_bloc(taille_bloc)
+    boucle = asyncio.get_running_loop()
+    executeur = executeur_partage() if executeur is None else executeur
+    conteneur = ConteneurDeBlocs(0, nb_octets_pour_serialisation_des_int, \
+                                 ordre_pour_serialisation_des_int)
+
+    async def ecrire_bloc(longueur: int, resultat: asyncio.Future) -> None:
+        bloc_compresse: bytes = await resultat
+        writer.write(conteneur.bloc(longueur, bloc_compresse))
+        writer.write(bloc_compresse)
+        await writer.drain()
+
+    LOGGER.info("Compression asynchrone par blocs de %s octets", taille_bloc)
+    writer.write(conteneur.entete())
+    en_cours: deque = deque()
+    try:
+        while donnees := await lire_bloc(reader, taille_bloc):
+            en_cours.append((len(donnees), boucle.run_in_executor( \
+                executeur, compresser_bloc, donnees, longueur_max_code, moteur)))
+            if len(en_cours) >= nb_blocs_en_cours:
+                await ecrire_bloc(*en_cours.popleft())
+        while en_cours:
+            await ecrire_bloc(*en_cours.popleft())
+    finally:
+        for _, resultat in en_cours:    # interruption : les blocs en attente sont abandonnés
+            resultat.cancel()
+    writer.write(conteneur.fin())
+    await writer.drain()
+    LOGGER.debug("Fin de l'écriture")
+
+class FluxSynchrone(io.RawIOBase):
+    """ FluxSynchrone présente reader et writer comme un flux synchrone, utilisable
+depuis un autre thread que celui de la boucle : chaque lecture ou écriture est confiée
+à la boucle puis attendue, une écriture attendant que writer se vide ; une fois le
+flux fermé (par la boucle), l'opération en cours est annulée
+
+    arguments:
+    boucle -- boucle d'événements de reader et writer
+    reader -- flux lu
+    writer -- flux écrit
+    debut -- octets déjà lus dans reader, rendus avant les suivants
+    """
+
+    def __init__(self, boucle: asyncio.AbstractEventLoop, reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter, debut: bytes=b"") -> None:
+        super().__init__()
+        self._boucle = boucle
+        self._reader = reader
+        self._writer = writer
+        self._debut: bytes = debut
+        self._tache: asyncio.Task = None
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return True
+
+    async def _sur_la_boucle(self, coroutine):
+        if self.closed:
+            coroutine.close()
+            raise ValueError("I/O operation on closed file.")
+        self._tache = asyncio.current_task()
+        try:
+            return await coroutine
+        finally:
+            self._tache = None
+
+    def _attendre(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(self._sur_la_boucle(coroutine), self._boucle).result()
+
+    def readinto(self, tampon) -> int:
+        if self._debut:
+            donnees, self._debut = self._debut[:len(tampon)], self._debut[len(tampon):]
+        else:
+            donnees = self._attendre(self._reader.read(len(tampon)))
+        tampon[:len(donnees)] = donnees
+        return len(donnees)
+
+    async def _ecrire(self, donnees: bytes) -> None:
+        self._writer.write(donnees)
+        await self._writer.drain()
+
+    def write(self, donnees) -> int:
+        donnees = bytes(donnees)
+        self._attendre(self._ecrire(donnees))
+        return len(donnees)
+
+    def close(self) -> None:
+        """ ferme le flux et annule l'opération en cours (à appeler depuis la boucle) """
+        if self._tache is not None:
+            self._tache.cancel()
+        super().close()
+
+
+def _decompresser_flux(flux: FluxSynchrone, nb_octets_pour_serialisation_des_int: int,
+                       ordre_pour_serialisation_des_int: str, modeles: tuple) -> None:
+    """ décode par decompresser le fichier compressé lu dans flux, par morceaux de
+TAILLE_LECTURE octets, et écrit son décodage dans flux """
+    source = io.BufferedReader(flux, TAILLE_LECTURE)
+    try:
+        decompresser(flux, source, nb_octets_pour_serialisation_des_int, \
+                     ordre_pour_serialisation_des_int, modeles=modeles, cache=None)
+    finally:
+        source.detach()
+
+async def decompresser_async(reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter,
+                             nb_octets_pour_serialisation_des_int: int=4,
+                             ordre_pour_serialisation_des_int='big',
+                             executeur: Executor=None,
+                             nb_blocs_en_cours: int=NB_BLOCS_EN_COURS,
+                             modeles: Iterable=()) -> None:
+    """ fonction qui décompresse dans writer le fichier compressé lu dans reader
+
+    un fichier par blocs (type 4) est décodé au fil de l'eau, bloc par bloc dans
+l'exécuteur, sans lire au-delà de son index ; un fichier adaptatif (type 5) est décodé
+morceau par morceau, chacun dès sa réception, jusqu'à sa fin ; les autres types sont
+décodés par decompresser dans un thread, au travers d'un FluxSynchrone, la source
+étant lue par morceaux de TAILLE_LECTURE octets (le dernier morceau attend la fin du
+flux). Chaque écriture attend que writer se vide (voir compresser_async et
+decompresser pour les arguments) """
+    boucle = asyncio.get_running_loop()
+    LOGGER.info("Décompression asynchrone")
+    entete: bytes = await lire_bloc(reader, 3)
+    if entete == b"\x34\x32\x05":
+        LOGGER.info("Décompression adaptative")
+        decodeur = DecodeurAdaptatif()
+        while not decodeur.est_termine and (donnees := await reader.read(TAILLE_LECTURE)):
+            writer.write(await boucle.run_in_executor(None, decodeur.decoder, donnees))
+            await writer.drain()
+        LOGGER.debug("Fin de l'écriture")
+        return
+    if entete != b"\x34\x32\x04":
+        flux = FluxSynchrone(boucle, reader, writer, entete)
+        try:
+            await boucle.run_in_executor(None, _decompresser_flux, flux, \
+                                         nb_octets_pour_serialisation_des_int, \
+                                         ordre_pour_serialisation_des_int, tuple(modeles))
+        finally:    # une interruption annule la lecture ou l'écriture attendue par le thread
+            flux.close()
+        return
+
+    executeur = executeur_partage() if executeur is None else executeur
+
+    async def lire_entier() -> int:
+        return int.from_bytes(await reader.readexactly(nb_octets_pour_serialisation_des_int), \
+                              byteorder=ordre_pour_serialisation_des_int)
+
+    async def ecrire_bloc(resultat: asyncio.Future) -> None:
+        writer.write(await resultat)
+        await writer.drain()
+
+    nb_blocs: int = 0
+    en_cours: deque = deque()
+    try:
+        while (longueur := await lire_entier()) > 0:
+            bloc_compresse: bytes = await reader.readexactly(await lire_entier())
+            LOGGER.debug("Bloc de %s octets compressé en %s octets", longueur, len(bloc_compresse))
+            nb_blocs += 1
+            en_cours.append(boucle.run_in_executor(executeur, decompresser_bloc, \
+                                                   bloc_compresse, longueur))
+            if len(en_cours) >= nb_blocs_en_cours:
+                await ecrire_bloc(en_cours.popleft())
+        while en_cours:
+            await ecrire_bloc(en_cours.popleft())
+    finally:
+        for resultat in en_cours:
+            resultat.cancel()
+    taille_index: int = (3 * nb_blocs + 1) * NB_OCTETS_INDEX + len(SIGNATURE_INDEX)
+    if not (await lire_bloc(reader, taille_index)).endswith(SIGNATURE_INDEX):
+        raise IndexDeBlocsErreur("le fichier compressé par blocs n'a pas d'index")
+    LOGGER.debug("Fin de l'écriture")
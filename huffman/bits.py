@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+""" Module proposant la lecture et l'écriture de flux de bits (bits de poids faible en premier) """
+import io
+
+TAILLE_TAMPON = 1 << 16
+NB_BITS_MOT = 64
+MASQUE_MOT = (1 << NB_BITS_MOT) - 1
+
+class EcrivainDeBits:
+    """ EcrivainDeBits écrit des codes de longueur quelconque dans un flux binaire
+
+    les bits sont accumulés dans un entier puis transférés par mots de NB_BITS_MOT
+bits dans un tampon, écrit dans destination dès qu'il atteint taille_tampon octets
+
+    arguments:
+    destination -- flux binaire dans lequel écrire
+    taille_tampon -- nombre d'octets accumulés avant chaque écriture
+    """
+
+    def __init__(self, destination: io.RawIOBase, taille_tampon: int = TAILLE_TAMPON) -> None:
+        self._destination = destination
+        self._taille_tampon = taille_tampon
+        self._tampon = bytearray()
+        self._accumulateur: int = 0
+        self._nb_bits: int = 0
+
+    @property
+    def nb_bits_en_attente(self) -> int:
+        """ permet d'obtenir le nombre de bits pas encore écrits dans destination """
+        return 8 * len(self._tampon) + self._nb_bits
+
+    def ecrire(self, code: int, longueur: int) -> None:
+        """ ajoute les longueur bits de code (le bit i de code étant le i-ème écrit) """
+        self._accumulateur |= code << self._nb_bits
+        self._nb_bits += longueur
+        if self._nb_bits >= NB_BITS_MOT:
+            self._transferer_mots()
+
+    def _transferer_mots(self) -> None:
+        """ transfère les mots complets de l'accumulateur dans le tampon """
+        while self._nb_bits >= NB_BITS_MOT:
+            self._tampon += (self._accumulateur & MASQUE_MOT).to_bytes(8, 'little')
+            self._accumulateur >>= NB_BITS_MOT
+            self._nb_bits -= NB_BITS_MOT
+        if len(self._tampon) >= self._taille_tampon:
+            self._destination.write(self._tampon)
+            self._tampon = bytearray()
+
+    def terminer(self, garder_octet_final_nul: bool = True) -> None:
+        """ écrit les bits restants, le dernier octet étant complété par des 0
+
+        garder_octet_final_nul -- si faux, le dernier octet incomplet n'est pas écrit
+s'il est nul (comportement historique du compresseur, sans effet sur le décodage) """
+        nb_octets: int = (self._nb_bits + 7) // 8
+        octets: bytes = self._accumulateur.to_bytes(nb_octets, 'little')
+        if not garder_octet_final_nul and self._nb_bits % 8 != 0 and octets[-1] == 0:
+            octets = octets[:-1]
+        self._tampon += octets
+        self._accumulateur = 0
+        self._nb_bits = 0
+        if self._tampon:
+            self._destination.write(self._tampon)
+            self._tampon = bytearray()
+
+class LecteurDeBits:
+    """ LecteurDeBits lit un flux binaire bit à bit au travers d'une fenêtre de bits
+
+    la source est lue par blocs de taille_tampon octets (readinto dans un tampon
+réutilisé) ; les bits au-delà de la fin de la source valent 0. Le lecteur lit en
+avance : une fois créé, la source ne doit plus être lue directement.
+
+    arguments:
+    source -- flux binaire à lire à partir de sa position courante
+    taille_tampon -- nombre d'octets lus à chaque accès à la source
+    """
+
+    def __init__(self, source: io.RawIOBase, taille_tampon: int = TAILLE_TAMPON) -> None:
+        self._source = source
+        self._vue = memoryview(bytearray(taille_tampon))
+        self._position: int = 0
+        self._fin: int = 0
+        self._accumulateur: int = 0
+        self._nb_bits: int = 0
+
+    def _recharger(self) -> bool:
+        """ relit le tampon depuis la source, retourne faux à la fin de la source """
+        self._fin = self._source.readinto(self._vue) or 0
+        self._position = 0
+        return self._fin > 0
+
+    def _remplir(self, besoin: int) -> None:
+        """ complète la fenêtre jusqu'à besoin bits """
+        while self._nb_bits < besoin:
+            if self._position >= self._fin and not self._recharger():
+                self._nb_bits = besoin
+                return
+            morceau = self._vue[self._position:self._position + 8]
+            self._position += len(morceau)
+            self._accumulateur |= int.from_bytes(morceau, 'little') << self._nb_bits
+            self._nb_bits += 8 * len(morceau)
+
+    def regarder(self, nb_bits: int) -> int:
+        """ retourne les nb_bits prochains bits (le i-ème lu étant le bit i) sans les consommer """
+        if self._nb_bits < nb_bits:
+            self._remplir(nb_bits)
+        return self._accumulateur & ((1 << nb_bits) - 1)
+
+    def consommer(self, nb_bits: int) -> None:
+        """ avance de nb_bits bits, déjà regardés """
+        self._accumulateur >>= nb_bits
+        self._nb_bits -= nb_bits
+
+    def lire(self, nb_bits: int) -> int:
+        """ retourne et consomme les nb_bits prochains bits """
+        valeur: int = self.regarder(nb_bits)
+        self.consommer(nb_bits)
+        return valeur
+
+    def lire_octets(self, taille: int) -> bytes:
+        """ retourne au plus taille octets, la lecture devant être alignée sur un octet """
+        if self._nb_bits % 8 != 0:
+            raise ValueError("lecture d'octets non alignée")
+        nb_octets: int = min(taille, self._nb_bits // 8)
+        octets = bytearray((self._accumulateur & ((1 << (8 * nb_octets)) - 1)) \
+                           .to_bytes(nb_octets, 'little'))
+        self.consommer(8 * nb_octets)
+        while len(octets) < taille and (self._position < self._fin or self._recharger()):
+            fin: int = min(self._fin, self._position + taille - len(octets))
+            octets += self._vue[self._position:fin]
+            self._position = fin
+        return bytes(octets)
+
+    def read(self, taille: int) -> bytes:
+        """ permet d'utiliser le lecteur comme un flux (lecture d'entêtes) """
+        return self.lire_octets(taille)
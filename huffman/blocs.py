@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+""" Module proposant le format par blocs (type 4) et sa compression multi-processus
+
+Un fichier de type 4 est une suite de blocs codés indépendamment, chacun ayant
+ses propres codes canoniques :
+
+    34 32 04
+    pour chaque bloc : longueur décodée, taille compressée, longueurs des codes, codes
+    0 (longueur décodée nulle : fin des blocs)
+    index : pour chaque bloc, position dans le fichier, taille compressée et
+longueur décodée (entiers de NB_OCTETS_INDEX octets)
+    position de l'index (NB_OCTETS_INDEX octets) puis SIGNATURE_INDEX
+
+L'index permet de décoder les blocs indépendamment les uns des autres, sans
+parcourir le fichier.
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
+import io
+import logging
+from huffman.compteur import CompteurOctets
+from huffman.canonique import codes_canoniques, ecrire_longueurs, lire_longueurs
+from huffman.compresseur import longueurs_canoniques, ecrire_codes, MOTEUR_FILE_DE_PRIORITE
+from huffman.decodeur import TableDeDecodage
+
+LOGGER = logging.getLogger()
+
+TAILLE_BLOC = 4 << 20
+NB_OCTETS_INDEX = 8
+SIGNATURE_INDEX = b"\x34\x32IX"
+
+class IndexDeBlocsErreur(Exception):
+    """Erreur lorsqu'un fichier n'a pas d'index de blocs valide"""
+
+
+def compresser_bloc(donnees: bytes, longueur_max_code: int=None,
+                    moteur: str=MOTEUR_FILE_DE_PRIORITE) -> bytes:
+    """ fonction qui retourne les longueurs des codes canoniques des octets de donnees
+(non vide) suivies de leurs codes binaires """
+    stats = CompteurOctets()
+    stats.ajouter_octets(donnees)
+    longueurs = longueurs_canoniques(stats, longueur_max_code, moteur)
+    flux = io.BytesIO()
+    ecrire_longueurs(flux, longueurs)
+    ecrire_codes(flux, io.BytesIO(donnees), codes_canoniques(longueurs))
+    return flux.getvalue()
+
+def decompresser_bloc(donnees: bytes, longueur: int) -> bytes:
+    """ fonction qui retourne les longueur octets décodés d'un bloc écrit par compresser_bloc """
+    source = io.BytesIO(donnees)
+    destination = io.BytesIO()
+    TableDeDecodage(codes_canoniques(lire_longueurs(source))).decoder(destination, source, longueur)
+    return destination.getvalue()
+
+def lire_blocs(source: io.RawIOBase, taille_bloc: int) -> Iterator[bytes]:
+    """ générateur des blocs de taille_bloc octets (le dernier pouvant être plus court) """
+    while donnees := source.read(taille_bloc):
+        yield donnees
+
+def verifier_taille_bloc(taille_bloc: int) -> None:
+    """ fonction qui lève ValueError si taille_bloc n'est pas strictement positive """
+    if taille_bloc <= 0:
+        raise ValueError("la taille des blocs doit être strictement positive")
+
+class ConteneurDeBlocs:
+    """ ConteneurDeBlocs produit les octets d'un fichier par blocs (type 4) : l'entête,
+chaque bloc compressé précédé de ses longueurs, puis la fin (marqueur, index et
+signature) ; il tient l'index à jour et est partagé par tous les écrivains du format
+
+    arguments:
+    position -- position dans le fichier du début de l'entête (voir compresser_blocs)
+    nb_octets_pour_serialisation_des_int -- taille des longueurs des blocs
+    ordre_pour_serialisation_des_int -- ordre des octets des entiers
+    """
+
+    def __init__(self, position: int=0,
+                 nb_octets_pour_serialisation_des_int: int=4,
+                 ordre_pour_serialisation_des_int='big') -> None:
+        self._position: int = position + 3
+        self._nb_octets: int = nb_octets_pour_serialisation_des_int
+        self._ordre = ordre_pour_serialisation_des_int
+        self._index: list[tuple[int, int, int]] = []
+
+    @property
+    def index(self) -> list[tuple[int, int, int]]:
+        """ entrées (position, taille compressée, longueur décodée) des blocs écrits """
+        return self._index[:]
+
+    def _entier(self, valeur: int) -> bytes:
+        return valeur.to_bytes(self._nb_octets, self._ordre)
+
+    def entete(self) -> bytes:
+        """ retourne l'entête du fichier """
+        return b"\x34\x32\x04"
+
+    def bloc(self, longueur: int, bloc_compresse: bytes) -> bytes:
+        """ retourne les longueurs du bloc de longueur octets compressé en bloc_compresse,
+à écrire juste avant lui, et l'ajoute à l'index """
+        LOGGER.debug("Bloc de %s octets compressé en %s octets", longueur, len(bloc_compresse))
+        self._position += 2 * self._nb_octets
+        self._index.append((self._position, len(bloc_compresse), longueur))
+        self._position += len(bloc_compresse)
+        return self._entier(longueur) + self._entier(len(bloc_compresse))
+
+    def fin(self) -> bytes:
+        """ retourne le marqueur de fin des blocs suivi de l'index et de sa signature """
+        position_index: int = self._position + self._nb_octets
+        LOGGER.debug("Écriture de l'index des %s blocs", len(self._index))
+        return self._entier(0) + \
+            b"".join(valeur.to_bytes(NB_OCTETS_INDEX, self._ordre) \
+                     for entree in self._index + [(position_index,)] for valeur in entree) + \
+            SIGNATURE_INDEX
+
+
+def compresser_blocs(destination: io.RawIOBase,
+                     source: io.RawIOBase,
+                     taille_bloc: int=TAILLE_BLOC,
+                     nb_processus: int=1,
+                     longueur_max_code: int=None,
+                     nb_octets_pour_serialisation_des_int: int=4,
+                     ordre_pour_serialisation_des_int='big',
+                     moteur: str=MOTEUR_FILE_DE_PRIORITE) -> None:
+    """ fonction qui compresse les données de source dans destination par blocs
+indépendants de taille_bloc octets, répartis sur nb_processus processus
+
+    source est lue une seule fois à partir de sa position courante, sans jamais être
+repositionnée : ce peut être un tube, une socket ou l'entrée standard ; seuls
+2 * nb_processus blocs au plus sont en mémoire. Les positions de l'index sont
+absolues si destination est positionnable (comptées à partir de sa position
+courante) ; sinon elles sont relatives au début des données écrites, qui doivent
+alors commencer le fichier (position 0). Le moteur de
+construction des codes (voir MOTEURS) n'a pas d'effet sur le résultat. """
+    verifier_taille_bloc(taille_bloc)
+    conteneur = ConteneurDeBlocs(destination.tell() if destination.seekable() else 0, \
+                                 nb_octets_pour_serialisation_des_int, \
+                                 ordre_pour_serialisation_des_int)
+
+    def ecrire_bloc(longueur: int, bloc_compresse: bytes) -> None:
+        destination.write(conteneur.bloc(longueur, bloc_compresse))
+        destination.write(bloc_compresse)
+
+    LOGGER.info("Compression par blocs de %s octets, %s processus", taille_bloc, nb_processus)
+    destination.write(conteneur.entete())
+    if nb_processus <= 1:
+        for donnees in lire_blocs(source, taille_bloc):
+            ecrire_bloc(len(donnees), compresser_bloc(donnees, longueur_max_code, moteur))
+    else:
+        with ProcessPoolExecutor(nb_processus) as executeur:
+            en_cours: deque = deque()
+            for donnees in lire_blocs(source, taille_bloc):
+                en_cours.append((len(donnees), \
+                                 executeur.submit(compresser_bloc, donnees, longueur_max_code, moteur)))
+                if len(en_cours) >= 2 * nb_processus:    # au plus 2 blocs en attente par processus
+                    longueur, resultat = en_cours.popleft()
+                    ecrire_bloc(longueur, resultat.result())
+            while en_cours:
+                longueur, resultat = en_cours.popleft()
+                ecrire_bloc(longueur, resultat.result())
+    destination.write(conteneur.fin())
+    LOGGER.debug("Fin de l'écriture")
+
+def decompresser_blocs(destination: io.RawIOBase,
+                       source: io.RawIOBase,
+                       nb_octets_pour_serialisation_des_int: int=4,
+                       ordre_pour_serialisation_des_int='big',
+                       nb_processus: int=1) -> None:
+    """ fonction qui décompresse les blocs de source (placée après le type de fichier)
+dans destination, en répartissant leur décodage sur nb_processus processus """
+    def lire_entier() -> int:
+        return int.from_bytes(source.read(nb_octets_pour_serialisation_des_int), \
+                              byteorder=ordre_pour_serialisation_des_int)
+
+    def blocs_compresses() -> Iterator[tuple[bytes, int]]:
+        while (longueur := lire_entier()) > 0:
+            bloc_compresse: bytes = source.read(lire_entier())
+            LOGGER.debug("Bloc de %s octets compressé en %s octets", longueur, len(bloc_compresse))
+            yield bloc_compresse, longueur
+
+    LOGGER.info("Décompression par blocs, %s processus", nb_processus)
+    if nb_processus <= 1:
+        for bloc_compresse, longueur in blocs_compresses():
+            destination.write(decompresser_bloc(bloc_compresse, longueur))
+    else:
+        with ProcessPoolExecutor(nb_processus) as executeur:
+            en_cours: deque = deque()
+            for bloc_compresse, longueur in blocs_compresses():
+                en_cours.append(executeur.submit(decompresser_bloc, bloc_compresse, longueur))
+                if len(en_cours) >= 2 * nb_processus:
+                    destination.write(en_cours.popleft().result())
+            while en_cours:
+                destination.write(en_cours.popleft().result())
+    LOGGER.debug("Fin de l'écriture")
+
+def lire_index(source: io.RawIOBase,
+               ordre_pour_serialisation_des_int='big') -> list[tuple[int, int, int]]:
+    """ fonction qui retourne l'index d'un fichier de type 4 : pour chaque bloc,
+sa position dans le fichier, sa taille compressée et sa longueur décodée """
+    source.seek(0)
+    if source.read(3) != b"\x34\x32\x04":
+        raise IndexDeBlocsErreur("le fichier n'est pas un fichier compressé par blocs")
+    fin: int = source.seek(0, io.SEEK_END)
+    taille_fin: int = NB_OCTETS_INDEX + len(SIGNATURE_INDEX)
+    if fin < 3 + taille_fin:
+        raise IndexDeBlocsErreur("le fichier compressé par blocs n'a pas d'index")
+    source.seek(fin - taille_fin)
+    position_index: bytes = source.read(NB_OCTETS_INDEX)
+    if source.read(len(SIGNATURE_INDEX)) != SIGNATURE_INDEX:
+        raise IndexDeBlocsErreur("le fichier compressé par blocs n'a pas d'index")
+    debut: int = int.from_bytes(position_index, byteorder=ordre_pour_serialisation_des_int)
+    source.seek(debut)
+    entrees: bytes = source.read(fin - taille_fin - debut)
+    if debut < 3 or len(entrees) % (3 * NB_OCTETS_INDEX) != 0:
+        raise IndexDeBlocsErreur("index de blocs incohérent")
+    valeurs = [int.from_bytes(entrees[i:i + NB_OCTETS_INDEX], \
+                              byteorder=ordre_pour_serialisation_des_int) \
+               for i in range(0, len(entrees), NB_OCTETS_INDEX)]
+    return list(zip(valeurs[::3], valeurs[1::3], valeurs[2::3]))
+
+def decompresser_bloc_du_fichier(nom_fichier_source: str, nom_fichier_destination: str,
+                                 position: int, taille: int, longueur: int,
+                                 position_destination: int) -> None:
+    """ fonction qui décode le bloc situé à position dans le fichier source et l'écrit
+à position_destination dans le fichier destination (déjà dimensionné) """
+    with open(nom_fichier_source, 'rb') as fichier_source:
+        fichier_source.seek(position)
+        octets: bytes = decompresser_bloc(fichier_source.read(taille), longueur)
+    with open(nom_fichier_destination, 'r+b') as fichier_destination:
+        fichier_destination.seek(position_destination)
+        fichier_destination.write(octets)
+
+def decompresser_fichier_blocs(nom_fichier_source: str, nom_fichier_destination: str,
+                               nb_processus: int=None) -> None:
+    """ fonction qui décompresse un fichier de type 4 à l'aide de son index : chaque
+processus lit lui-même ses blocs et écrit leur décodage à sa position dans le fichier
+destination (nb_processus vaut par défaut le nombre de processeurs) """
+    with open(nom_fichier_source, 'rb') as fichier_source:
+        index = lire_index(fichier_source)
+    positions_destination: list[int] = []
+    taille_destination: int = 0
+    for _, _, longueur in index:
+        positions_destination.append(taille_destination)
+        taille_destination += longueur
+    LOGGER.info("Décompression de %s blocs indexés, %s processus", len(index), nb_processus)
+    with open(nom_fichier_destination, 'wb') as fichier_destination:
+        fichier_destination.truncate(taille_destination)
+    with ProcessPoolExecutor(nb_processus) as executeur:
+        resultats = [executeur.submit(decompresser_bloc_du_fichier, nom_fichier_source, \
+                                      nom_fichier_destination, position, taille, longueur, \
+                                      position_destination) \
+                     for (position, taille, longueur), position_destination \
+                     in zip(index, positions_destination)]
+        for resultat in resultats:
+            resultat.result()
+    LOGGER.debug("Fin de l'écriture")
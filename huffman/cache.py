@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+""" Module proposant un cache LRU des tables de codage et de décodage
+
+Les tables sont indexées par une empreinte exacte du modèle (nombres d'occurrences
+ou longueurs des codes sérialisés en octets) : des données de distributions
+identiques ne paient la construction de leurs tables qu'une fois. Les tables mises
+en cache sont partagées et ne sont jamais modifiées après leur construction.
+"""
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, TypeVar
+import threading
+
+T = TypeVar('T')
+
+TAILLE_MAX_CACHE = 64
+
+def empreinte_des_longueurs(longueurs: Dict[int, int]) -> bytes:
+    """ retourne l'empreinte des longueurs des codes des octets (un octet par octet) """
+    empreinte = bytearray(256)
+    for octet, longueur in longueurs.items():
+        empreinte[octet] = longueur
+    return bytes(empreinte)
+
+class CacheDeTables:
+    """ CacheDeTables conserve les taille_max dernières tables utilisées (LRU) et peut
+être partagé entre threads
+
+    arguments:
+    taille_max -- nombre maximal de tables conservées (0 désactive le cache)
+    """
+
+    def __init__(self, taille_max: int = TAILLE_MAX_CACHE) -> None:
+        if taille_max < 0:
+            raise ValueError("la taille maximale du cache doit être positive ou nulle")
+        self._taille_max = taille_max
+        self._tables: OrderedDict = OrderedDict()
+        self._verrou = threading.Lock()
+        self._nb_succes: int = 0
+        self._nb_echecs: int = 0
+        self._nb_evictions: int = 0
+
+    def obtenir(self, cle: Hashable, construire: Callable[[], T]) -> T:
+        """ retourne la table associée à cle, construite par construire() si elle n'est
+pas en cache (la construction a lieu hors du verrou) """
+        with self._verrou:
+            if cle in self._tables:
+                self._nb_succes += 1
+                self._tables.move_to_end(cle)
+                return self._tables[cle]
+            self._nb_echecs += 1
+        table: T = construire()
+        with self._verrou:
+            if cle in self._tables:    # construite entre-temps par un autre thread
+                self._tables.move_to_end(cle)
+                return self._tables[cle]
+            if self._taille_max > 0:
+                self._tables[cle] = table
+                if len(self._tables) > self._taille_max:
+                    self._tables.popitem(last=False)
+                    self._nb_evictions += 1
+        return table
+
+    def vider(self) -> None:
+        """ supprime toutes les tables et remet les compteurs à zéro """
+        with self._verrou:
+            self._tables.clear()
+            self._nb_succes = self._nb_echecs = self._nb_evictions = 0
+
+    @property
+    def taille_max(self) -> int:
+        """ permet d'obtenir le nombre maximal de tables conservées """
+        return self._taille_max
+
+    @property
+    def nb_succes(self) -> int:
+        """ permet d'obtenir le nombre de tables trouvées en cache """
+        return self._nb_succes
+
+    @property
+    def nb_echecs(self) -> int:
+        """ permet d'obtenir le nombre de tables absentes du cache (donc construites) """
+        return self._nb_echecs
+
+    @property
+    def nb_evictions(self) -> int:
+        """ permet d'obtenir le nombre de tables retirées du cache faute de place """
+        return self._nb_evictions
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def __repr__(self) -> str:
+        return f"CacheDeTables(taille_max={self._taille_max}, {len(self)} tables, " \
+            f"{self._nb_succes} succès, {self._nb_echecs} échecs, {self._nb_evictions} évictions)"
+
+
+CACHE_DES_TABLES = CacheDeTables()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+""" Module proposant les codes de Huffman canoniques et la sérialisation de leurs longueurs """
+from typing import Dict
+from heapq import merge
+import io
+from huffman.arbre_huffman import ArbreHuffman
+from huffman.compteur import Compteur
+from huffman.code_binaire import CodeBinaireCompact
+
+SEUIL_TABLE_DENSE = 128
+
+class EnteteCanoniqueErreur(Exception):
+    """Erreur lorsque l'entête des longueurs de codes est incohérente"""
+
+
+def longueurs_des_codes(arbre: ArbreHuffman) -> Dict[int, int]:
+    """ retourne la longueur du code de chaque élément d'un arbre de Huffman
+(profondeur de sa feuille, 1 pour un arbre réduit à une feuille) """
+    if arbre.est_une_feuille:
+        return {arbre.element: 1}
+    longueurs: Dict[int, int] = {}
+    a_visiter: list[tuple[ArbreHuffman, int]] = [(arbre, 0)]
+    while a_visiter:
+        noeud, profondeur = a_visiter.pop()
+        if noeud.est_une_feuille:
+            longueurs[noeud.element] = profondeur
+        else:
+            a_visiter.append((noeud.fils_droit, profondeur + 1))
+            a_visiter.append((noeud.fils_gauche, profondeur + 1))
+    return longueurs
+
+def longueurs_limitees(stats: Compteur, longueur_max: int) -> Dict[int, int]:
+    """ retourne des longueurs de codes optimales parmi celles ne dépassant pas
+longueur_max (algorithme package-merge)
+
+    arguments:
+    stats -- nombre d'occurrences des éléments à coder
+    longueur_max -- longueur maximale d'un code
+    """
+    feuilles = sorted((stats.nb_occurrences(element), element) for element in stats.elements)
+    if len(feuilles) > 1 << longueur_max:
+        raise ValueError(f"{len(feuilles)} éléments ne peuvent pas être codés "
+                         f"sur {longueur_max} bits au plus")
+    if len(feuilles) == 1:
+        return {feuilles[0][1]: 1}
+    # un niveau est une liste triée de (poids, élément), l'élément None désignant
+    # un paquet formé de deux entrées consécutives du niveau précédent
+    niveaux: list[list[tuple[int, int]]] = [feuilles]
+    for _ in range(longueur_max - 1):
+        precedent = niveaux[-1]
+        paquets = [(precedent[i][0] + precedent[i + 1][0], None) \
+                   for i in range(0, len(precedent) - 1, 2)]
+        niveaux.append(list(merge(feuilles, paquets, key=lambda entree: entree[0])))
+    longueurs: Dict[int, int] = {element: 0 for _, element in feuilles}
+    nb_choisis: int = 2 * len(feuilles) - 2
+    for niveau in reversed(niveaux):
+        nb_paquets: int = 0
+        for _, element in niveau[:nb_choisis]:
+            if element is None:
+                nb_paquets += 1
+            else:
+                longueurs[element] += 1
+        nb_choisis = 2 * nb_paquets
+    return longueurs
+
+def taille_codee(stats: Compteur, longueurs: Dict[int, int]) -> int:
+    """ retourne le nombre de bits nécessaires pour coder les éléments de stats
+avec des codes de longueurs longueurs """
+    return sum(stats.nb_occurrences(element) * longueur for element, longueur in longueurs.items())
+
+def codes_canoniques(longueurs: Dict[int, int]) -> Dict[int, CodeBinaireCompact]:
+    """ retourne les codes canoniques associés aux longueurs de codes :
+les éléments sont triés par (longueur, élément) et reçoivent des codes consécutifs """
+    codes: Dict[int, CodeBinaireCompact] = {}
+    code: int = 0
+    longueur_precedente: int = 0
+    for element, longueur in sorted(longueurs.items(), key=lambda el: (el[1], el[0])):
+        code <<= longueur - longueur_precedente
+        if code >= 1 << longueur:
+            raise EnteteCanoniqueErreur("les longueurs ne forment pas un code préfixe")
+        codes[element] = CodeBinaireCompact.depuis_valeur( \
+            int(format(code, f"0{longueur}b")[::-1], 2), longueur)    # premier bit : poids fort
+        code += 1
+        longueur_precedente = longueur
+    return codes
+
+def ecrire_longueurs(destination: io.RawIOBase, longueurs: Dict[int, int]) -> None:
+    """ écrit les longueurs des codes des octets présents :
+un octet (nombre de symboles - 1) puis, pour moins de SEUIL_TABLE_DENSE symboles,
+des couples (octet, longueur), sinon la longueur des 256 octets (0 si absent) """
+    destination.write(bytes([len(longueurs) - 1]))
+    if len(longueurs) < SEUIL_TABLE_DENSE:
+        destination.write(bytes(val for octet in sorted(longueurs) \
+                                for val in (octet, longueurs[octet])))
+    else:
+        destination.write(bytes(longueurs.get(octet, 0) for octet in range(256)))
+
+def lire_longueurs(source: io.RawIOBase) -> Dict[int, int]:
+    """ lit les longueurs des codes écrites par ecrire_longueurs """
+    nb_symboles: int = source.read(1)[0] + 1
+    if nb_symboles < SEUIL_TABLE_DENSE:
+        couples: bytes = source.read(2 * nb_symboles)
+        longueurs = dict(zip(couples[::2], couples[1::2]))
+    else:
+        longueurs = {octet: longueur for octet, longueur in enumerate(source.read(256)) \
+                     if longueur > 0}
+    if len(longueurs) != nb_symboles or 0 in longueurs.values():
+        raise EnteteCanoniqueErreur("entête des longueurs de codes incohérente")
+    return longueurs
+
+
+def main():
+    """Tests unitaires du module"""
+    def ok_ko_en_str(booleen):
+        return "OK" if booleen else "KO"
+
+    longueurs = {65: 2, 66: 1, 67: 3, 68: 3}
+    codes = codes_canoniques(longueurs)
+    print(f"codes_canoniques : {ok_ko_en_str(str(codes[66]) == "0" and str(codes[68]) == "111")}")
+    flux = io.BytesIO()
+    ecrire_longueurs(flux, longueurs)
+    flux.seek(0)
+    print(f"lire_longueurs : {ok_ko_en_str(lire_longueurs(flux) == longueurs)}")
+
+if __name__ == "__main__":
+    main()
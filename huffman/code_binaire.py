@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-""" Module proposant une implémentation du type Bit et de la classe CodeBinaire """
+""" Module proposant une implémentation du type Bit et des classes CodeBinaire et CodeBinaireCompact """
 from enum import Enum
 from typing import Self
 
@@ -99,9 +99,9 @@ class CodeBinaire():
         """
         additionne deux codes binaires entre eux
         """
-        if not isinstance(autre, CodeBinaire):
+        if not isinstance(autre, (CodeBinaire, CodeBinaireCompact)):
             raise TypeError("Le code binaire doit être construit à partir de Bit")
-        return CodeBinaire(*(self._les_bits + autre._les_bits))
+        return CodeBinaire(*self._les_bits, *autre)
 
     def __iter__(self):
         """
@@ -113,6 +113,8 @@ class CodeBinaire():
         """
         teste l'égalité entre deux codes binaires
         """
+        if isinstance(autre, CodeBinaireCompact):
+            return autre == self
         if not isinstance(autre, CodeBinaire):
             return False
         return self._les_bits == autre._les_bits
@@ -131,7 +133,152 @@ class CodeBinaire():
 
 
     def __hash__(self):
-        return 7*hash(self._les_bits)
+        return hash((valeur_du_code(self), len(self)))
+
+class CodeBinaireCompact():
+    """ Code Binaire compact : les bits sont rangés dans un entier (le bit i de la
+valeur étant le i-ème bit du code) accompagné de la longueur du code, ce qui rend
+l'ajout et la concaténation en O(1) """
+    __slots__ = ("_valeur", "_longueur")
+
+    def __init__(self, bit: Bit, *bits: Bit) -> None:
+        """
+        initialise le code binaire
+        """
+        self._valeur: int = 0
+        self._longueur: int = 0
+        self.ajouter(bit)
+        for bit in bits:
+            self.ajouter(bit)
+
+    @classmethod
+    def depuis_valeur(cls, valeur: int, longueur: int) -> Self:
+        """
+        crée le code des longueur premiers bits de valeur
+        """
+        if longueur < 1:
+            raise AuMoinsUnBitErreur("Un code binaire doit posséder au moins un bit")
+        code = cls.__new__(cls)
+        code._valeur = valeur & ((1 << longueur) - 1)
+        code._longueur = longueur
+        return code
+
+    @property
+    def valeur(self) -> int:
+        """
+        entier dont le bit i est le i-ème bit du code
+        """
+        return self._valeur
+
+    @property
+    def longueur(self) -> int:
+        """
+        longueur du code binaire
+        """
+        return self._longueur
+
+    def ajouter(self, bit: Bit) -> None:
+        """
+        ajoute un bit à la fin du code binaire
+        """
+        if not isinstance(bit, Bit):
+            raise TypeError("le code binaire doit être construit à partir de Bit")
+        self._valeur |= bit.value << self._longueur
+        self._longueur += 1
+
+    def _remplacer_par(self, code: CodeBinaire) -> None:
+        """
+        remplace les bits du code par ceux de code
+        """
+        self._valeur = valeur_du_code(code)
+        self._longueur = len(code)
+
+    def __len__(self):
+        """
+        renvoie la longueur du code binaire
+        """
+        return self._longueur
+
+    def __getitem__(self, indice_du_slice: int|slice) -> Bit|Self:
+        """
+        obtenir un bit du code binaire
+        """
+        if isinstance(indice_du_slice, int):
+            if not -self._longueur <= indice_du_slice < self._longueur:
+                raise IndexError("indice hors du code binaire")
+            return Bit((self._valeur >> (indice_du_slice % self._longueur)) & 1)
+        return CodeBinaireCompact(*(self[i] for i in range(*indice_du_slice.indices(self._longueur))))
+
+    def __setitem__(self, indice_du_slice: int|slice, bit: Bit) -> None:
+        """
+        Modifie une partie du code binaire
+        """
+        code = CodeBinaire(*self)
+        code[indice_du_slice] = CodeBinaire(*bit) if isinstance(bit, CodeBinaireCompact) else bit
+        self._remplacer_par(code)
+
+    def __delitem__(self, indice_du_slice: int|slice) -> None:
+        """
+        supprime un bit
+        """
+        code = CodeBinaire(*self)
+        del code[indice_du_slice]
+        self._remplacer_par(code)
+
+    def __add__(self, autre: Self) -> Self:
+        """
+        additionne deux codes binaires entre eux
+        """
+        if isinstance(autre, CodeBinaireCompact):
+            return CodeBinaireCompact.depuis_valeur(self._valeur | autre.valeur << self._longueur, \
+                                                    self._longueur + autre.longueur)
+        if isinstance(autre, CodeBinaire):
+            return CodeBinaireCompact.depuis_valeur(
+                self._valeur | valeur_du_code(autre) << self._longueur, self._longueur + len(autre))
+        raise TypeError("Le code binaire doit être construit à partir de Bit")
+
+    def __iter__(self):
+        """
+        itere sur les elements
+        """
+        for position in range(self._longueur):
+            yield Bit((self._valeur >> position) & 1)
+
+    def __eq__(self, autre):
+        """
+        teste l'égalité entre deux codes binaires
+        """
+        if isinstance(autre, CodeBinaireCompact):
+            return self._valeur == autre.valeur and self._longueur == autre.longueur
+        if isinstance(autre, CodeBinaire):
+            return self._longueur == len(autre) and self._valeur == valeur_du_code(autre)
+        return False
+
+    def __repr__(self):
+        """
+        representaion formelle du code binaire
+        """
+        return f"CodeBinaireCompact({", ".join(f"{bit}" for bit in self)})"
+
+    def __str__(self):
+        """
+        representaion informelle du code binaire
+        """
+        return format(self._valeur, f"0{self._longueur}b")[::-1]
+
+    def __hash__(self):
+        return hash((self._valeur, self._longueur))
+
+def valeur_du_code(code: CodeBinaire | CodeBinaireCompact) -> int:
+    """ retourne l'entier dont le bit i est le i-ème bit du code
+(ordre dans lequel les bits sont écrits dans le flux) """
+    if isinstance(code, CodeBinaireCompact):
+        return code.valeur
+    valeur: int = 0
+    for position, bit in enumerate(code):
+        if bit == Bit.BIT_1:
+            valeur |= 1 << position
+    return valeur
 
 class AuMoinsUnBitErreur(Exception):
     """
@@ -1,41 +1,100 @@
 #!/usr/bin/env python3
 """ Module compresseur """
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from types import MappingProxyType
 from typing import Dict
 import io
 import logging
-from huffman.compteur import Compteur
+import os
+import sys
+from huffman.compteur import Compteur, CompteurOctets
 from huffman.arbre_huffman import ArbreHuffman
+from huffman.arbre_compact import ArbreCompact
+from huffman.table_des_codes import TableDesCodes
+from huffman.cache import CacheDeTables, CACHE_DES_TABLES, empreinte_des_longueurs
 from huffman.file_de_priorite import FileDePriorite
-from huffman.code_binaire import CodeBinaire, Bit
+from huffman.code_binaire import CodeBinaire
+from huffman.decodeur import TableDeDecodage
+from huffman.bits import EcrivainDeBits, LecteurDeBits
+from huffman.histogramme import TAILLE_BLOC, decouper_en_tranches, occurrences_de_la_tranche
+from huffman.encodeur import vectorisation_disponible, encoder_par_blocs
+from huffman.adaptatif import decompresser_adaptatif
+from huffman.lineaire import arbre_de_huffman_deux_files, longueurs_moffat_katajainen
+from huffman.canonique import longueurs_des_codes, codes_canoniques, ecrire_longueurs, \
+    lire_longueurs, longueurs_limitees, taille_codee
 
 LOGGER = logging.getLogger()
 
 NB_OCTETS_CODAGE_INT = 4
+TAILLE_LECTURE = 1 << 16
+MOTEUR_FILE_DE_PRIORITE = "file_de_priorite"
+MOTEUR_LINEAIRE = "lineaire"
+MOTEURS = (MOTEUR_FILE_DE_PRIORITE, MOTEUR_LINEAIRE)
+TYPES_TABLEAU = {array(type_tableau).itemsize: type_tableau for type_tableau in "BHILQ"}
 
 # @u:start precedentTP
 
-def statistiques(source: io.BufferedReader) -> (Compteur, int):
-    """ fonction qui retourne le nombre d'occurences (Compteur)
-d'un flux d'octets et ainsi que le nombre d'octets"""
+def statistiques(source: io.BufferedReader, nb_processus: int=1) -> (CompteurOctets, int):
+    """ fonction qui retourne le nombre d'occurences (CompteurOctets)
+d'un flux d'octets et ainsi que le nombre d'octets
+
+    nb_processus -- si supérieur à 1 et si source est un fichier nommé (source.name),
+les octets sont comptés en parallèle (voir statistiques_paralleles) """
     LOGGER.info("Création des statistiques")
-    cpt: Compteur = Compteur()
-    longueur: int = 0
-    source.seek(0)
-    for les_octets in source:
-        for octet_unique in les_octets:
-            cpt.incrementer(octet_unique)
-            longueur += 1
+    nom_fichier = getattr(source, "name", None)
+    if nb_processus > 1 and isinstance(nom_fichier, str) and os.path.isfile(nom_fichier):
+        cpt, longueur = statistiques_paralleles(nom_fichier, nb_processus)
+    else:
+        source.seek(0)
+        cpt: CompteurOctets = CompteurOctets()
+        longueur: int = 0
+        while donnees := source.read(TAILLE_BLOC):
+            cpt.ajouter_octets(donnees)
+            longueur += len(donnees)
     LOGGER.debug("Statistiques du fichier source :\n%s", cpt)
     return cpt, longueur
 
-def arbre_de_huffman(stat: Compteur) -> ArbreHuffman:
-    """ fonction qui retourne un arbre d'huffman à partir d'un compteur """
+def statistiques_paralleles(nom_fichier: str, nb_processus: int) -> (CompteurOctets, int):
+    """ fonction qui retourne le nombre d'occurences (CompteurOctets) des octets d'un
+fichier et sa longueur : le fichier est découpé en tranches comptées chacune par un
+processus qui la lit lui-même (os.pread), seuls les 256 comptes partiels étant
+transmis puis fusionnés ; le résultat est celui du comptage séquentiel """
+    longueur: int = os.path.getsize(nom_fichier)
+    tranches: list[tuple[int, int]] = decouper_en_tranches(longueur, nb_processus)
+    LOGGER.info("Comptage de %s tranches, %s processus", len(tranches), nb_processus)
+    cpt: CompteurOctets = CompteurOctets()
+    if len(tranches) == 1:
+        cpt.fusionner(CompteurOctets.depuis_occurrences( \
+            occurrences_de_la_tranche(nom_fichier, 0, longueur)))
+        return cpt, longueur
+    debuts, fins = zip(*tranches)
+    with ProcessPoolExecutor(min(nb_processus, len(tranches))) as executeur:
+        for occurrences in executeur.map(occurrences_de_la_tranche, \
+                                         repeat(nom_fichier), debuts, fins):
+            cpt.fusionner(CompteurOctets.depuis_occurrences(occurrences))
+    return cpt, longueur
+
+def verifier_moteur(moteur: str) -> None:
+    """ fonction qui lève ValueError si moteur n'est pas l'un des MOTEURS """
+    if moteur not in MOTEURS:
+        raise ValueError(f"moteur inconnu : {moteur} (attendu : {', '.join(MOTEURS)})")
+
+def arbre_de_huffman(stat: Compteur, moteur: str=MOTEUR_FILE_DE_PRIORITE) -> ArbreHuffman:
+    """ fonction qui retourne un arbre d'huffman à partir d'un compteur
+
+    moteur -- MOTEUR_FILE_DE_PRIORITE ou MOTEUR_LINEAIRE (deux files), qui
+produisent le même arbre """
     LOGGER.info("Création de l'arbre de Huffman")
-    file = FileDePriorite(cle=lambda a: a.nb_occurrences)
-    for octet in range(256):
-        if (nb := stat.nb_occurrences(octet)) > 0:
-            arbre: ArbreHuffman = ArbreHuffman(element=octet, nb_occurrences=nb)
-            file.enfiler(arbre)
+    verifier_moteur(moteur)
+    if moteur == MOTEUR_LINEAIRE:
+        arbre_res: ArbreHuffman = arbre_de_huffman_deux_files(stat)
+        LOGGER.debug("Arbre de Huffman : \n%s", arbre_res)
+        return arbre_res
+    feuilles = (ArbreHuffman(element=element, nb_occurrences=nb) \
+                for element in sorted(stat.elements) if (nb := stat.nb_occurrences(element)) > 0)
+    file = FileDePriorite(feuilles, cle=lambda a: a.nb_occurrences)
     while len(file) >= 2:
         file.enfiler(file.defiler() + file.defiler())
     arbre_res: ArbreHuffman = file.defiler()
@@ -46,47 +105,138 @@ def codes_binaire(arbre: ArbreHuffman) -> Dict[int, CodeBinaire]:
     """ fonction qui retourne le code binaire de tous les éléments
 d'un arbre d'Huffman """
     LOGGER.info("Création des codes binaires")
-    def codes_binaires_rec(arbre: ArbreHuffman, code_courant: CodeBinaire, \
-                           table: Dict[int, CodeBinaire]):
-        if arbre.est_une_feuille:
-            table[arbre.element] = code_courant
-        else:
-            codes_binaires_rec(arbre.fils_gauche, code_courant + CodeBinaire(Bit.BIT_0), table)
-            codes_binaires_rec(arbre.fils_droit, code_courant + CodeBinaire(Bit.BIT_1), table)
-    table: Dict[int, CodeBinaire] = {}
-    codes_binaires_rec(arbre.fils_gauche, CodeBinaire(Bit.BIT_0), table)
-    codes_binaires_rec(arbre.fils_droit, CodeBinaire(Bit.BIT_1), table)
-    return table
+    return ArbreCompact.depuis_arbre(arbre).codes()
+
+def table_des_codes(arbre: ArbreHuffman) -> TableDesCodes:
+    """ fonction qui retourne les codes binaires des octets d'un arbre d'Huffman
+sous forme de tableaux plats (valeur et longueur de chaque code) """
+    LOGGER.info("Création de la table des codes")
+    return TableDesCodes.depuis_arbre(arbre)
+
+def longueurs_canoniques(stats: Compteur, longueur_max_code: int=None,
+                         moteur: str=MOTEUR_FILE_DE_PRIORITE) -> Dict[int, int]:
+    """ fonction qui retourne la longueur du code de chaque octet, limitée à
+longueur_max_code bits si besoin, et journalise le surcoût de cette limitation
+
+    moteur -- MOTEUR_LINEAIRE calcule les longueurs en place (Moffat–Katajainen)
+sans construire d'arbre """
+    verifier_moteur(moteur)
+    longueurs: Dict[int, int] = longueurs_moffat_katajainen(stats) \
+        if moteur == MOTEUR_LINEAIRE else longueurs_des_codes(arbre_de_huffman(stats))
+    if longueur_max_code is None or max(longueurs.values()) <= longueur_max_code:
+        return longueurs
+    LOGGER.info("Limitation des codes à %s bits", longueur_max_code)
+    longueurs_bornees: Dict[int, int] = longueurs_limitees(stats, longueur_max_code)
+    taille_optimale: int = taille_codee(stats, longueurs)
+    taille_bornee: int = taille_codee(stats, longueurs_bornees)
+    LOGGER.info("Coût de la limitation : %s bits au lieu de %s (+%.3f %%)", taille_bornee, \
+                taille_optimale, 100 * (taille_bornee - taille_optimale) / taille_optimale)
+    return longueurs_bornees
+
+def ecrire_codes(destination: io.RawIOBase, source: io.RawIOBase,
+                 codes: Dict[int, CodeBinaire] | TableDesCodes) -> None:
+    """ fonction qui écrit dans destination le code binaire de chaque octet de source,
+bits de poids faible en premier """
+    if not isinstance(codes, TableDesCodes):
+        codes = TableDesCodes.depuis_codes(codes)
+    source.seek(0)
+    if vectorisation_disponible():
+        LOGGER.debug("Écriture des codes binaires par blocs")
+        encoder_par_blocs(destination, source, codes)
+        return
+    LOGGER.debug("Écriture des codes binaires")
+    table: list[tuple[int, int]] = list(zip(codes.valeurs, codes.longueurs))
+    ecrivain = EcrivainDeBits(destination)
+    ecrire = ecrivain.ecrire
+    while les_octets := source.read(TAILLE_LECTURE):    # par blocs : pas de découpage aux octets 10
+        for octet_unique in les_octets:
+            ecrire(*table[octet_unique])
+    ecrivain.terminer(garder_octet_final_nul=False)
+
+def entiers_en_octets(entiers, nb_octets: int, ordre: str) -> bytes:
+    """ fonction qui retourne la concaténation des entiers sérialisés sur nb_octets
+octets chacun, en une seule conversion lorsqu'un type de tableau a cette taille """
+    type_tableau: str = TYPES_TABLEAU.get(nb_octets)
+    if type_tableau is None:
+        return b"".join(entier.to_bytes(nb_octets, ordre) for entier in entiers)
+    tableau = array(type_tableau, entiers)
+    if ordre != sys.byteorder:
+        tableau.byteswap()
+    return tableau.tobytes()
+
+def obtenir_table(cache: CacheDeTables | None, cle, construire):
+    """ fonction qui retourne la table associée à cle dans cache, construite par
+construire() si elle n'y est pas (ou si cache vaut None) """
+    return construire() if cache is None else cache.obtenir(cle, construire)
 
 def compresser(destination: io.RawIOBase,
                source: io.RawIOBase,
                nb_octets_pour_serialisation_des_int: int=4,
-               ordre_pour_serialisation_des_int='big') -> None:
-    """ fonction qui compresse les données de source dans destination """
+               ordre_pour_serialisation_des_int='big',
+               canonique: bool=False,
+               longueur_max_code: int=None,
+               moteur: str=MOTEUR_FILE_DE_PRIORITE,
+               nb_processus: int=1,
+               cache: CacheDeTables | None=CACHE_DES_TABLES) -> None:
+    """ fonction qui compresse les données de source dans destination
 
-    def obtenir_type_de_fichier(stats: Compteur) -> int:
-        """Permet d'obtenir le type d'un fichier (0,1 ou 2) en connaissant ses statistiques"""
-        if len(stats.elements) == 0:
-            return 0
-        if len(stats.elements) <= 2:
-            return 1
-        return 2
+    canonique -- écrit un fichier de type 3 dont l'entête contient les longueurs
+des codes canoniques au lieu des 256 nombres d'occurrences
+    longueur_max_code -- longueur maximale des codes (implique canonique)
+    moteur -- construction des codes (voir MOTEURS), sans effet sur le résultat
+    nb_processus -- nombre de processus comptant les octets d'un fichier nommé,
+sans effet sur le résultat
+    cache -- cache des tables de codage, indexées par l'empreinte des statistiques
+(None : tables toujours construites)
 
+    source doit être positionnable (lue deux fois) ; destination peut ne pas l'être
+(tube, sortie standard) """
+    verifier_moteur(moteur)
     LOGGER.info("Compression")
-    destination.seek(0)
+    if destination.seekable():
+        destination.seek(0)
     destination.write(b"\x34\x32")
 
-    stats, longueur = statistiques(source)
+    stats, longueur = statistiques(source, nb_processus)
+    compresser_statistiques(destination, source, stats, longueur, \
+                            nb_octets_pour_serialisation_des_int, ordre_pour_serialisation_des_int, \
+                            canonique, longueur_max_code, moteur, cache)
+
+def compresser_statistiques(destination: io.RawIOBase,
+                            source: io.RawIOBase,
+                            stats: CompteurOctets,
+                            longueur: int,
+                            nb_octets_pour_serialisation_des_int: int=4,
+                            ordre_pour_serialisation_des_int='big',
+                            canonique: bool=False,
+                            longueur_max_code: int=None,
+                            moteur: str=MOTEUR_FILE_DE_PRIORITE,
+                            cache: CacheDeTables | None=CACHE_DES_TABLES) -> None:
+    """ fonction qui écrit dans destination (après l'identifiant de fichier) le type,
+l'entête et les codes des longueur octets de source, dont les statistiques stats
+sont déjà connues (voir compresser pour les autres arguments) """
+    canonique = canonique or longueur_max_code is not None
+
+    def obtenir_type_de_fichier(stats: Compteur) -> int:
+        """Permet d'obtenir le type d'un fichier (0,1,2 ou 3) en connaissant ses statistiques"""
+        nb_elements: int = len(stats.elements)
+        if nb_elements == 0:
+            return 0
+        if nb_elements == 1 or (nb_elements == 2 and not canonique):
+            return 1
+        return 3 if canonique else 2
+
     LOGGER.debug("Longueur du fichier source : %s octets", longueur)
 
-    if obtenir_type_de_fichier(stats) == 0:
+    type_fichier: int = obtenir_type_de_fichier(stats)
+    if type_fichier == 0:
         LOGGER.info("Fichier vide")
         destination.write(b"\x00")
         LOGGER.info("Écriture du fichier compressé")
         LOGGER.debug("Fin de l'écriture")
         return
 
-    if obtenir_type_de_fichier(stats) == 1:
+    if type_fichier == 1:
         LOGGER.info("N fois le même octet")
         destination.write(b"\x01")
         octet: int = list(stats.elements_plus_frequents())[0]
@@ -102,38 +252,46 @@ def compresser(destination: io.RawIOBase,
         LOGGER.debug("Fin de l'écriture")
         return
 
+    if type_fichier == 3:
+        LOGGER.info("Cas général, codes canoniques")
+        destination.write(b"\x03")
+
+        def construire_codes() -> tuple[Dict[int, int], TableDesCodes]:
+            longueurs: Dict[int, int] = longueurs_canoniques(stats, longueur_max_code, moteur)
+            return MappingProxyType(longueurs), TableDesCodes.depuis_codes(codes_canoniques(longueurs))
+
+        longueurs, codes = obtenir_table(cache, ("codage canonique", stats.empreinte(), \
+                                                 longueur_max_code), construire_codes)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Codes binaires des octets : \n%s", \
+                        {oct:str(code) for (oct,code) in codes.en_dict().items()})
+        LOGGER.info("Écriture du fichier compressé")
+        destination.write(longueur.to_bytes(nb_octets_pour_serialisation_des_int, \
+                                            ordre_pour_serialisation_des_int))
+        LOGGER.debug("Écriture de la longueur : %s", longueur)
+        LOGGER.debug("Écriture des longueurs des codes")
+        ecrire_longueurs(destination, longueurs)
+        ecrire_codes(destination, source, codes)
+        LOGGER.debug("Fin de l'écriture")
+        return
+
     LOGGER.info("Cas général")
     destination.write(b"\x02")
-    codes: Dict[int, CodeBinaire] = codes_binaire(arbre_de_huffman(stats))
-    LOGGER.debug("Codes binaires des octets : \n%s", \
-                {oct:str(code) for (oct,code) in codes.items()})
+    codes: TableDesCodes = obtenir_table(cache, ("codage", stats.empreinte()), \
+                                         lambda: table_des_codes(arbre_de_huffman(stats, moteur)))
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug("Codes binaires des octets : \n%s", \
+                    {oct:str(code) for (oct,code) in codes.en_dict().items()})
     LOGGER.info("Écriture du fichier compressé")
     destination.write(longueur.to_bytes(nb_octets_pour_serialisation_des_int, \
                                         ordre_pour_serialisation_des_int))
     LOGGER.debug("Écriture de la longueur : %s", longueur)
 
     LOGGER.debug("Écriture des statistiques")
-    for octet in range(256):
-        occurrences: int = stats.nb_occurrences(octet) if octet in stats.elements else 0
-        destination.write(occurrences.to_bytes(nb_octets_pour_serialisation_des_int, \
-                                               ordre_pour_serialisation_des_int))
+    destination.write(entiers_en_octets(stats.occurrences, nb_octets_pour_serialisation_des_int, \
+                                        ordre_pour_serialisation_des_int))
 
-    source.seek(0)
-    buffer: int = 0
-    bit_courant: int = 0
-    LOGGER.debug("Écriture des codes binaires")
-    for les_octets in source:
-        for octet_unique in les_octets:                 # on écrit chaque bit
-            for bit in codes[octet_unique]:             # du code binaire dans le buffer
-                if bit == Bit.BIT_1:                        # si le bit est 1 :
-                    buffer: int = buffer|2**(bit_courant)   # on force le bit courant du buffer à 1
-                bit_courant += 1
-                if bit_courant >= 8:                    # lorsque le buffer est plein :
-                    destination.write(bytes([buffer]))
-                    bit_courant: int = 0
-                    buffer: int = 0
-    if buffer != 0:
-        destination.write(bytes([buffer]))
+    ecrire_codes(destination, source, codes)
     LOGGER.debug("Fin de l'écriture")
 
 # @u:end precedentTP
@@ -141,18 +299,33 @@ def compresser(destination: io.RawIOBase,
 def decompresser(destination: io.RawIOBase,
                  source: io.RawIOBase,
                  nb_octets_pour_serialisation_des_int: int=4,
-                 ordre_pour_serialisation_des_int='big') -> None:
-    """ fichier qui décompresse les données destination dans source """
+                 ordre_pour_serialisation_des_int='big',
+                 nb_processus: int=1,
+                 moteur: str=MOTEUR_FILE_DE_PRIORITE,
+                 cache: CacheDeTables | None=CACHE_DES_TABLES,
+                 modeles=()) -> None:
+    """ fichier qui décompresse les données destination dans source
+
+    nb_processus -- nombre de processus décodant les blocs d'un fichier de type 4
+    moteur -- construction de l'arbre d'un fichier de type 2 (voir MOTEURS)
+    cache -- cache des tables de décodage, indexées par l'entête des fichiers de
+type 2 ou les longueurs des codes des fichiers de type 3 (None : pas de cache)
+    modeles -- modèles pré-entraînés (huffman.modele.Modele) parmi lesquels trouver
+celui d'un fichier de type 6
+
+    les flux non positionnables (tubes, sockets) sont lus et écrits séquentiellement """
 # @u:start decompresser
     LOGGER.info("Decompression")
-    source.seek(0)
-    destination.seek(0)
+    if source.seekable():
+        source.seek(0)
+    if destination.seekable():
+        destination.seek(0)
     LOGGER.debug("Lecture de l'identifiant du fichier")
-    if source.readline(2) != b"\x34\x32" :
+    if source.read(2) != b"\x34\x32" :
         LOGGER.error("Le fichier source n'est pas un fichier compressé")
         return
     LOGGER.debug("Lecture du type de fichier")
-    type_fichier: int = int.from_bytes(source.readline(1), \
+    type_fichier: int = int.from_bytes(source.read(1), \
                                        byteorder=ordre_pour_serialisation_des_int)
     LOGGER.debug("type = %s", type_fichier)
     if type_fichier == 0:
@@ -161,8 +334,29 @@ def decompresser(destination: io.RawIOBase,
         LOGGER.debug("Fin de l'écriture")
         return
 
+    if type_fichier == 4:
+        from huffman.blocs import decompresser_blocs    # huffman.blocs dépend de ce module
+        decompresser_blocs(destination, source, nb_octets_pour_serialisation_des_int, \
+                           ordre_pour_serialisation_des_int, nb_processus)
+        return
+
+    if type_fichier == 5:
+        decompresser_adaptatif(destination, source)
+        return
+
+    if type_fichier == 6:
+        from huffman.modele import decompresser_avec_modele    # huffman.modele dépend de ce module
+        decompresser_avec_modele(destination, source, modeles, nb_octets_pour_serialisation_des_int, \
+                                 ordre_pour_serialisation_des_int)
+        return
+
+    if type_fichier == 7:
+        LOGGER.error("Le fichier source est une archive : en extraire les membres")
+        return
+
+    lecteur: LecteurDeBits = LecteurDeBits(source)
     LOGGER.debug("Lecture de la longueur du fichier initial")
-    longueur: int = int.from_bytes(source.readline(nb_octets_pour_serialisation_des_int), \
+    longueur: int = int.from_bytes(lecteur.lire_octets(nb_octets_pour_serialisation_des_int), \
                               byteorder=ordre_pour_serialisation_des_int)
     LOGGER.debug("longueur = %s", longueur)
 
@@ -170,42 +364,47 @@ def decompresser(destination: io.RawIOBase,
         LOGGER.info("N fois le même octet")
         LOGGER.info("Création du fichier décompressé")
         LOGGER.debug("Lecture de l'octet")
-        octet: bytes = source.readline(1)
+        octet: bytes = lecteur.lire_octets(1)
         LOGGER.debug("Écriture de l'octet %s, %s fois", octet, longueur)
-        for _ in range(longueur):
-            destination.write(octet)
+        for debut in range(0, longueur, TAILLE_LECTURE):
+            destination.write(octet * min(TAILLE_LECTURE, longueur - debut))
         LOGGER.debug("Écriture d'un octet de fin de ligne : (10)")
         destination.write(bytes([10]))
         LOGGER.debug("Fin de l'écriture")
         return
 
+    if type_fichier == 3:
+        LOGGER.info("Cas général, codes canoniques")
+        LOGGER.info("Lecture des longueurs des codes")
+        longueurs: Dict[int, int] = lire_longueurs(lecteur)
+        table: TableDeDecodage = obtenir_table(cache, \
+            ("décodage canonique", empreinte_des_longueurs(longueurs)), \
+            lambda: TableDeDecodage(codes_canoniques(longueurs)))
+        LOGGER.info("Création du fichier décompressé")
+        table.decoder(destination, lecteur, longueur)
+        LOGGER.debug("Fin de l'écriture")
+        return
+
     LOGGER.info("Cas général")
-    stats: Compteur = Compteur()
     LOGGER.info("Lecture des statistiques")
-    for octet in range(256):
-        occurrences: int = int.from_bytes(source.readline(nb_octets_pour_serialisation_des_int), \
-                                          byteorder=ordre_pour_serialisation_des_int)
-        if occurrences > 0:
-            stats.fixer(octet, occurrences)
-
-    arbre: ArbreHuffman = arbre_de_huffman(stats)
-    octet_courant: bytes = source.readline(1)
-    bit_courant: int = 0
-    arbre_courant: ArbreHuffman = arbre
+    entete: bytes = lecteur.lire_octets(256 * nb_octets_pour_serialisation_des_int)
+
+    def construire_table() -> TableDeDecodage:
+        stats: CompteurOctets = CompteurOctets()
+        for octet in range(256):
+            debut: int = octet * nb_octets_pour_serialisation_des_int
+            occurrences: int = int.from_bytes(entete[debut:debut + nb_octets_pour_serialisation_des_int], \
+                                              byteorder=ordre_pour_serialisation_des_int)
+            if occurrences > 0:
+                stats.fixer(octet, occurrences)
+        return TableDeDecodage(codes_binaire(arbre_de_huffman(stats, moteur)))
+
+    table: TableDeDecodage = obtenir_table(cache, ("décodage", entete, ordre_pour_serialisation_des_int), \
+                                           construire_table)
+    LOGGER.debug("Table de décodage : %s bits par pas, %s tables", \
+                 table.bits_par_pas, table.nb_tables)
     LOGGER.info("Création du fichier décompressé")
-    for _ in range(longueur):
-        while not arbre_courant.est_une_feuille:
-            if bit_courant > 7:
-                bit_courant: int = 0
-                octet_courant: bytes = source.readline(1)
-            if (int.from_bytes(octet_courant, \
-                               byteorder=ordre_pour_serialisation_des_int)&2**(bit_courant))==0:
-                arbre_courant: ArbreHuffman = arbre_courant.fils_gauche
-            else:
-                arbre_courant: ArbreHuffman = arbre_courant.fils_droit
-            bit_courant += 1
-        destination.write(arbre_courant.element.to_bytes(1, ordre_pour_serialisation_des_int))
-        arbre_courant: ArbreHuffman = arbre
+    table.decoder(destination, lecteur, longueur)
     LOGGER.debug("Fin de l'écriture")
 
 # @u:end decompresser
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
-""" Module proposant la classe Compteur """
-from typing import TypeVar
+""" Module proposant les classes Compteur et CompteurOctets """
+from array import array
+from typing import Self, TypeVar
+from huffman.histogramme import ajouter_occurrences
 
 T = TypeVar('T')
 
@@ -131,6 +133,111 @@ et les valeurs des ensembles d'éléments qui ont ce nombre d'occurences"""
 
 # @u:end eq
 
+class CompteurOctets(Compteur):
+    """ CompteurOctets est un Compteur spécialisé pour les octets (entiers de 0 à 255),
+dont les nombres d'occurrences sont rangés dans un tableau de 256 cases (array('Q'))
+
+    un octet est référencé dès que son nombre d'occurrences est non nul
+
+    arguments:
+    val_init -- dictionnaire(octet, nb_occurences) qui permet d'initialiser
+le compteur à sa création
+    """
+    def __init__(self, val_init: dict[int, int] = None):
+        self._occurrences = array('Q', bytes(8 * 256))
+        if val_init is not None:
+            for octet, nb_occurences in val_init.items():
+                self.fixer(octet, nb_occurences)
+
+    @classmethod
+    def depuis_occurrences(cls, occurrences: list[int]) -> Self:
+        """ retourne le compteur dont le nombre d'occurrences de l'octet i est occurrences[i] """
+        compteur = cls()
+        compteur._occurrences = array('Q', occurrences)
+        return compteur
+
+    @staticmethod
+    def _verifier_octet(element: int) -> None:
+        if not isinstance(element, int) or not 0 <= element < 256:
+            raise ValueError(f"{element!r} n'est pas un octet")
+
+    def incrementer(self, element: int) -> None:
+        """incremente de 1 le nb d'occurences de l'octet element"""
+        self._verifier_octet(element)
+        self._occurrences[element] += 1
+
+    def fixer(self, element: int, nb_occurences: int) -> None:
+        """permet de fixer le nb d'occurences de l'octet element à nb_occurences"""
+        self._verifier_octet(element)
+        self._occurrences[element] = nb_occurences
+
+    def ajouter_octets(self, donnees: bytes) -> None:
+        """ajoute les occurrences de chaque octet de donnees (en une seule opération
+vectorisée si numpy est présent)"""
+        ajouter_occurrences(self._occurrences, donnees)
+
+    def fusionner(self, autre: Compteur) -> None:
+        """ajoute les occurrences des octets d'un autre compteur"""
+        if isinstance(autre, CompteurOctets):
+            for octet, nb_occurences in enumerate(autre.occurrences):
+                self._occurrences[octet] += nb_occurences
+        else:
+            for octet in autre.elements:
+                self._verifier_octet(octet)
+                self._occurrences[octet] += autre.nb_occurrences(octet)
+
+    def empreinte(self) -> bytes:
+        """retourne les nombres d'occurences sérialisés, identifiant exactement le compteur"""
+        return self._occurrences.tobytes()
+
+    @property
+    def occurrences(self) -> array:
+        """permet d'obtenir le nb d'occurences des 256 octets"""
+        return self._occurrences
+
+    def nb_occurrences(self, element: int) -> int:
+        """permet d'obtenir le nb d'occurences de element (0 s'il n'est pas un octet)"""
+        if not isinstance(element, int) or not 0 <= element < 256:
+            return 0
+        return self._occurrences[element]
+
+    @property
+    def elements(self) -> set[int]:
+        """retourne les octets présents, par ordre croissant"""
+        return dict.fromkeys(octet for octet, nb in enumerate(self._occurrences) if nb > 0).keys()
+
+    @property
+    def _occurences(self) -> dict[int, int]:
+        """vue dictionnaire utilisée par la comparaison avec un Compteur"""
+        return {octet: nb for octet, nb in enumerate(self._occurrences) if nb > 0}
+
+    def _elements_ayant_un_nb_occurrences(self, selection_valeur=lambda l: l[0]):
+        presents = [nb for nb in self._occurrences if nb > 0]
+        if not presents:
+            return set()
+        val = selection_valeur(presents)
+        return {octet for octet, nb in enumerate(self._occurrences) if nb == val}
+
+    def elements_par_nb_occurrences(self) -> dict[int, set[int]]:
+        """retourne pour chaque nombre d'occurences présent les octets qui ont ce
+nombre d'occurences (en un seul parcours)"""
+        groupes: dict[int, set[int]] = {}
+        for octet, nb in enumerate(self._occurrences):
+            if nb > 0:
+                groupes.setdefault(nb, set()).add(octet)
+        return groupes
+
+    def __repr__(self):
+        return f"CompteurOctets({self._occurences})"
+
+    def __str__(self):
+        return f"{self._occurences}"
+
+    def __eq__(self, autre):
+        if isinstance(autre, CompteurOctets):
+            return self._occurrences == autre.occurrences
+        return isinstance(autre, Compteur) and self._occurences == autre._occurences
+
 def main():
     """Tests unitaires du module"""
     def ok_ko_en_str(booleen):
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+""" Module proposant la classe TableDeDecodage """
+from typing import Dict
+import io
+from huffman.code_binaire import CodeBinaire, Bit, valeur_du_code
+from huffman.bits import LecteurDeBits, NB_BITS_MOT
+
+BITS_PAR_PAS = 10
+TAILLE_LECTURE = 1 << 16
+TAILLE_ECRITURE = 1 << 16
+
+class DecodageErreur(Exception):
+    """Erreurs relatives au décodage d'un flux de codes binaires"""
+
+
+class CodeInvalideErreur(DecodageErreur):
+    """Erreur lorsque les bits lus ne correspondent à aucun code"""
+
+
+class TableDeDecodage:
+    """ TableDeDecodage permet de décoder un flux de codes binaires en lisant
+plusieurs bits par pas grâce à des tables précalculées
+
+    arguments:
+    codes -- dictionnaire(symbole, code binaire) d'un code préfixe
+    bits_par_pas -- nombre de bits indexant chaque table (les codes plus longs
+sont résolus dans des sous-tables)
+
+    une table est immuable une fois construite et peut donc être partagée (voir huffman.cache)
+    """
+
+    def __init__(self, codes: Dict[int, CodeBinaire], bits_par_pas: int = BITS_PAR_PAS) -> None:
+        if bits_par_pas < 1:
+            raise ValueError("bits_par_pas doit être strictement positif")
+        self._bits_par_pas = bits_par_pas
+        self._tables: list[tuple[list[int], list[int], int, int]] = []    # figées en tuples
+        self._longueur_max = max(len(code) for code in codes.values())
+        self._construire_table([(valeur_du_code(code), len(code), symbole) \
+                                for symbole, code in codes.items()])
+        self._tables = tuple((tuple(symboles), tuple(longueurs), bits, masque) \
+                             for symboles, longueurs, bits, masque in self._tables)
+
+    def _construire_table(self, codes: list[tuple[int, int, int]]) -> int:
+        """ construit la table (et ses sous-tables) des codes (valeur, longueur, symbole)
+restant à lire et retourne son indice
+
+        chaque entrée est un couple (symbole, nombre de bits consommés) ; lorsque le
+nombre de bits consommés est nul, le symbole est l'indice de la sous-table à
+utiliser (ou -1 pour une entrée invalide)
+        """
+        bits: int = min(self._bits_par_pas, max(longueur for _, longueur, _ in codes))
+        taille: int = 1 << bits
+        symboles: list[int] = [-1] * taille
+        longueurs: list[int] = [0] * taille
+        indice: int = len(self._tables)
+        self._tables.append((symboles, longueurs, bits, taille - 1))
+        suites: Dict[int, list[tuple[int, int, int]]] = {}
+        for valeur, longueur, symbole in codes:
+            if longueur <= bits:
+                for i in range(valeur, taille, 1 << longueur):
+                    symboles[i] = symbole
+                    longueurs[i] = longueur
+            else:
+                suites.setdefault(valeur & (taille - 1), []) \
+                      .append((valeur >> bits, longueur - bits, symbole))
+        for prefixe, suite in suites.items():
+            symboles[prefixe] = self._construire_table(suite)
+        return indice
+
+    @property
+    def bits_par_pas(self) -> int:
+        """ permet d'obtenir le nombre de bits lus par pas dans la table principale """
+        return self._bits_par_pas
+
+    @property
+    def nb_tables(self) -> int:
+        """ permet d'obtenir le nombre de tables (table principale comprise) """
+        return len(self._tables)
+
+    def decoder(self, destination: io.RawIOBase, source: io.RawIOBase | LecteurDeBits,
+                longueur: int) -> None:
+        """ décode longueur symboles lus dans source (bits de poids faible en premier)
+et les écrit dans destination ; source peut être un flux ou un LecteurDeBits déjà
+positionné sur les codes """
+        lecteur: LecteurDeBits = source if isinstance(source, LecteurDeBits) \
+            else LecteurDeBits(source, TAILLE_LECTURE)
+        lire = lecteur.lire
+
+        def remplir(accumulateur: int, nb_bits: int, besoin: int) -> tuple[int, int]:
+            """ ajoute des mots du lecteur à l'accumulateur jusqu'à avoir besoin bits,
+les bits au-delà de la fin du flux valent 0 """
+            while nb_bits < besoin:
+                accumulateur |= lire(NB_BITS_MOT) << nb_bits
+                nb_bits += NB_BITS_MOT
+            return accumulateur, nb_bits
+
+        tables = self._tables
+        symboles, longueurs, bits, masque = tables[0]
+        longueur_max: int = self._longueur_max
+        accumulateur: int = 0
+        nb_bits: int = 0
+        restant: int = longueur
+        while restant > 0:
+            sortie = bytearray()
+            ajouter = sortie.append
+            for _ in range(min(restant, TAILLE_ECRITURE)):
+                if nb_bits < bits:
+                    accumulateur, nb_bits = remplir(accumulateur, nb_bits, bits)
+                i = accumulateur & masque
+                consommes = longueurs[i]
+                if consommes:
+                    accumulateur >>= consommes
+                    nb_bits -= consommes
+                    ajouter(symboles[i])
+                    continue
+                if nb_bits < longueur_max:                    # code long : sous-tables
+                    accumulateur, nb_bits = remplir(accumulateur, nb_bits, longueur_max)
+                table = (symboles, longueurs, bits, masque)
+                while not consommes:
+                    sous_table = table[0][i]
+                    if sous_table < 0:
+                        raise CodeInvalideErreur("les bits lus ne correspondent à aucun code")
+                    accumulateur >>= table[2]
+                    nb_bits -= table[2]
+                    table = tables[sous_table]
+                    i = accumulateur & table[3]
+                    consommes = table[1][i]
+                accumulateur >>= consommes
+                nb_bits -= consommes
+                ajouter(table[0][i])
+            destination.write(sortie)
+            restant -= len(sortie)
+
+
+def main():
+    """Tests unitaires du module"""
+    def ok_ko_en_str(booleen):
+        return "OK" if booleen else "KO"
+
+    codes = {65: CodeBinaire(Bit.BIT_0),
+             66: CodeBinaire(Bit.BIT_1, Bit.BIT_0),
+             67: CodeBinaire(Bit.BIT_1, Bit.BIT_1)}
+    table = TableDeDecodage(codes, bits_par_pas=1)
+    destination = io.BytesIO()
+    table.decoder(destination, io.BytesIO(bytes([0b00000111])), 4)
+    print(f"decoder : {ok_ko_en_str(destination.getvalue() == b"CBAA")}")
+    print(f"nb_tables : {ok_ko_en_str(table.nb_tables == 2)}")
+
+if __name__ == "__main__":
+    main()
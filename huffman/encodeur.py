@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+""" Module proposant l'écriture vectorisée (numpy) des codes binaires """
+from typing import Dict
+import io
+from huffman.code_binaire import CodeBinaire
+from huffman.table_des_codes import TableDesCodes, NB_BITS_MAX_TYPE
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TAILLE_BLOC = 1 << 14
+
+def vectorisation_disponible() -> bool:
+    """ permet de savoir si numpy est installé """
+    return np is not None
+
+def bits_des_codes(codes: TableDesCodes, longueurs, debuts):
+    """ retourne les bits des codes des 256 octets mis bout à bout (np.uint8),
+le code de l'octet o commençant à debuts[o] """
+    decalages = np.arange(int(longueurs.sum()), dtype=np.int32) - np.repeat(debuts, longueurs)
+    if codes.longueur_max > NB_BITS_MAX_TYPE:    # valeurs hors array('Q') : conversion bit à bit
+        return np.array([(codes.valeurs[octet] >> int(decalage)) & 1 for octet, decalage \
+                         in zip(np.repeat(np.arange(256), longueurs), decalages)], dtype=np.uint8)
+    valeurs = np.frombuffer(codes.valeurs, dtype=np.uint64)
+    return ((np.repeat(valeurs, longueurs) >> decalages.astype(np.uint64)) & 1).astype(np.uint8)
+
+def encoder_par_blocs(destination: io.RawIOBase, source: io.RawIOBase,
+                      codes: Dict[int, CodeBinaire] | TableDesCodes,
+                      taille_bloc: int = TAILLE_BLOC) -> None:
+    """ écrit dans destination le code binaire de chaque octet de source (lu à partir
+de la position courante), bits de poids faible en premier
+
+    chaque bloc de taille_bloc octets est traduit en longueurs de codes, dont la somme
+cumulée donne la position de chaque code, puis ses bits sont rassemblés et regroupés
+en octets en une seule opération ; comme pour l'écriture bit à bit, le dernier octet
+incomplet n'est écrit que s'il est non nul
+    """
+    if not isinstance(codes, TableDesCodes):
+        codes = TableDesCodes.depuis_codes(codes)
+    longueurs = np.frombuffer(codes.longueurs, dtype=np.uint8).astype(np.int32)
+    debuts = (np.cumsum(longueurs) - longueurs).astype(np.int32)
+    table_des_bits = bits_des_codes(codes, longueurs, debuts)
+    reste = np.zeros(0, dtype=np.uint8)
+    while donnees := source.read(taille_bloc):
+        octets = np.frombuffer(donnees, dtype=np.uint8)
+        longueurs_du_bloc = longueurs[octets]
+        fins = np.cumsum(longueurs_du_bloc)
+        decalages = np.repeat(debuts[octets] - (fins - longueurs_du_bloc), longueurs_du_bloc)
+        bits = table_des_bits[np.arange(int(fins[-1]), dtype=np.int32) + decalages]
+        if len(reste) > 0:
+            bits = np.concatenate((reste, bits))
+        nb_bits_complets: int = len(bits) // 8 * 8
+        destination.write(np.packbits(bits[:nb_bits_complets], bitorder='little').tobytes())
+        reste = bits[nb_bits_complets:]
+    if reste.any():
+        destination.write(np.packbits(reste, bitorder='little').tobytes())
@@ -1,71 +1,77 @@
 #!/usr/bin/env python3
 """ Module proposant la classe FileDePriorite """
+from itertools import count
 from typing import TypeVar
+import heapq
 
 T = TypeVar('T')
 
 class FileDePriorite:
-    """ FileDePriorite permet de représenter une file de priorite """
+    """ FileDePriorite permet de représenter une file de priorite
+
+    la file est un tas binaire de triplets (clé, rang d'arrivée, élément) : enfiler et
+défiler sont en O(log n) et, à clés égales, les éléments sortent dans leur ordre
+d'arrivée. La construction à partir de elements est en O(n).
+    """
 
     def __init__(self, elements = (), cle: 'function' = lambda e:e) -> None:
         self._la_cle = cle
-        self._file = []
-        for elem in elements:
-            self.enfiler(elem)
+        self._rangs = count()
+        self._file = [(cle(elem), next(self._rangs), elem) for elem in elements]
+        try:
+            if self._file:
+                _ = self._file[0][0] <= self._file[0][0]
+            heapq.heapify(self._file)
+        except TypeError as erreur:
+            raise ElementNonComparableErreur\
+                ("les éléments ne peuvent pas être comparés entre eux") from erreur
 
     @property
     def est_vide(self) -> bool:
         """ permet de savoir si la file st vide """
         return not self._file
 
-    def _est_element_non_comparable(self, element_a_comparer: T) -> bool:
-        autre = element_a_comparer if not self._file else self._file[0]
-        try:
-            _ = self._la_cle(element_a_comparer) <= self._la_cle(autre)
-        except TypeError:
-            return True
-        return False
-
     def enfiler(self, element: T) -> None:
         """ permet d'enfiler une élément dans la file """
-        if self._est_element_non_comparable(element):
+        cle = self._la_cle(element)
+        try:
+            _ = cle <= (self._file[0][0] if self._file else cle)
+        except TypeError as erreur:
             if not self._file:
                 raise ElementNonComparableErreur\
-                    (f"La classe de {element} ne possède pas les méthodes de comparaison")
+                    (f"La classe de {element} ne possède pas les méthodes de comparaison") \
+                    from erreur
             raise ElementNonComparableErreur\
-                (f"{element} ne peut pas être comparé aux éléments de la file")
-        i = 0
-        while i < len(self._file) and  \
-            self._la_cle(self._file[i]) <= self._la_cle(element):
-            i += 1
-        self._file.insert(i, element)
+                (f"{element} ne peut pas être comparé aux éléments de la file") from erreur
+        heapq.heappush(self._file, (cle, next(self._rangs), element))
 
     @property
     def element(self) -> T:
         """ permet d'obtenir l'élément le plus prioritaire sans le défiler """
         if self.est_vide:
             raise FileDePrioriteVideErreur("la file de priorite est vide")
-        return self._file[0]
+        return self._file[0][2]
 
     def defiler(self) -> T:
         """ permet de défiler l'élément le plus prioriaire, on obtient alors cet élément """
         if self.est_vide:
             raise FileDePrioriteVideErreur("la file de priorite est vide")
-        return self._file.pop(0)
+        return heapq.heappop(self._file)[2]
 
     def __len__(self) -> int:
         return len(self._file)
 
     def __iter__(self):
-        yield from self._file
+        """ parcourt les éléments dans leur ordre de sortie """
+        yield from (elem for _, _, elem in sorted(self._file))
 
     def __repr__(self) -> str:
-        return f"FileDePriorite({tuple(self._file)})"
+        return f"FileDePriorite({tuple(self)})"
 
     def __eq__(self, autre) -> bool:
         if not isinstance(autre, self.__class__):
             return False
-        return self._file == autre._file
+        return list(self) == list(autre)
 
 class FileDePrioriteVideErreur(Exception):
     """
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+""" Module proposant le comptage des octets d'un bloc de données, d'une tranche de
+fichier lue par os.pread ou d'un lot de données """
+from collections import Counter
+import os
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TAILLE_BLOC = 1 << 20
+
+def ajouter_occurrences(occurrences: list[int], donnees: bytes) -> None:
+    """ ajoute à occurrences (256 entiers) le nombre d'occurrences
+de chaque octet de donnees, en une seule opération vectorisée si numpy est présent """
+    if np is not None:
+        comptes = np.bincount(np.frombuffer(donnees, dtype=np.uint8), minlength=256).tolist()
+        for octet, nb in enumerate(comptes):
+            occurrences[octet] += nb
+    else:
+        for octet, nb in Counter(donnees).items():
+            occurrences[octet] += nb
+
+def decouper_en_tranches(longueur: int, nb_tranches: int,
+                         taille_min: int = TAILLE_BLOC) -> list[tuple[int, int]]:
+    """ retourne les positions (début, fin) d'au plus nb_tranches tranches consécutives
+de tailles égales (à un octet près) et d'au moins taille_min octets couvrant longueur octets """
+    nb_tranches = max(1, min(nb_tranches, longueur // taille_min))
+    bornes: list[int] = [longueur * i // nb_tranches for i in range(nb_tranches + 1)]
+    return list(zip(bornes, bornes[1:]))
+
+def occurrences_de_la_tranche(nom_fichier: str, debut: int, fin: int,
+                              taille_bloc: int = TAILLE_BLOC) -> list[int]:
+    """ retourne le nombre d'occurrences de chaque octet du fichier entre les positions
+debut (incluse) et fin (exclue), lu par blocs avec os.pread (sans position partagée) """
+    occurrences: list[int] = [0] * 256
+    descripteur: int = os.open(nom_fichier, os.O_RDONLY)
+    try:
+        position: int = debut
+        while position < fin and \
+            (donnees := os.pread(descripteur, min(taille_bloc, fin - position), position)):
+            ajouter_occurrences(occurrences, donnees)
+            position += len(donnees)
+    finally:
+        os.close(descripteur)
+    return occurrences
+
+def histogrammes(lot: list[bytes]) -> list[list[int]]:
+    """ retourne le nombre d'occurrences de chaque octet de chacune des données de lot,
+comptées en une seule opération vectorisée sur leur concaténation si numpy est présent """
+    if np is None:
+        occurrences: list[list[int]] = []
+        for donnees in lot:
+            occurrences.append([0] * 256)
+            ajouter_occurrences(occurrences[-1], donnees)
+        return occurrences
+    longueurs = np.fromiter((len(donnees) for donnees in lot), dtype=np.int64, count=len(lot))
+    octets = np.frombuffer(b"".join(lot), dtype=np.uint8)
+    numeros = np.repeat(np.arange(len(lot), dtype=np.int64) << 8, longueurs)
+    return np.bincount(numeros + octets, minlength=256 * len(lot)).reshape(len(lot), 256).tolist()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+""" Module proposant la lecture à accès aléatoire des fichiers compressés par blocs """
+from bisect import bisect_right
+from typing import Self
+import io
+from huffman.blocs import lire_index, decompresser_bloc
+
+class LecteurHuffman:
+    """ LecteurHuffman permet de lire une plage d'octets décompressés d'un fichier
+de type 4 indexé en ne décodant que les blocs qui la couvrent
+
+    arguments:
+    source -- flux binaire (avec accès aléatoire) du fichier compressé
+    """
+
+    def __init__(self, source: io.RawIOBase) -> None:
+        self._source = source
+        self._index = lire_index(source)
+        self._debuts: list[int] = []
+        taille: int = 0
+        for _, _, longueur in self._index:
+            self._debuts.append(taille)
+            taille += longueur
+        self._taille = taille
+        self._bloc_en_cache: tuple[int, bytes] = (-1, b"")
+
+    @property
+    def taille(self) -> int:
+        """ permet d'obtenir la taille des données décompressées """
+        return self._taille
+
+    @property
+    def nb_blocs(self) -> int:
+        """ permet d'obtenir le nombre de blocs du fichier """
+        return len(self._index)
+
+    def _bloc(self, indice: int) -> bytes:
+        """ retourne les octets décodés du bloc indice (le dernier bloc lu est conservé) """
+        if self._bloc_en_cache[0] != indice:
+            position, taille, longueur = self._index[indice]
+            self._source.seek(position)
+            self._bloc_en_cache = (indice, decompresser_bloc(self._source.read(taille), longueur))
+        return self._bloc_en_cache[1]
+
+    def lire(self, offset: int, taille: int) -> bytes:
+        """ retourne au plus taille octets décompressés à partir de offset """
+        if offset < 0 or taille < 0:
+            raise ValueError("offset et taille doivent être positifs")
+        fin: int = min(offset + taille, self._taille)
+        morceaux: list[bytes] = []
+        position: int = offset
+        while position < fin:
+            indice: int = bisect_right(self._debuts, position) - 1
+            debut_du_bloc: int = self._debuts[indice]
+            bloc: bytes = self._bloc(indice)
+            morceaux.append(bloc[position - debut_du_bloc:fin - debut_du_bloc])
+            position = debut_du_bloc + len(bloc)
+        return b"".join(morceaux)
+
+    def fermer(self) -> None:
+        """ ferme le flux du fichier compressé """
+        self._source.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.fermer()
+
+def ouvrir_huffman(nom_fichier: str) -> LecteurHuffman:
+    """ ouvre un fichier compressé par blocs pour y lire des plages d'octets """
+    fichier = open(nom_fichier, 'rb')
+    try:
+        return LecteurHuffman(fichier)
+    except Exception:
+        fichier.close()
+        raise
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+""" Module proposant la construction de Huffman en temps linéaire une fois les
+feuilles triées : deux files (arbre) et Moffat–Katajainen (longueurs en place)
+
+Les deux constructions départagent les ex æquo comme arbre_de_huffman (à nombre
+d'occurrences égal, les feuilles avant les noeuds, puis par ordre d'arrivée) et
+produisent donc le même arbre et les mêmes longueurs de codes.
+"""
+from collections import deque
+from typing import Dict
+from huffman.compteur import Compteur
+from huffman.arbre_huffman import ArbreHuffman
+
+def feuilles_triees(stats: Compteur) -> list[tuple[int, int]]:
+    """ retourne les couples (nombre d'occurrences, élément) triés des éléments présents """
+    return sorted((nb, element) for element in stats.elements \
+                  if (nb := stats.nb_occurrences(element)) > 0)
+
+def arbre_de_huffman_deux_files(stats: Compteur) -> ArbreHuffman:
+    """ fonction qui retourne l'arbre de Huffman de stats en fusionnant les feuilles
+triées (première file) et les noeuds dans leur ordre de création (seconde file,
+dont les nombres d'occurrences sont croissants) """
+    feuilles = deque(ArbreHuffman(element=element, nb_occurrences=nb) \
+                     for nb, element in feuilles_triees(stats))
+    noeuds: deque = deque()
+
+    def defiler_le_plus_petit() -> ArbreHuffman:
+        if not noeuds or (feuilles and feuilles[0].nb_occurrences <= noeuds[0].nb_occurrences):
+            return feuilles.popleft()
+        return noeuds.popleft()
+
+    while len(feuilles) + len(noeuds) >= 2:
+        noeuds.append(defiler_le_plus_petit() + defiler_le_plus_petit())
+    return (noeuds or feuilles).popleft()
+
+def longueurs_moffat_katajainen(stats: Compteur) -> Dict[int, int]:
+    """ fonction qui retourne la longueur du code de chaque élément de stats sans
+construire d'arbre : le tableau des poids triés reçoit successivement les poids des
+noeuds, l'indice de leur parent, leur profondeur puis la longueur de chaque code
+(1 pour un seul élément) """
+    feuilles = feuilles_triees(stats)
+    nb_feuilles: int = len(feuilles)
+    if nb_feuilles == 1:
+        return {feuilles[0][1]: 1}
+    tableau: list[int] = [nb for nb, _ in feuilles]
+    if nb_feuilles == 0:
+        return {}
+    # phase 1 : fusion des deux plus petits, les noeuds remplaçant les feuilles consommées
+    tableau[0] += tableau[1]
+    racine: int = 0
+    feuille: int = 2
+    for suivant in range(1, nb_feuilles - 1):
+        for premier in (True, False):
+            if feuille >= nb_feuilles or ((premier or racine < suivant) \
+                                          and tableau[racine] < tableau[feuille]):
+                poids: int = tableau[racine]
+                tableau[racine] = suivant
+                racine += 1
+            else:
+                poids = tableau[feuille]
+                feuille += 1
+            tableau[suivant] = poids if premier else tableau[suivant] + poids
+    # phase 2 : profondeur des noeuds à partir de l'indice de leur parent
+    tableau[nb_feuilles - 2] = 0
+    for suivant in range(nb_feuilles - 3, -1, -1):
+        tableau[suivant] = tableau[tableau[suivant]] + 1
+    # phase 3 : longueur des feuilles, les plus fréquentes ayant les codes les plus courts
+    disponibles: int = 1
+    utilises: int = 0
+    profondeur: int = 0
+    racine = nb_feuilles - 2
+    suivant = nb_feuilles - 1
+    while disponibles > 0:
+        while racine >= 0 and tableau[racine] == profondeur:
+            utilises += 1
+            racine -= 1
+        while disponibles > utilises:
+            tableau[suivant] = profondeur
+            suivant -= 1
+            disponibles -= 1
+        disponibles = 2 * utilises
+        profondeur += 1
+        utilises = 0
+    return {element: longueur for (_, element), longueur in zip(feuilles, tableau)}
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+""" Module proposant la compression et la décompression de lots de données en mémoire
+
+Chaque donnée du lot est compressée comme par compresser (ou compresser_avec_modele) :
+le résultat est identique, octet pour octet. Le lot est traité par tranches de
+TAILLE_TRANCHE données dont les octets sont comptés en une seule opération, et
+les tables de codes ne sont construites qu'une fois par distribution distincte.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable
+import io
+import logging
+from huffman.cache import CacheDeTables, CACHE_DES_TABLES
+from huffman.compresseur import compresser_statistiques, decompresser, MOTEUR_FILE_DE_PRIORITE
+from huffman.compteur import CompteurOctets
+from huffman.histogramme import histogrammes
+from huffman.modele import Modele, compresser_avec_modele
+
+LOGGER = logging.getLogger()
+
+TAILLE_TRANCHE = 1 << 12
+
+def tranches(lot: list, taille_tranche: int = TAILLE_TRANCHE) -> Iterable[list]:
+    """ retourne les tranches successives de taille_tranche éléments de lot """
+    return (lot[debut:debut + taille_tranche] for debut in range(0, len(lot), taille_tranche))
+
+def _cache_des_processus(cache: CacheDeTables | None, nb_processus: int) -> CacheDeTables | None | bool:
+    """ retourne le cache à transmettre aux tranches : un cache ne se partageant pas
+entre processus, True demande à chaque tranche d'utiliser son propre cache """
+    if nb_processus > 1 and cache is not None:
+        return True
+    return cache
+
+def _compresser_tranche(tranche: list[bytes], canonique: bool, longueur_max_code: int,
+                        moteur: str, modele: Modele, cache: CacheDeTables | None | bool) -> list[bytes]:
+    """ retourne les données de tranche compressées (cache vaut True dans un processus
+de travail : les tables ne sont alors partagées qu'au sein de la tranche) """
+    cache = CacheDeTables() if cache is True else cache
+    resultats: list[bytes] = []
+    if modele is not None:
+        for donnees in tranche:
+            destination = io.BytesIO()
+            compresser_avec_modele(destination, io.BytesIO(donnees), modele)
+            resultats.append(destination.getvalue())
+        return resultats
+    for donnees, occurrences in zip(tranche, histogrammes(tranche)):
+        destination = io.BytesIO()
+        destination.write(b"\x34\x32")
+        compresser_statistiques(destination, io.BytesIO(donnees), \
+                                CompteurOctets.depuis_occurrences(occurrences), len(donnees), \
+                                canonique=canonique, longueur_max_code=longueur_max_code, \
+                                moteur=moteur, cache=cache)
+        resultats.append(destination.getvalue())
+    return resultats
+
+def _decompresser_tranche(tranche: list[bytes], modeles: tuple[Modele],
+                          cache: CacheDeTables | None | bool) -> list[bytes]:
+    """ retourne les données de tranche décompressées (voir _compresser_tranche) """
+    cache = CacheDeTables() if cache is True else cache
+    resultats: list[bytes] = []
+    for donnees in tranche:
+        destination = io.BytesIO()
+        decompresser(destination, io.BytesIO(donnees), cache=cache, modeles=modeles)
+        resultats.append(destination.getvalue())
+    return resultats
+
+def _repartir(fonction, lot: list, nb_processus: int, *arguments) -> list[bytes]:
+    """ applique fonction (et arguments) aux tranches de lot, réparties sur nb_processus
+processus, et retourne la concaténation des résultats dans l'ordre du lot """
+    if nb_processus <= 1:
+        return [resultat for tranche in tranches(lot) for resultat in fonction(tranche, *arguments)]
+    taille_tranche: int = min(TAILLE_TRANCHE, max(1, -(-len(lot) // nb_processus)))
+    with ProcessPoolExecutor(nb_processus) as executeur:
+        resultats = [executeur.submit(fonction, tranche, *arguments) \
+                     for tranche in tranches(lot, taille_tranche)]
+        return [resultat for futur in resultats for resultat in futur.result()]
+
+def compresser_lot(lot: Iterable[bytes],
+                   canonique: bool=False,
+                   longueur_max_code: int=None,
+                   moteur: str=MOTEUR_FILE_DE_PRIORITE,
+                   modele: Modele=None,
+                   nb_processus: int=1,
+                   cache: CacheDeTables | None=CACHE_DES_TABLES) -> list[bytes]:
+    """ fonction qui retourne la liste des données (objets bytes-like) de lot compressées,
+chacune pouvant être décompressée par decompresser
+
+    modele -- modèle pré-entraîné avec lequel compresser (fichiers de type 6)
+    nb_processus -- nombre de processus se répartissant les tranches du lot
+    cache -- cache des tables de codage (None : pas de cache, comme pour compresser) ;
+réparti sur plusieurs processus, chaque tranche utilise son propre cache
+    voir compresser pour les autres arguments """
+    lot = list(lot)
+    LOGGER.info("Compression d'un lot de %s données, %s processus", len(lot), nb_processus)
+    return _repartir(_compresser_tranche, lot, nb_processus, canonique, longueur_max_code, \
+                     moteur, modele, _cache_des_processus(cache, nb_processus))
+
+def decompresser_lot(lot: Iterable[bytes],
+                     modeles: Iterable[Modele]=(),
+                     nb_processus: int=1,
+                     cache: CacheDeTables | None=CACHE_DES_TABLES) -> list[bytes]:
+    """ fonction qui retourne la liste des données compressées de lot décompressées
+
+    modeles -- modèles pré-entraînés des données de type 6
+    nb_processus -- nombre de processus se répartissant les tranches du lot
+    cache -- cache des tables de décodage (None : pas de cache, voir compresser_lot) """
+    lot = list(lot)
+    LOGGER.info("Décompression d'un lot de %s données, %s processus", len(lot), nb_processus)
+    return _repartir(_decompresser_tranche, lot, nb_processus, tuple(modeles), \
+                     _cache_des_processus(cache, nb_processus))
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+""" Module proposant les modèles pré-entraînés (dictionnaires partagés) et le format
+de type 6 qui y fait référence
+
+Un modèle fixe les longueurs des codes canoniques des octets observés sur un corpus
+d'entraînement ainsi que celle d'un symbole d'échappement : un octet absent du
+corpus est codé par le code d'échappement suivi de ses NB_BITS_ECHAPPEMENT bits.
+Un fichier de type 6 ne contient que l'identifiant du modèle, sans statistiques :
+
+    34 32 06
+    identifiant du modèle (NB_OCTETS_IDENTIFIANT octets)
+    longueur décodée
+    codes
+
+Un modèle est enregistré dans un fichier de la forme :
+
+    SIGNATURE_MODELE
+    identifiant du modèle (NB_OCTETS_IDENTIFIANT octets)
+    longueur du code des 256 octets puis de l'échappement (un octet chacune, 0 si absent)
+
+L'identifiant est la somme de contrôle CRC-32 des longueurs : deux modèles de mêmes
+codes ont le même identifiant.
+"""
+from typing import Dict, Iterable, Self
+import io
+import logging
+import os
+import zlib
+from huffman.compteur import Compteur, CompteurOctets
+from huffman.code_binaire import CodeBinaireCompact
+from huffman.canonique import codes_canoniques
+from huffman.table_des_codes import TableDesCodes
+from huffman.decodeur import TableDeDecodage
+from huffman.bits import LecteurDeBits
+from huffman.compresseur import statistiques, longueurs_canoniques, ecrire_codes
+from huffman.histogramme import TAILLE_BLOC
+
+LOGGER = logging.getLogger()
+
+ECHAPPEMENT = 256
+NB_BITS_ECHAPPEMENT = 8
+LONGUEUR_MAX_CODE = 16
+NB_OCTETS_IDENTIFIANT = 4
+SIGNATURE_MODELE = b"\x34\x32\x4d"
+
+class ModeleErreur(Exception):
+    """Erreurs relatives aux modèles pré-entraînés"""
+
+
+class ModeleInvalideErreur(ModeleErreur):
+    """Erreur lorsqu'un fichier ne contient pas un modèle valide"""
+
+
+class ModeleInconnuErreur(ModeleErreur):
+    """Erreur lorsqu'un fichier compressé fait référence à un modèle non fourni"""
+
+
+class Modele:
+    """ Modele représente les codes canoniques pré-entraînés des octets
+
+    arguments:
+    longueurs -- dictionnaire(symbole, longueur du code) des octets observés et de
+ECHAPPEMENT
+    """
+
+    def __init__(self, longueurs: Dict[int, int]) -> None:
+        if ECHAPPEMENT not in longueurs:
+            raise ModeleInvalideErreur("un modèle doit contenir le symbole d'échappement")
+        if any(not 0 <= symbole <= ECHAPPEMENT or not 0 < longueur < 256 \
+               for symbole, longueur in longueurs.items()):
+            raise ModeleInvalideErreur("symbole ou longueur de code invalide")
+        self._longueurs: Dict[int, int] = dict(sorted(longueurs.items()))
+        self._codes: Dict[int, CodeBinaireCompact] = self._codes_des_octets()
+        self._identifiant: int = zlib.crc32(self._longueurs_en_octets())
+        self._table_des_codes: TableDesCodes = None
+        self._table_de_decodage: TableDeDecodage = None
+
+    @classmethod
+    def depuis_statistiques(cls, stats: Compteur, longueur_max_code: int = LONGUEUR_MAX_CODE) -> Self:
+        """ retourne le modèle des octets de stats, l'échappement comptant pour une occurrence """
+        occurrences: Compteur = Compteur({octet: stats.nb_occurrences(octet) \
+                                          for octet in stats.elements})
+        occurrences.fixer(ECHAPPEMENT, 1)
+        return cls(longueurs_canoniques(occurrences, longueur_max_code))
+
+    def _codes_des_octets(self) -> Dict[int, CodeBinaireCompact]:
+        """ retourne le code de chaque octet, celui d'un octet absent du modèle étant
+le code d'échappement suivi des bits de l'octet """
+        codes = codes_canoniques(self._longueurs)
+        echappement: CodeBinaireCompact = codes.pop(ECHAPPEMENT)
+        for octet in range(256):
+            if octet not in codes:
+                codes[octet] = CodeBinaireCompact.depuis_valeur( \
+                    echappement.valeur | octet << echappement.longueur, \
+                    echappement.longueur + NB_BITS_ECHAPPEMENT)
+        return codes
+
+    def _longueurs_en_octets(self) -> bytes:
+        return bytes(self._longueurs.get(symbole, 0) for symbole in range(ECHAPPEMENT + 1))
+
+    @property
+    def identifiant(self) -> int:
+        """ permet d'obtenir l'identifiant du modèle """
+        return self._identifiant
+
+    @property
+    def longueurs(self) -> Dict[int, int]:
+        """ permet d'obtenir la longueur du code des octets observés et de l'échappement """
+        return dict(self._longueurs)
+
+    def codes(self) -> Dict[int, CodeBinaireCompact]:
+        """ retourne le code binaire (échappement compris) de chacun des 256 octets """
+        return dict(self._codes)
+
+    @property
+    def table_des_codes(self) -> TableDesCodes:
+        """ permet d'obtenir la table de codage, construite une seule fois """
+        if self._table_des_codes is None:
+            self._table_des_codes = TableDesCodes.depuis_codes(self._codes)
+        return self._table_des_codes
+
+    @property
+    def table_de_decodage(self) -> TableDeDecodage:
+        """ permet d'obtenir la table de décodage, construite une seule fois """
+        if self._table_de_decodage is None:
+            self._table_de_decodage = TableDeDecodage(self._codes)
+        return self._table_de_decodage
+
+    def ecrire(self, destination: io.RawIOBase) -> None:
+        """ écrit le modèle dans destination """
+        destination.write(SIGNATURE_MODELE)
+        destination.write(self._identifiant.to_bytes(NB_OCTETS_IDENTIFIANT, 'big'))
+        destination.write(self._longueurs_en_octets())
+
+    @classmethod
+    def lire(cls, source: io.RawIOBase) -> Self:
+        """ retourne le modèle lu dans source """
+        if source.read(len(SIGNATURE_MODELE)) != SIGNATURE_MODELE:
+            raise ModeleInvalideErreur("le fichier ne contient pas de modèle")
+        identifiant: int = int.from_bytes(source.read(NB_OCTETS_IDENTIFIANT), 'big')
+        octets: bytes = source.read(ECHAPPEMENT + 1)
+        if len(octets) != ECHAPPEMENT + 1:
+            raise ModeleInvalideErreur("modèle tronqué")
+        modele = cls({symbole: longueur for symbole, longueur in enumerate(octets) if longueur > 0})
+        if modele.identifiant != identifiant:
+            raise ModeleInvalideErreur("l'identifiant du modèle ne correspond pas à ses codes")
+        return modele
+
+    def enregistrer(self, nom_fichier: str) -> None:
+        """ enregistre le modèle dans le fichier nom_fichier """
+        with open(nom_fichier, 'wb') as fichier:
+            self.ecrire(fichier)
+
+    @classmethod
+    def charger(cls, nom_fichier: str) -> Self:
+        """ retourne le modèle enregistré dans le fichier nom_fichier """
+        with open(nom_fichier, 'rb') as fichier:
+            return cls.lire(fichier)
+
+    def __eq__(self, autre) -> bool:
+        if not isinstance(autre, self.__class__):
+            return False
+        return self._longueurs == autre.longueurs
+
+    def __repr__(self) -> str:
+        return f"Modele({self._longueurs})"
+
+
+def entrainer_modele(fichiers: Iterable[str | io.RawIOBase],
+                     longueur_max_code: int = LONGUEUR_MAX_CODE) -> Modele:
+    """ fonction qui retourne le modèle des octets des fichiers d'entraînement, donnés
+par leur nom ou par un flux binaire (lu une seule fois à partir de sa position
+courante : ce peut être un tube ou l'entrée standard) """
+    LOGGER.info("Entraînement d'un modèle")
+    stats: CompteurOctets = CompteurOctets()
+    for fichier in fichiers:
+        if isinstance(fichier, (str, os.PathLike)):
+            with open(fichier, 'rb') as flux:
+                stats.fusionner(statistiques(flux)[0])
+        else:
+            while donnees := fichier.read(TAILLE_BLOC):
+                stats.ajouter_octets(donnees)
+    modele: Modele = Modele.depuis_statistiques(stats, longueur_max_code)
+    LOGGER.debug("Modèle %08x : %s octets observés", modele.identifiant, len(modele.longueurs) - 1)
+    return modele
+
+def compresser_avec_modele(destination: io.RawIOBase, source: io.RawIOBase, modele: Modele,
+                           nb_octets_pour_serialisation_des_int: int=4,
+                           ordre_pour_serialisation_des_int='big') -> None:
+    """ fonction qui compresse source (positionnable) dans destination avec les codes
+de modele, seul son identifiant étant écrit (fichier de type 6) """
+    LOGGER.info("Compression avec le modèle %08x", modele.identifiant)
+    destination.write(b"\x34\x32\x06")
+    destination.write(modele.identifiant.to_bytes(NB_OCTETS_IDENTIFIANT, 'big'))
+    longueur: int = source.seek(0, io.SEEK_END)
+    destination.write(longueur.to_bytes(nb_octets_pour_serialisation_des_int, \
+                                        ordre_pour_serialisation_des_int))
+    ecrire_codes(destination, source, modele.table_des_codes)
+    LOGGER.debug("Fin de l'écriture")
+
+def decompresser_avec_modele(destination: io.RawIOBase, source: io.RawIOBase,
+                             modeles: Iterable[Modele],
+                             nb_octets_pour_serialisation_des_int: int=4,
+                             ordre_pour_serialisation_des_int='big') -> None:
+    """ fonction qui décompresse dans destination les codes de source (placée après
+le type de fichier) avec celui des modeles dont l'identifiant est indiqué """
+    identifiant: int = int.from_bytes(source.read(NB_OCTETS_IDENTIFIANT), 'big')
+    modele: Modele = next((modele for modele in modeles if modele.identifiant == identifiant), None)
+    if modele is None:
+        raise ModeleInconnuErreur(f"le modèle {identifiant:08x} n'a pas été fourni")
+    LOGGER.info("Décompression avec le modèle %08x", identifiant)
+    lecteur: LecteurDeBits = LecteurDeBits(source)
+    longueur: int = int.from_bytes(lecteur.lire_octets(nb_octets_pour_serialisation_des_int), \
+                                   byteorder=ordre_pour_serialisation_des_int)
+    modele.table_de_decodage.decoder(destination, lecteur, longueur)
+    LOGGER.debug("Fin de l'écriture")
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+""" Module proposant la lecture et l'écriture de fichiers projetés en mémoire (mmap)
+
+La source projetée est lue sans copie : read retourne des memoryview sur les pages
+du fichier, directement utilisables par le comptage et l'écriture des codes. La
+destination d'une décompression est dimensionnée à l'avance puis remplie en place.
+"""
+from typing import Iterator
+import contextlib
+import io
+import mmap
+from huffman.blocs import lire_index, IndexDeBlocsErreur
+from huffman.modele import NB_OCTETS_IDENTIFIANT
+
+class FluxProjete(io.RawIOBase):
+    """ FluxProjete est un flux binaire positionnable sur une zone mémoire
+
+    arguments:
+    memoire -- objet exposant le protocole buffer (mmap, bytearray...) ; le flux
+n'est accessible en écriture que si memoire l'est, sans pouvoir dépasser sa taille
+    name -- nom du fichier projeté, s'il y en a un
+    """
+
+    def __init__(self, memoire, name: str = None) -> None:
+        super().__init__()
+        self._vue = memoryview(memoire).cast('B')
+        self._position: int = 0
+        self.name = name
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return not self._vue.readonly
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, position: int, origine: int = io.SEEK_SET) -> int:
+        if origine == io.SEEK_CUR:
+            position += self._position
+        elif origine == io.SEEK_END:
+            position += len(self._vue)
+        if position < 0:
+            raise ValueError("position négative")
+        self._position = position
+        return position
+
+    def read(self, taille: int = -1) -> memoryview:
+        """ retourne, sans copie, au plus taille octets à partir de la position courante """
+        fin: int = len(self._vue) if taille is None or taille < 0 \
+            else min(self._position + taille, len(self._vue))
+        vue = self._vue[self._position:fin]
+        self._position = max(self._position, fin)
+        return vue
+
+    def readinto(self, tampon) -> int:
+        vue = self.read(len(tampon))
+        tampon[:len(vue)] = vue
+        return len(vue)
+
+    def readline(self, taille: int = -1) -> bytes:
+        fin: int = len(self._vue) if taille is None or taille < 0 \
+            else min(self._position + taille, len(self._vue))
+        debut: int = min(self._position, fin)
+        for position in range(debut, fin):
+            if self._vue[position] == 10:
+                fin = position + 1
+                break
+        self._position = max(self._position, fin)
+        return self._vue[debut:fin].tobytes()
+
+    def write(self, donnees) -> int:
+        """ écrit donnees à la position courante, dans les limites de la zone mémoire """
+        if self._vue.readonly:
+            raise io.UnsupportedOperation("flux projeté en lecture seule")
+        taille: int = len(memoryview(donnees).cast('B'))
+        if self._position + taille > len(self._vue):
+            raise ValueError("écriture au-delà de la taille du fichier projeté")
+        self._vue[self._position:self._position + taille] = memoryview(donnees).cast('B')
+        self._position += taille
+        return taille
+
+    def close(self) -> None:
+        if not self.closed:
+            self._vue.release()
+        super().close()
+
+@contextlib.contextmanager
+def projeter_en_lecture(nom_fichier: str) -> Iterator[FluxProjete]:
+    """ projette le fichier (non vide) en mémoire et fournit un flux pour le lire """
+    with open(nom_fichier, 'rb') as fichier:
+        with mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ) as memoire:
+            with FluxProjete(memoire, nom_fichier) as flux:
+                yield flux
+
+@contextlib.contextmanager
+def projeter_en_ecriture(nom_fichier: str, taille: int) -> Iterator[FluxProjete]:
+    """ crée le fichier avec taille octets (non nulle), le projette en mémoire et
+fournit un flux pour le remplir """
+    with open(nom_fichier, 'w+b') as fichier:
+        fichier.truncate(taille)
+        with mmap.mmap(fichier.fileno(), taille) as memoire:
+            with FluxProjete(memoire) as flux:
+                yield flux
+
+def taille_decompressee(source: io.RawIOBase,
+                        nb_octets_pour_serialisation_des_int: int=4,
+                        ordre_pour_serialisation_des_int='big') -> int:
+    """ fonction qui retourne la taille des données décompressées de source, lue dans
+son entête (ou son index pour le type 4), ou None si elle n'est pas connue à l'avance
+(type 5, fichier non compressé) ; l'identifiant du modèle d'un fichier de type 6 est ignoré """
+    source.seek(0)
+    entete: bytes = bytes(source.read(3 + nb_octets_pour_serialisation_des_int))
+    if len(entete) < 3 or entete[:2] != b"\x34\x32":
+        return None
+    type_fichier: int = entete[2]
+    if type_fichier == 0:
+        return 0
+    if type_fichier == 4:
+        try:
+            return sum(longueur for _, _, longueur in lire_index(source, ordre_pour_serialisation_des_int))
+        except IndexDeBlocsErreur:
+            return None
+    if type_fichier == 6:    # la longueur suit l'identifiant du modèle
+        source.seek(3 + NB_OCTETS_IDENTIFIANT)
+        entete = entete[:3] + bytes(source.read(nb_octets_pour_serialisation_des_int))
+    if type_fichier not in (1, 2, 3, 6) or len(entete) < 3 + nb_octets_pour_serialisation_des_int:
+        return None
+    longueur: int = int.from_bytes(entete[3:], byteorder=ordre_pour_serialisation_des_int)
+    return longueur + 1 if type_fichier == 1 else longueur    # le type 1 ajoute une fin de ligne
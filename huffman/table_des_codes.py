@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+""" Module proposant la classe TableDesCodes """
+from array import array
+from typing import Dict, Self
+from huffman.arbre_huffman import ArbreHuffman
+from huffman.code_binaire import CodeBinaire, CodeBinaireCompact, valeur_du_code
+
+NB_OCTETS = 256
+NB_BITS_MAX_TYPE = 64
+
+def _tableau_des_valeurs(valeurs: list[int], longueur_max: int) -> array | list[int]:
+    """ retourne valeurs sous forme d'array('Q'), ou de liste si un code dépasse 64 bits """
+    if longueur_max > NB_BITS_MAX_TYPE:
+        return valeurs
+    return array('Q', valeurs)
+
+class TableDesCodes:
+    """ TableDesCodes représente les codes binaires des 256 octets par deux tableaux plats
+indexés par octet, utilisables directement par les encodeurs (et par numpy)
+
+    le bit i de valeurs[octet] est le i-ème bit écrit ; un octet absent a une longueur
+nulle. valeurs est une liste lorsqu'un code dépasse 64 bits. Une table est immuable
+(elle peut être partagée par un cache) : ses tableaux sont copiés à la construction
+et les propriétés en retournent des copies
+
+    arguments:
+    valeurs -- valeur du code de chaque octet (array('Q') ou liste)
+    longueurs -- longueur du code de chaque octet (array('B'))
+    """
+    __slots__ = ("_valeurs", "_longueurs")
+
+    def __init__(self, valeurs: array | list[int], longueurs: array) -> None:
+        if not len(valeurs) == len(longueurs) == NB_OCTETS:
+            raise ValueError(f"une table des codes doit contenir {NB_OCTETS} entrées")
+        self._valeurs = valeurs[:]
+        self._longueurs = array('B', longueurs)
+
+    @classmethod
+    def depuis_arbre(cls, arbre: ArbreHuffman) -> Self:
+        """ retourne la table des codes d'un arbre d'octets, parcouru sans récursion
+(un arbre réduit à une feuille donne un code de 1 bit) """
+        valeurs: list[int] = [0] * NB_OCTETS
+        longueurs = array('B', bytes(NB_OCTETS))
+        if arbre.est_une_feuille:
+            longueurs[arbre.element] = 1
+            return cls(_tableau_des_valeurs(valeurs, 1), longueurs)
+        a_visiter: list[tuple[ArbreHuffman, int, int]] = [(arbre, 0, 0)]  # (noeud, valeur, profondeur)
+        longueur_max: int = 0
+        while a_visiter:
+            noeud, valeur, profondeur = a_visiter.pop()
+            if noeud.est_une_feuille:
+                valeurs[noeud.element] = valeur
+                longueurs[noeud.element] = profondeur
+                longueur_max = max(longueur_max, profondeur)
+            else:
+                a_visiter.append((noeud.fils_droit, valeur | 1 << profondeur, profondeur + 1))
+                a_visiter.append((noeud.fils_gauche, valeur, profondeur + 1))
+        return cls(_tableau_des_valeurs(valeurs, longueur_max), longueurs)
+
+    @classmethod
+    def depuis_codes(cls, codes: Dict[int, CodeBinaire]) -> Self:
+        """ retourne la table correspondant à un dictionnaire {octet: code} """
+        valeurs: list[int] = [0] * NB_OCTETS
+        longueurs = array('B', bytes(NB_OCTETS))
+        for octet, code in codes.items():
+            valeurs[octet] = valeur_du_code(code)
+            longueurs[octet] = len(code)
+        return cls(_tableau_des_valeurs(valeurs, max(longueurs)), longueurs)
+
+    @property
+    def valeurs(self) -> array | list[int]:
+        """ permet d'obtenir (une copie de) la valeur du code de chaque octet """
+        return self._valeurs[:]
+
+    @property
+    def longueurs(self) -> array:
+        """ permet d'obtenir (une copie de) la longueur du code de chaque octet """
+        return self._longueurs[:]
+
+    @property
+    def longueur_max(self) -> int:
+        """ permet d'obtenir la longueur du plus long code """
+        return max(self._longueurs)
+
+    def en_dict(self) -> Dict[int, CodeBinaireCompact]:
+        """ retourne le code binaire de chaque octet présent """
+        return {octet: CodeBinaireCompact.depuis_valeur(self._valeurs[octet], longueur) \
+                for octet, longueur in enumerate(self._longueurs) if longueur > 0}
+
+    def __getitem__(self, octet: int) -> tuple[int, int]:
+        """ retourne la valeur et la longueur du code de octet """
+        return self._valeurs[octet], self._longueurs[octet]
+
+    def __eq__(self, autre) -> bool:
+        if not isinstance(autre, self.__class__):
+            return False
+        return list(self._valeurs) == list(autre._valeurs) and self._longueurs == autre._longueurs
+
+    def __repr__(self) -> str:
+        return f"TableDesCodes({self._valeurs!r}, {self._longueurs!r})"
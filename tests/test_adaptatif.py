@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+import io
+import random
+import pytest
+from huffman.adaptatif import ArbreHuffmanAdaptatif, EncodeurAdaptatif, DecodeurAdaptatif, \
+    compresser_adaptatif, decompresser_adaptatif, FIN, NB_BITS_BRUTS
+from huffman.compresseur import decompresser
+from huffman.compteur import Compteur
+
+octets_a_compresser = bytes(random.Random(10).choices(range(256), weights=range(256, 0, -1), k=20000))
+
+def verifier_fratrie(arbre: ArbreHuffmanAdaptatif):
+    noeuds = []
+    a_parcourir = [arbre.racine]
+    while a_parcourir:
+        noeud = a_parcourir.pop()
+        noeuds.append(noeud)
+        if not noeud.est_une_feuille:
+            assert noeud.nb_occurrences == \
+                noeud.fils_gauche.nb_occurrences + noeud.fils_droit.nb_occurrences
+            assert noeud.fils_droit.numero == noeud.fils_gauche.numero + 1
+            assert noeud.numero > noeud.fils_droit.numero
+            a_parcourir += [noeud.fils_gauche, noeud.fils_droit]
+    noeuds.sort(key=lambda noeud: noeud.numero)
+    assert all(n1.nb_occurrences <= n2.nb_occurrences for n1, n2 in zip(noeuds, noeuds[1:]))
+
+def test_arbre_propriete_de_fratrie():
+    arbre = ArbreHuffmanAdaptatif()
+    for octet in b"abracadabra, abracadabra ! zzzzzzzzzzzzzzz":
+        arbre.incrementer(octet)
+        verifier_fratrie(arbre)
+    attendu = Compteur()
+    for octet in b"abracadabra, abracadabra ! zzzzzzzzzzzzzzz":
+        attendu.incrementer(octet)
+    assert arbre.compteur == attendu
+    assert arbre.nyt.nb_occurrences == 0
+
+def test_arbre_code():
+    arbre = ArbreHuffmanAdaptatif()
+    assert arbre.code(arbre.nyt) == (0, 0)
+    arbre.incrementer(65)
+    assert arbre.code(arbre.nyt) == (0, 1)
+    assert arbre.code(arbre.feuille(65)) == (1, 1)
+    assert arbre.feuille(66) is None
+
+def test_encoder_premier_octet():
+    encodeur = EncodeurAdaptatif()
+    assert encodeur.encoder(b"A") == b"A"
+    # 9ème bit de A (0), code de NYT (0) puis FIN sur NB_BITS_BRUTS bits
+    assert encodeur.terminer() == (FIN << 2).to_bytes((2 + NB_BITS_BRUTS + 7) // 8, 'little')
+
+@pytest.mark.parametrize("donnees",
+                         [b"",
+                          b"A",
+                          b"AAAAAAAAAAAAAAAAA",
+                          b"BACFGABDDACEACG",
+                          bytes(range(256)),
+                          octets_a_compresser
+                        ])
+def test_compresser_decompresser_adaptatif(donnees):
+    flux_compresse = io.BytesIO()
+    compresser_adaptatif(flux_compresse, io.BytesIO(donnees), 1000)
+    assert flux_compresse.getvalue()[:3] == b"\x34\x32\x05"
+    flux_decompresse = io.BytesIO()
+    decompresser(flux_decompresse, flux_compresse)
+    assert flux_decompresse.getvalue() == donnees
+
+def test_decoder_par_petits_morceaux():
+    encodeur = EncodeurAdaptatif()
+    compresse = encodeur.encoder(octets_a_compresser[:5000]) + encodeur.terminer()
+    decodeur = DecodeurAdaptatif()
+    decompresse = b"".join(decodeur.decoder(compresse[i:i + 1]) for i in range(len(compresse)))
+    assert decodeur.est_termine
+    assert decompresse == octets_a_compresser[:5000]
+
+def test_decoder_ignore_les_octets_apres_la_fin():
+    flux_compresse = io.BytesIO()
+    compresser_adaptatif(flux_compresse, io.BytesIO(b"BACFGABDDACEACG"))
+    flux_compresse.write(b"suite")
+    flux_compresse.seek(3)
+    flux_decompresse = io.BytesIO()
+    decompresser_adaptatif(flux_decompresse, flux_compresse)
+    assert flux_decompresse.getvalue() == b"BACFGABDDACEACG"
+
+def test_compression_sans_table():
+    flux_compresse = io.BytesIO()
+    compresser_adaptatif(flux_compresse, io.BytesIO(b"A" * 8000))
+    assert len(flux_compresse.getvalue()) < 1100
@@ -0,0 +1,50 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+import random
+from array import array
+import pytest
+from huffman.arbre_compact import ArbreCompact, FEUILLE
+from huffman.arbre_huffman import ArbreHuffman
+from huffman.compteur import Compteur
+from huffman.compresseur import arbre_de_huffman
+from huffman.canonique import longueurs_des_codes
+
+@pytest.fixture(scope="function")
+def arbre():
+    return ArbreHuffman(65, 3) + (ArbreHuffman(66, 1) + ArbreHuffman(67, 2))
+
+def test_depuis_arbre(arbre):
+    compact = ArbreCompact.depuis_arbre(arbre)
+    assert len(compact) == 5
+    assert compact.fils_gauches == array('I', [1, FEUILLE, 3, FEUILLE, FEUILLE])
+    assert compact.fils_droits == array('I', [2, FEUILLE, 4, FEUILLE, FEUILLE])
+    assert compact.elements == array('I', [0, 65, 0, 66, 67])
+    assert compact.nb_occurrences == array('Q', [6, 3, 3, 1, 2])
+    assert compact.est_une_feuille(1) and not compact.est_une_feuille(2)
+    assert compact.hauteur == arbre.hauteur == 2
+
+def test_aller_retour(arbre):
+    assert arbre.en_arbre_compact().en_arbre() == arbre
+    assert ArbreHuffman.depuis_arbre_compact(arbre.en_arbre_compact()) == arbre
+    feuille = ArbreHuffman(65, 3)
+    assert ArbreCompact.depuis_arbre(feuille).en_arbre() == feuille
+
+def test_eq(arbre):
+    assert ArbreCompact.depuis_arbre(arbre) == ArbreCompact.depuis_arbre(arbre)
+    assert ArbreCompact.depuis_arbre(arbre) != ArbreCompact.depuis_arbre(ArbreHuffman(65, 3))
+    assert eval(repr(ArbreCompact.depuis_arbre(arbre))) == ArbreCompact.depuis_arbre(arbre)
+
+def test_tableaux_incoherents():
+    with pytest.raises(ValueError):
+        ArbreCompact(array('I', [FEUILLE]), array('I'), array('I', [1]), array('Q', [1]))
+
+def test_codes_et_longueurs():
+    generateur = random.Random(7)
+    stats = Compteur({octet: generateur.randint(1, 500) for octet in range(256)})
+    arbre = arbre_de_huffman(stats)
+    compact = ArbreCompact.depuis_arbre(arbre)
+    assert compact.longueurs() == longueurs_des_codes(arbre)
+    codes = compact.codes()
+    assert {octet: len(code) for octet, code in codes.items()} == longueurs_des_codes(arbre)
+    assert compact.en_arbre() == arbre
+    assert ArbreCompact.depuis_arbre(ArbreHuffman(65, 3)).longueurs() == {65: 1}
@@ -0,0 +1,166 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+import io
+import os
+import random
+import pytest
+from huffman.archive import Membre, FluxDuMembre, RepertoireErreur, MembreErreur, \
+    SIGNATURE_REPERTOIRE, ecrire_archive, lire_repertoire, extraire_membre, \
+    fichiers_a_archiver, verifier_nom, creer_archive, lister_archive, extraire_archive
+from huffman.compresseur import compresser, decompresser
+from huffman.projection import FluxProjete, projeter_en_lecture
+
+CONTENUS = {    # dans l'ordre du parcours : fichiers d'un dossier puis sous-dossiers
+    "dossier/a.txt": b"abracadabra\n" * 50,
+    "dossier/meme_octet": b"A" * 100,
+    "dossier/vide": b"",
+    "dossier/sous/aleatoire.bin": bytes(random.Random(1).choices(range(256), k=5000)),
+}
+
+@pytest.fixture
+def dossier(tmp_path):
+    for nom, contenu in CONTENUS.items():
+        chemin = tmp_path / nom
+        chemin.parent.mkdir(parents=True, exist_ok=True)
+        chemin.write_bytes(contenu)
+    return tmp_path
+
+class FluxEspion(io.BytesIO):
+    """ BytesIO retenant les zones lues """
+
+    def __init__(self, donnees):
+        super().__init__(donnees)
+        self.zones = []
+
+    def read(self, taille=-1):
+        debut = self.tell()
+        donnees = super().read(taille)
+        self.zones.append((debut, debut + len(donnees)))
+        return donnees
+
+def test_fichiers_a_archiver(dossier):
+    assert list(fichiers_a_archiver([str(dossier / "dossier")])) == \
+        [(nom, os.path.join(str(dossier), *nom.split("/"))) for nom in CONTENUS]
+    assert list(fichiers_a_archiver([str(dossier / "dossier" / "a.txt")])) == \
+        [("a.txt", str(dossier / "dossier" / "a.txt"))]
+
+def test_aller_retour(dossier):
+    archive = io.BytesIO()
+    membres = ecrire_archive(archive, fichiers_a_archiver([str(dossier / "dossier")]))
+    assert archive.getvalue()[:3] == b"\x34\x32\x07"
+    assert archive.getvalue().endswith(SIGNATURE_REPERTOIRE)
+    assert lire_repertoire(archive) == membres
+    assert [membre.nom for membre in membres] == list(CONTENUS)
+    for membre in membres:
+        assert membre.longueur == len(CONTENUS[membre.nom])
+        destination = io.BytesIO()
+        extraire_membre(archive, membre, destination)
+        assert destination.getvalue() == CONTENUS[membre.nom]
+
+def test_membre_identique_a_compresser(dossier):
+    archive = io.BytesIO()
+    membre, = ecrire_archive(archive, [("a.txt", str(dossier / "dossier" / "a.txt"))])
+    attendu = io.BytesIO()
+    compresser(attendu, io.BytesIO(CONTENUS["dossier/a.txt"]), canonique=True)
+    assert archive.getvalue()[membre.position:membre.position + membre.taille] == attendu.getvalue()
+
+def test_lecture_limitee(dossier):
+    archive = io.BytesIO()
+    membres = ecrire_archive(archive, fichiers_a_archiver([str(dossier / "dossier")]))
+    espion = FluxEspion(archive.getvalue())
+    assert lire_repertoire(espion) == membres
+    assert len(espion.zones) == 3    # entête, fin puis répertoire
+    assert all(debut >= membres[-1].position + membres[-1].taille or fin <= 3 \
+               for debut, fin in espion.zones)
+    espion.zones.clear()
+    membre = membres[0]
+    extraire_membre(espion, membre, io.BytesIO())
+    assert espion.zones and all(membre.position <= debut <= fin <= membre.position + membre.taille \
+                                for debut, fin in espion.zones)
+    assert sum(fin - debut for debut, fin in espion.zones) == membre.taille
+
+def test_archive_vide():
+    archive = io.BytesIO()
+    assert ecrire_archive(archive, []) == []
+    assert lire_repertoire(archive) == []
+
+@pytest.mark.parametrize("donnees", [
+    b"",
+    b"\x34\x32\x02",
+    b"\x34\x32\x07" + b"\x00" * 8 + b"\x34\x32XX",
+    b"\x34\x32\x07" + (100).to_bytes(8, 'big') + SIGNATURE_REPERTOIRE,
+    b"\x34\x32\x07" + b"\x00\x00" + (3).to_bytes(8, 'big') + SIGNATURE_REPERTOIRE,
+])
+def test_repertoire_invalide(donnees):
+    with pytest.raises(RepertoireErreur):
+        lire_repertoire(io.BytesIO(donnees))
+
+@pytest.mark.parametrize("nom", ["", "/etc/passwd", "../x", "a/../../x", "a//b", "./a", "a\\b"])
+def test_nom_invalide(nom):
+    with pytest.raises(MembreErreur):
+        verifier_nom(nom)
+
+def test_membre_en_double(dossier):
+    nom_fichier = str(dossier / "dossier" / "a.txt")
+    with pytest.raises(MembreErreur):
+        ecrire_archive(io.BytesIO(), [("a", nom_fichier), ("a", nom_fichier)])
+
+def test_fichiers(dossier):
+    nom_archive = str(dossier / "archive.huf")
+    membres = creer_archive(nom_archive, [str(dossier / "dossier")])
+    assert lister_archive(nom_archive) == membres
+    with projeter_en_lecture(nom_archive) as source:    # lecture sans copie
+        assert lire_repertoire(source) == membres
+    extraction = dossier / "extraction"
+    extraction.mkdir()
+    assert extraire_archive(nom_archive, ["dossier/sous/aleatoire.bin"], str(extraction)) == \
+        [membres[-1]]
+    assert [str(chemin.relative_to(extraction)) for chemin in extraction.rglob("*") \
+            if chemin.is_file()] == [os.path.join("dossier", "sous", "aleatoire.bin")]
+    with pytest.raises(FileExistsError):
+        extraire_archive(nom_archive, dossier=str(extraction))
+    assert not (extraction / "dossier" / "a.txt").exists()    # rien n'est extrait
+    with pytest.raises(MembreErreur):
+        extraire_archive(nom_archive, ["absent"], str(extraction))
+    os.remove(extraction / "dossier" / "sous" / "aleatoire.bin")
+    extraire_archive(nom_archive, dossier=str(extraction))
+    for nom, contenu in CONTENUS.items():
+        assert (extraction / nom).read_bytes() == contenu
+
+def test_archive_dans_le_dossier_archive(dossier):
+    nom_archive = str(dossier / "dossier" / "archive.huf")
+    membres = creer_archive(nom_archive, [str(dossier / "dossier")])
+    assert [membre.nom for membre in membres] == list(CONTENUS)
+    assert creer_archive(nom_archive, [nom_archive]) == []
+
+def test_archive_incomplete_supprimee(dossier):
+    nom_archive = str(dossier / "archive.huf")
+    with pytest.raises(OSError):
+        creer_archive(nom_archive, [str(dossier / "dossier"), str(dossier / "absent")])
+    assert not os.path.exists(nom_archive)
+    with pytest.raises(MembreErreur):
+        creer_archive(nom_archive, [str(dossier / "dossier"), str(dossier / "dossier")])
+    assert not os.path.exists(nom_archive)
+
+def test_flux_du_membre():
+    membre = Membre("m", 3, 5, 0)
+    flux = FluxDuMembre(FluxProjete(b"abc01234xyz"), membre)
+    assert bytes(flux.read(2)) == b"01" and bytes(flux.read()) == b"234" and flux.read() == b""
+    flux.seek(-1, io.SEEK_END)
+    assert bytes(flux.read(10)) == b"4"
+    tampon = bytearray(8)
+    flux.seek(0)
+    assert flux.readinto(tampon) == 5 and tampon[:5] == b"01234"
+    assert isinstance(FluxDuMembre(FluxProjete(b"abc01234xyz"), membre).read(), memoryview)
+
+def test_extraire_archive_vide(tmp_path):
+    (tmp_path / "vide").write_bytes(b"")
+    with pytest.raises(RepertoireErreur):
+        extraire_archive(str(tmp_path / "vide"))
+
+def test_decompresser_une_archive(dossier):
+    archive = io.BytesIO()
+    ecrire_archive(archive, fichiers_a_archiver([str(dossier / "dossier")]))
+    destination = io.BytesIO()
+    decompresser(destination, archive)
+    assert destination.getvalue() == b""
@@ -0,0 +1,169 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+import asyncio
+import io
+import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import pytest
+from huffman.adaptatif import compresser_adaptatif
+from huffman.asynchrone import compresser_async, decompresser_async, executeur_partage, \
+    arreter_executeur_partage
+from huffman.blocs import compresser_blocs, IndexDeBlocsErreur
+from huffman.compresseur import compresser, decompresser
+
+@pytest.fixture(autouse=True, scope="module")
+def arret_de_l_executeur():
+    """ arrête les processus de l'exécuteur partagé à la fin des tests du module """
+    yield
+    arreter_executeur_partage()
+
+def donnees_aleatoires(graine, taille):
+    generateur = random.Random(graine)
+    return bytes(generateur.choices(b"abcdefghij \n\x00\xff", k=taille))
+
+async def traiter(fonction, donnees, taille_envoi=1000, **arguments):
+    """ envoie donnees à un serveur local qui les traite par fonction(reader, writer)
+et retourne sa réponse """
+    async def servir(reader, writer):
+        try:
+            await fonction(reader, writer, **arguments)
+        finally:
+            writer.close()
+
+    serveur = await asyncio.start_server(servir, "127.0.0.1", 0)
+    async with serveur:
+        reader, writer = await asyncio.open_connection(*serveur.sockets[0].getsockname()[:2])
+
+        async def envoyer():
+            for debut in range(0, len(donnees), taille_envoi):
+                writer.write(donnees[debut:debut + taille_envoi])
+                await writer.drain()
+            writer.write_eof()
+
+        envoi = asyncio.create_task(envoyer())
+        reponse = await reader.read()
+        await envoi
+        writer.close()
+        return reponse
+
+@pytest.mark.parametrize("taille", [0, 1, 999, 1000, 1001, 7777])
+def test_identique_a_compresser_blocs(taille):
+    donnees = donnees_aleatoires(taille, taille)
+    attendu = io.BytesIO()
+    compresser_blocs(attendu, io.BytesIO(donnees), taille_bloc=1000)
+    compresse = asyncio.run(traiter(compresser_async, donnees, taille_bloc=1000))
+    assert compresse == attendu.getvalue()
+    assert asyncio.run(traiter(decompresser_async, compresse, taille_envoi=77)) == donnees
+
+def test_executeur_et_blocs_en_cours():
+    donnees = donnees_aleatoires(1, 20000)
+    with ThreadPoolExecutor(1) as executeur:
+        compresse = asyncio.run(traiter(compresser_async, donnees, taille_bloc=512, \
+                                        executeur=executeur, nb_blocs_en_cours=1))
+        assert asyncio.run(traiter(decompresser_async, compresse, executeur=executeur, \
+                                   nb_blocs_en_cours=5)) == donnees
+    assert isinstance(executeur_partage(), ProcessPoolExecutor)
+    assert executeur_partage() is executeur_partage()
+    partage = executeur_partage()
+    arreter_executeur_partage()
+    assert executeur_partage() is not partage
+
+def test_flux_concurrents():
+    lot = [donnees_aleatoires(graine, 3000 * graine) for graine in range(1, 6)]
+
+    async def aller_retour(donnees):
+        compresse = await traiter(compresser_async, donnees, taille_bloc=1024)
+        return await traiter(decompresser_async, compresse)
+
+    async def tous():
+        return await asyncio.gather(*(aller_retour(donnees) for donnees in lot))
+
+    assert asyncio.run(tous()) == lot
+
+@pytest.mark.parametrize("canonique", [False, True])
+def test_decompresser_autres_types(canonique):
+    donnees = donnees_aleatoires(2, 5000)
+    compresse = io.BytesIO()
+    compresser(compresse, io.BytesIO(donnees), canonique=canonique)
+    assert asyncio.run(traiter(decompresser_async, compresse.getvalue())) == donnees
+    compresse = io.BytesIO()
+    compresser(compresse, io.BytesIO(b"AAAA"))
+    attendu = io.BytesIO()
+    decompresser(attendu, io.BytesIO(compresse.getvalue()))
+    assert asyncio.run(traiter(decompresser_async, compresse.getvalue())) == attendu.getvalue()
+
+def test_s_arrete_apres_l_index():
+    donnees = donnees_aleatoires(3, 3000)
+    compresse = asyncio.run(traiter(compresser_async, donnees, taille_bloc=1000))
+
+    async def decompresser_puis_lire_la_suite(reader, writer):
+        await decompresser_async(reader, writer)
+        writer.write(await reader.read())
+
+    assert asyncio.run(traiter(decompresser_puis_lire_la_suite, compresse + b"suite")) == \
+        donnees + b"suite"
+
+def test_index_absent():
+    compresse = asyncio.run(traiter(compresser_async, b"abc"))
+
+    async def decompresser_sans_erreur(reader, writer):
+        with pytest.raises(IndexDeBlocsErreur):
+            await decompresser_async(reader, writer)
+        writer.write(b"ok")
+
+    assert asyncio.run(traiter(decompresser_sans_erreur, compresse[:-1])) == b"abcok"
+
+def test_taille_bloc_invalide():
+    async def compresser_taille_nulle():
+        await compresser_async(asyncio.StreamReader(), None, taille_bloc=0)
+
+    with pytest.raises(ValueError):
+        asyncio.run(compresser_taille_nulle())
+
+def test_decompresser_au_fil_de_l_eau():
+    donnees = donnees_aleatoires(4, 200000)
+    compresse = io.BytesIO()
+    compresser_adaptatif(compresse, io.BytesIO(donnees))
+    compresse = compresse.getvalue()
+    assert len(compresse) > 80000
+
+    async def servir(reader, writer):
+        try:
+            await decompresser_async(reader, writer)
+        finally:
+            writer.close()
+
+    async def aller_retour():
+        serveur = await asyncio.start_server(servir, "127.0.0.1", 0)
+        async with serveur:
+            reader, writer = await asyncio.open_connection(*serveur.sockets[0].getsockname()[:2])
+            writer.write(compresse[:80000])
+            debut = await asyncio.wait_for(reader.read(1), 10)    # avant la fin de l'envoi
+            writer.write(compresse[80000:])
+            suite = await reader.readexactly(len(donnees) - len(debut))
+            writer.close()
+            return debut + suite
+
+    assert asyncio.run(aller_retour()) == donnees
+
+def test_interruption_de_la_decompression():
+    compresse = io.BytesIO()
+    compresser(compresse, io.BytesIO(donnees_aleatoires(5, 5000)))
+
+    async def decompresser_interrompu(reader, writer):
+        with pytest.raises(asyncio.TimeoutError):    # la source ne se termine pas
+            await asyncio.wait_for(decompresser_async(reader, writer), 0.5)
+        writer.write(b"interrompu")
+        writer.close()
+
+    async def sans_fin():
+        serveur = await asyncio.start_server(decompresser_interrompu, "127.0.0.1", 0)
+        async with serveur:
+            reader, writer = await asyncio.open_connection(*serveur.sockets[0].getsockname()[:2])
+            writer.write(compresse.getvalue()[:100])
+            reponse = await reader.read()
+            writer.close()
+            return reponse
+
+    # le thread de décodage, en attente de la source, est libéré : la boucle se ferme
+    assert asyncio.run(sans_fin()) == b"interrompu"
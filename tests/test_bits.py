@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+import io
+import random
+import pytest
+from huffman.bits import EcrivainDeBits, LecteurDeBits
+
+def ecrire_bit_a_bit(codes, garder_octet_final_nul):
+    """ écriture de référence, un bit à la fois """
+    sortie = bytearray()
+    buffer, bit_courant = 0, 0
+    for code, longueur in codes:
+        for position in range(longueur):
+            buffer |= (code >> position & 1) << bit_courant
+            bit_courant += 1
+            if bit_courant == 8:
+                sortie.append(buffer)
+                buffer, bit_courant = 0, 0
+    if bit_courant > 0 and (buffer != 0 or garder_octet_final_nul):
+        sortie.append(buffer)
+    return bytes(sortie)
+
+@pytest.mark.parametrize("codes, resultat",
+                         [([], b""),
+                          ([(1, 1)], b"\x01"),
+                          ([(0, 1)], b"\x00"),
+                          ([(0b101, 3), (0b11111, 5)], b"\xfd"),
+                          ([(0xABCD, 16), (1, 2)], b"\xcd\xab\x01")
+                        ])
+def test_ecrire(codes, resultat):
+    destination = io.BytesIO()
+    ecrivain = EcrivainDeBits(destination)
+    for code, longueur in codes:
+        ecrivain.ecrire(code, longueur)
+    ecrivain.terminer()
+    assert destination.getvalue() == resultat
+
+def test_terminer_sans_octet_final_nul():
+    destination = io.BytesIO()
+    ecrivain = EcrivainDeBits(destination)
+    ecrivain.ecrire(0xFF, 8)
+    ecrivain.ecrire(0, 3)
+    ecrivain.terminer(garder_octet_final_nul=False)
+    assert destination.getvalue() == b"\xff"
+
+@pytest.mark.parametrize("taille_tampon", [1, 7, 1 << 16])
+@pytest.mark.parametrize("garder_octet_final_nul", [True, False])
+def test_ecrire_identique_bit_a_bit(taille_tampon, garder_octet_final_nul):
+    generateur = random.Random(12)
+    codes = []
+    for _ in range(5000):
+        longueur = generateur.choice([1, 2, 3, 7, 8, 9, 15, 31, 64, 100])
+        codes.append((generateur.getrandbits(longueur), longueur))
+    destination = io.BytesIO()
+    ecrivain = EcrivainDeBits(destination, taille_tampon)
+    for code, longueur in codes:
+        ecrivain.ecrire(code, longueur)
+    assert ecrivain.nb_bits_en_attente + 8 * len(destination.getvalue()) == \
+        sum(longueur for _, longueur in codes)
+    ecrivain.terminer(garder_octet_final_nul)
+    assert destination.getvalue() == ecrire_bit_a_bit(codes, garder_octet_final_nul)
+
+def test_lecteur_regarder_consommer():
+    lecteur = LecteurDeBits(io.BytesIO(b"\xcd\xab\x01"))
+    assert lecteur.regarder(4) == 0xD
+    assert lecteur.regarder(16) == 0xABCD
+    lecteur.consommer(4)
+    assert lecteur.lire(12) == 0xABC
+    assert lecteur.lire(8) == 1
+    assert lecteur.lire(16) == 0    # au-delà de la fin : bits nuls
+
+def test_lecteur_lire_octets():
+    lecteur = LecteurDeBits(io.BytesIO(bytes(range(20))), 3)
+    assert lecteur.lire_octets(2) == b"\x00\x01"
+    assert lecteur.lire(8) == 2
+    assert lecteur.read(5) == bytes(range(3, 8))
+    lecteur.lire(1)
+    with pytest.raises(ValueError):
+        lecteur.lire_octets(1)
+    lecteur.consommer(7)
+    assert lecteur.lire_octets(100) == bytes(range(9, 20))
+
+@pytest.mark.parametrize("taille_tampon", [1, 5, 1 << 16])
+def test_lecteur_relit_l_ecrivain(taille_tampon):
+    generateur = random.Random(13)
+    codes = []
+    for _ in range(3000):
+        longueur = generateur.choice([1, 3, 8, 13, 64, 77])
+        codes.append((generateur.getrandbits(longueur), longueur))
+    flux = io.BytesIO()
+    ecrivain = EcrivainDeBits(flux)
+    for code, longueur in codes:
+        ecrivain.ecrire(code, longueur)
+    ecrivain.terminer()
+    flux.seek(0)
+    lecteur = LecteurDeBits(flux, taille_tampon)
+    assert [(lecteur.lire(longueur), longueur) for _, longueur in codes] == codes
@@ -0,0 +1,140 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+import io
+import random
+import pytest
+from huffman.blocs import compresser_bloc, decompresser_bloc, compresser_blocs, decompresser_blocs, \
+    lire_index, decompresser_fichier_blocs, IndexDeBlocsErreur
+from huffman.compresseur import decompresser
+
+octets_a_compresser = bytes(random.Random(5).choices(range(256), weights=range(256, 0, -1), k=30000))
+
+@pytest.mark.parametrize("donnees",
+                         [b"A",
+                          b"AAAAAAAAAAAAAAAAA",
+                          b"BACFGABDDACEACG",
+                          bytes(range(256))
+                        ])
+def test_compresser_decompresser_bloc(donnees):
+    assert decompresser_bloc(compresser_bloc(donnees), len(donnees)) == donnees
+
+def test_compresser_bloc_longueur_max_code():
+    donnees = b"".join(bytes([i]) * 2 ** i for i in range(14))
+    assert decompresser_bloc(compresser_bloc(donnees, 6), len(donnees)) == donnees
+
+@pytest.mark.parametrize("taille_bloc", [0, -1])
+def test_compresser_blocs_taille_invalide(taille_bloc):
+    with pytest.raises(ValueError):
+        compresser_blocs(io.BytesIO(), io.BytesIO(b"ABC"), taille_bloc)
+
+def test_compresser_blocs_vide():
+    destination = io.BytesIO()
+    compresser_blocs(destination, io.BytesIO())
+    assert destination.getvalue() == bytes([52, 50, 4, 0, 0, 0, 0]) + \
+        (7).to_bytes(8, 'big') + b"42IX"
+
+@pytest.mark.parametrize("taille_bloc, nb_processus",
+                         [(1000, 1),
+                          (100, 1),
+                          (len(octets_a_compresser), 1),
+                          (4096, 2)
+                        ])
+def test_compresser_decompresser_blocs(taille_bloc, nb_processus):
+    flux_compresse = io.BytesIO()
+    compresser_blocs(flux_compresse, io.BytesIO(octets_a_compresser), taille_bloc, nb_processus)
+    flux_decompresse = io.BytesIO()
+    decompresser(flux_decompresse, flux_compresse)
+    assert flux_decompresse.getvalue() == octets_a_compresser
+
+def test_blocs_independants_du_nb_processus():
+    flux1, flux2 = io.BytesIO(), io.BytesIO()
+    compresser_blocs(flux1, io.BytesIO(octets_a_compresser), 4096, 1)
+    compresser_blocs(flux2, io.BytesIO(octets_a_compresser), 4096, 2)
+    assert flux1.getvalue() == flux2.getvalue()
+
+def test_decompresser_blocs():
+    flux_compresse = io.BytesIO()
+    compresser_blocs(flux_compresse, io.BytesIO(b"BACFGABDDACEACG"), 4)
+    flux_compresse.seek(3)
+    flux_decompresse = io.BytesIO()
+    decompresser_blocs(flux_decompresse, flux_compresse)
+    assert flux_decompresse.getvalue() == b"BACFGABDDACEACG"
+
+def test_lire_index():
+    flux_compresse = io.BytesIO()
+    compresser_blocs(flux_compresse, io.BytesIO(octets_a_compresser), 10000)
+    index = lire_index(flux_compresse)
+    assert [longueur for _, _, longueur in index] == [10000, 10000, 10000]
+    for position, taille, longueur in index:
+        flux_compresse.seek(position - 8)
+        assert int.from_bytes(flux_compresse.read(4), 'big') == longueur
+        assert int.from_bytes(flux_compresse.read(4), 'big') == taille
+
+@pytest.mark.parametrize("donnees",
+                         [b"",
+                          b"\x34\x32\x02",
+                          bytes([52, 50, 4, 0, 0, 0, 0]),
+                          bytes([52, 50, 4, 0, 0, 0, 0]) + bytes(8) + b"42XX"
+                        ])
+def test_lire_index_erreur(donnees):
+    with pytest.raises(IndexDeBlocsErreur):
+        lire_index(io.BytesIO(donnees))
+
+def test_decompresser_blocs_multi_processus():
+    flux_compresse = io.BytesIO()
+    compresser_blocs(flux_compresse, io.BytesIO(octets_a_compresser), 4096)
+    flux_compresse.seek(3)
+    flux_decompresse = io.BytesIO()
+    decompresser_blocs(flux_decompresse, flux_compresse, nb_processus=2)
+    assert flux_decompresse.getvalue() == octets_a_compresser
+
+@pytest.mark.parametrize("octets", [b"", octets_a_compresser])
+def test_decompresser_fichier_blocs(tmp_path, octets):
+    with open(tmp_path / "compresse", 'wb') as fichier:
+        compresser_blocs(fichier, io.BytesIO(octets), 4096)
+    decompresser_fichier_blocs(tmp_path / "compresse", tmp_path / "decompresse", 2)
+    assert (tmp_path / "decompresse").read_bytes() == octets
+
+def test_compresser_blocs_positions_absolues():
+    destination = io.BytesIO()
+    destination.write(b"entete du conteneur")
+    compresser_blocs(destination, io.BytesIO(octets_a_compresser), 4096)
+    donnees = destination.getvalue()
+    debut_index = int.from_bytes(donnees[-12:-4], 'big')
+    valeurs = [int.from_bytes(donnees[i:i + 8], 'big') for i in range(debut_index, len(donnees) - 12, 8)]
+    blocs = [decompresser_bloc(donnees[position:position + taille], longueur) \
+             for position, taille, longueur in zip(valeurs[::3], valeurs[1::3], valeurs[2::3])]
+    assert b"".join(blocs) == octets_a_compresser
+
+class FluxNonPositionnable(io.RawIOBase):
+    """flux séquentiel, comme un tube ou une socket"""
+    def __init__(self, donnees=b""):
+        self._flux = io.BytesIO(donnees)
+
+    def readable(self):
+        return True
+
+    def writable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    def readinto(self, tampon):
+        return self._flux.readinto(tampon)
+
+    def write(self, donnees):
+        return self._flux.write(donnees)
+
+    def valeur(self):
+        return self._flux.getvalue()
+
+@pytest.mark.parametrize("nb_processus", [1, 2])
+def test_compresser_decompresser_blocs_flux_non_positionnables(nb_processus):
+    source = io.BufferedReader(FluxNonPositionnable(octets_a_compresser))
+    destination = FluxNonPositionnable()
+    compresser_blocs(destination, source, 4096, nb_processus)
+    flux_compresse = io.BufferedReader(FluxNonPositionnable(destination.valeur()))
+    flux_decompresse = FluxNonPositionnable()
+    decompresser(flux_decompresse, flux_compresse)
+    assert flux_decompresse.valeur() == octets_a_compresser
@@ -0,0 +1,83 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+import io
+import random
+import threading
+import pytest
+from huffman.cache import CacheDeTables, empreinte_des_longueurs
+from huffman.compresseur import compresser, decompresser
+
+def test_obtenir_succes_echecs_evictions():
+    cache = CacheDeTables(2)
+    constructions = []
+    def construire(valeur):
+        constructions.append(valeur)
+        return valeur
+    assert cache.obtenir("a", lambda: construire(1)) == 1
+    assert cache.obtenir("a", lambda: construire(2)) == 1
+    cache.obtenir("b", lambda: construire(3))
+    cache.obtenir("a", lambda: construire(4))    # "a" devient la plus récente
+    cache.obtenir("c", lambda: construire(5))    # "b" est retirée
+    assert cache.obtenir("a", lambda: construire(6)) == 1
+    assert cache.obtenir("b", lambda: construire(7)) == 7
+    assert constructions == [1, 3, 5, 7]
+    assert (cache.nb_succes, cache.nb_echecs, cache.nb_evictions, len(cache)) == (3, 4, 2, 2)
+    cache.vider()
+    assert (cache.nb_succes, cache.nb_echecs, cache.nb_evictions, len(cache)) == (0, 0, 0, 0)
+
+def test_cache_desactive():
+    cache = CacheDeTables(0)
+    assert cache.obtenir("a", lambda: 1) == 1 and cache.obtenir("a", lambda: 2) == 2
+    assert len(cache) == 0 and cache.nb_echecs == 2
+    with pytest.raises(ValueError):
+        CacheDeTables(-1)
+
+def test_empreinte_des_longueurs():
+    assert empreinte_des_longueurs({0: 1, 255: 2}) == bytes([1] + [0] * 254 + [2])
+
+@pytest.mark.parametrize("canonique", [False, True])
+def test_compresser_decompresser_avec_cache(canonique):
+    cache = CacheDeTables()
+    generateur = random.Random(21)
+    octets = [bytes(generateur.choices(range(60), k=2000)) for _ in range(3)]
+    octets.append(octets[0][::-1])    # même distribution que le premier
+    for donnees in octets:
+        flux_compresse, flux_sans_cache, flux_decompresse = io.BytesIO(), io.BytesIO(), io.BytesIO()
+        compresser(flux_compresse, io.BytesIO(donnees), canonique=canonique, cache=cache)
+        compresser(flux_sans_cache, io.BytesIO(donnees), canonique=canonique, cache=None)
+        assert flux_compresse.getvalue() == flux_sans_cache.getvalue()
+        decompresser(flux_decompresse, flux_compresse, cache=cache)
+        assert flux_decompresse.getvalue() == donnees
+    assert (cache.nb_succes, cache.nb_echecs) == (2, 6)
+
+def test_partage_entre_threads():
+    cache = CacheDeTables(4)
+    erreurs = []
+    def travailler(graine):
+        try:
+            for i in range(50):
+                cle = (graine + i) % 8
+                assert cache.obtenir(cle, lambda c=cle: c * 10) == cle * 10
+        except AssertionError as erreur:
+            erreurs.append(erreur)
+    threads = [threading.Thread(target=travailler, args=(graine,)) for graine in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not erreurs and len(cache) <= 4
+    assert cache.nb_succes + cache.nb_echecs == 400
+
+def test_tables_en_cache_immuables():
+    cache = CacheDeTables()
+    octets = b"abracadabra" * 20
+    attendu = io.BytesIO()
+    compresser(attendu, io.BytesIO(octets), canonique=True, cache=cache)
+    (cle, (longueurs, table)), = cache._tables.items()
+    with pytest.raises(TypeError):
+        longueurs[ord("a")] = 1
+    table.valeurs[ord("a")] = 0
+    table.longueurs[ord("a")] = 0
+    destination = io.BytesIO()
+    compresser(destination, io.BytesIO(octets), canonique=True, cache=cache)
+    assert destination.getvalue() == attendu.getvalue() and cache.nb_succes == 1
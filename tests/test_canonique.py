@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+import io
+import itertools
+import pytest
+from huffman.canonique import longueurs_des_codes, codes_canoniques, ecrire_longueurs, \
+    lire_longueurs, longueurs_limitees, taille_codee, EnteteCanoniqueErreur
+from huffman.compteur import Compteur
+from huffman.arbre_huffman import ArbreHuffman
+from huffman.code_binaire import Bit, CodeBinaire
+
+@pytest.fixture(scope="function")
+def arbre():
+    return ArbreHuffman(fils_gauche=ArbreHuffman(65, 4),
+                        fils_droit=ArbreHuffman(fils_gauche=ArbreHuffman(66, 1),
+                                                fils_droit=ArbreHuffman(67, 2)))
+
+def test_longueurs_des_codes(arbre):
+    assert longueurs_des_codes(arbre) == {65: 1, 66: 2, 67: 2}
+
+def test_longueurs_des_codes_feuille():
+    assert longueurs_des_codes(ArbreHuffman(65, 4)) == {65: 1}
+
+def test_codes_canoniques():
+    assert codes_canoniques({65: 2, 66: 1, 67: 3, 68: 3}) == \
+        {66: CodeBinaire(Bit.BIT_0),
+         65: CodeBinaire(Bit.BIT_1, Bit.BIT_0),
+         67: CodeBinaire(Bit.BIT_1, Bit.BIT_1, Bit.BIT_0),
+         68: CodeBinaire(Bit.BIT_1, Bit.BIT_1, Bit.BIT_1)}
+
+def test_codes_canoniques_erreur():
+    with pytest.raises(EnteteCanoniqueErreur):
+        codes_canoniques({65: 1, 66: 1, 67: 1})
+
+@pytest.mark.parametrize("longueurs, taille",
+                         [({65: 1, 66: 1}, 1 + 2 * 2),
+                          ({octet: 8 for octet in range(256)}, 1 + 256),
+                          ({octet: 7 for octet in range(128)}, 1 + 256)
+                        ])
+def test_ecrire_lire_longueurs(longueurs, taille):
+    flux = io.BytesIO()
+    ecrire_longueurs(flux, longueurs)
+    assert len(flux.getvalue()) == taille
+    flux.seek(0)
+    assert lire_longueurs(flux) == longueurs
+
+def test_lire_longueurs_erreur():
+    with pytest.raises(EnteteCanoniqueErreur):
+        lire_longueurs(io.BytesIO(bytes([1, 65, 1, 65, 2])))
+
+def taille_optimale_bornee(stats, longueur_max):
+    elements = list(stats.elements)
+    return min(taille_codee(stats, dict(zip(elements, longueurs))) \
+               for longueurs in itertools.product(range(1, longueur_max + 1), repeat=len(elements)) \
+               if sum(2 ** -longueur for longueur in longueurs) <= 1)
+
+@pytest.mark.parametrize("stats, longueur_max",
+                         [(Compteur({0: 1, 1: 1, 2: 2, 3: 3, 4: 5, 5: 8}), 3),
+                          (Compteur({0: 1, 1: 1, 2: 2, 3: 3, 4: 5, 5: 8}), 4),
+                          (Compteur({0: 1, 1: 1, 2: 2, 3: 3, 4: 5, 5: 8}), 5),
+                          (Compteur({0: 7, 1: 1, 2: 1, 3: 30, 4: 2}), 3),
+                          (Compteur({0: 3, 1: 9}), 1)
+                        ])
+def test_longueurs_limitees(stats, longueur_max):
+    longueurs = longueurs_limitees(stats, longueur_max)
+    assert max(longueurs.values()) <= longueur_max
+    assert sum(2 ** -longueur for longueur in longueurs.values()) == 1
+    assert taille_codee(stats, longueurs) == taille_optimale_bornee(stats, longueur_max)
+
+def test_longueurs_limitees_un_element():
+    assert longueurs_limitees(Compteur({65: 3}), 4) == {65: 1}
+
+def test_longueurs_limitees_erreur():
+    with pytest.raises(ValueError):
+        longueurs_limitees(Compteur({0: 1, 1: 1, 2: 1}), 1)
+
+def test_taille_codee():
+    assert taille_codee(Compteur({65: 3, 66: 2}), {65: 1, 66: 2}) == 7
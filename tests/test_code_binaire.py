@@ -1,7 +1,8 @@
 #!/usr/bin/python3
 
 import pytest
-from huffman.code_binaire import CodeBinaire, Bit, AuMoinsUnBitErreur
+from huffman.code_binaire import CodeBinaire, CodeBinaireCompact, Bit, AuMoinsUnBitErreur, \
+    valeur_du_code
 
 @pytest.fixture(scope="function")    
 def code_binaire():
@@ -124,3 +125,61 @@ def test_repr(code_binaire):
     
 def test_str(code_binaire):
     assert str(code_binaire) == "0110"
+
+
+@pytest.fixture(scope="function")
+def code_compact():
+    return CodeBinaireCompact(Bit.BIT_0, Bit.BIT_1, Bit.BIT_1, Bit.BIT_0)
+
+def test_compact_valeur_longueur(code_compact):
+    assert (code_compact.valeur, code_compact.longueur, len(code_compact)) == (0b0110, 4, 4)
+    assert CodeBinaireCompact.depuis_valeur(0b1101, 3) == CodeBinaireCompact(Bit.BIT_1, Bit.BIT_0, Bit.BIT_1)
+    with pytest.raises(AuMoinsUnBitErreur):
+        CodeBinaireCompact.depuis_valeur(0, 0)
+    with pytest.raises(TypeError):
+        CodeBinaireCompact(1)
+
+def test_compact_meme_api(code_binaire, code_compact):
+    assert code_compact == code_binaire and code_binaire == code_compact
+    assert list(code_compact) == list(code_binaire)
+    assert str(code_compact) == str(code_binaire) == "0110"
+    assert eval(repr(code_compact)) == code_compact
+    assert code_compact[-1] == code_binaire[-1]
+    assert code_compact[1:4] == code_binaire[1:4]
+    assert code_compact[0:4:2] == code_binaire[0:4:2]
+    with pytest.raises(IndexError):
+        _ = code_compact[4]
+
+@pytest.mark.parametrize("indice, bit",
+                        [(0, Bit.BIT_1),
+                         (slice(0,2,None), CodeBinaireCompact(Bit.BIT_1, Bit.BIT_0)),
+                         (slice(1,3,None), [Bit.BIT_0]),
+                         (2, CodeBinaire(Bit.BIT_1, Bit.BIT_0, Bit.BIT_1))
+                        ])
+def test_compact_setitem(code_binaire, code_compact, indice, bit):
+    code_compact[indice] = bit
+    code_binaire[indice] = CodeBinaire(*bit) if isinstance(bit, CodeBinaireCompact) else bit
+    assert code_compact == code_binaire
+
+def test_compact_delitem(code_binaire, code_compact):
+    del code_compact[1:3]
+    del code_binaire[1:3]
+    assert code_compact == code_binaire
+    with pytest.raises(AuMoinsUnBitErreur):
+        del code_compact[0:4]
+
+def test_compact_add(code_compact):
+    code = code_compact + CodeBinaireCompact(Bit.BIT_1)
+    assert code == CodeBinaire(Bit.BIT_0, Bit.BIT_1, Bit.BIT_1, Bit.BIT_0, Bit.BIT_1)
+    assert isinstance(code, CodeBinaireCompact)
+    assert code_compact + CodeBinaire(Bit.BIT_1) == code
+    assert CodeBinaire(Bit.BIT_1) + code_compact == CodeBinaire(Bit.BIT_1, Bit.BIT_0, Bit.BIT_1, Bit.BIT_1, Bit.BIT_0)
+    with pytest.raises(TypeError):
+        code_compact + 1
+
+def test_hash(code_binaire, code_compact):
+    assert hash(code_binaire) == hash(code_compact)
+    assert len({code_binaire, code_compact, CodeBinaire(Bit.BIT_0)}) == 2
+
+def test_valeur_du_code(code_binaire, code_compact):
+    assert valeur_du_code(code_binaire) == valeur_du_code(code_compact) == 0b0110
@@ -2,10 +2,15 @@
 # -*- coding: utf-8 -*-
 import pytest
 import io
-from huffman.compresseur import statistiques, arbre_de_huffman, codes_binaire, compresser, decompresser
+import random
+from huffman import compresseur as compresseur_module
+from huffman.compresseur import statistiques, arbre_de_huffman, codes_binaire, compresser, decompresser, \
+    statistiques_paralleles
+from huffman.histogramme import decouper_en_tranches
 from huffman.compteur import Compteur
 from huffman.arbre_huffman import ArbreHuffman
 from huffman.code_binaire import Bit, CodeBinaire
+from huffman.canonique import lire_longueurs
 
 # A 65, B 66, C 67, D 68, E 69, F 70, G 71
 import itertools
@@ -68,6 +73,27 @@ def test_compresser(flux_donnees):
     flux_donnees_compressees.seek(0)
     assert flux_donnees_compressees.read() == donnees_compressees
 
+class FluxEnEcritureSeule(io.RawIOBase):
+    """flux en écriture non positionnable, comme un tube ou la sortie standard"""
+    def __init__(self):
+        self.donnees = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, donnees):
+        self.donnees += donnees
+        return len(donnees)
+
+@pytest.mark.parametrize("canonique", [False, True])
+def test_compresser_vers_flux_non_positionnable(flux_donnees, canonique):
+    attendu = io.BytesIO()
+    compresser(attendu, flux_donnees, canonique=canonique)
+    destination = FluxEnEcritureSeule()
+    compresser(destination, flux_donnees, canonique=canonique)
+    assert not destination.seekable()
+    assert bytes(destination.donnees) == attendu.getvalue()
+
 def test_decompresser(flux_donnees):
     flux_donnees_compressees = io.BytesIO(donnees_compressees)
     flux_donnees_decompressees = io.BytesIO()
@@ -75,3 +101,59 @@ def test_decompresser(flux_donnees):
     flux_donnees_decompressees.seek(0)
     assert flux_donnees_decompressees.read() == octets_a_compresser
     
+
+@pytest.mark.parametrize("octets",
+                         [b"ABABBB",
+                          octets_a_compresser,
+                          bytes(range(256)) * 3 + b"\n\n\n"
+                        ])
+def test_compresser_decompresser_canonique(octets):
+    flux_donnees_compressees = io.BytesIO()
+    compresser(flux_donnees_compressees, io.BytesIO(octets), canonique=True)
+    assert flux_donnees_compressees.getvalue()[2] == 3
+    flux_donnees_decompressees = io.BytesIO()
+    decompresser(flux_donnees_decompressees, flux_donnees_compressees)
+    assert flux_donnees_decompressees.getvalue() == octets
+
+def test_compresser_canonique_entete(flux_donnees):
+    flux_donnees_compressees = io.BytesIO()
+    compresser(flux_donnees_compressees, flux_donnees, canonique=True)
+    assert flux_donnees_compressees.getvalue()[:3 + 4 + 1 + 2 * 7] == \
+        bytes([52, 50, 3, 0, 0, 0, 15, 6, 65, 2, 66, 3, 67, 2, 68, 3, 69, 4, 70, 4, 71, 3])
+
+@pytest.mark.parametrize("longueur_max_code", [4, 8, 12])
+def test_compresser_decompresser_longueur_max_code(longueur_max_code):
+    octets = b"".join(bytes([i]) * 2 ** i for i in range(16))
+    flux_donnees_compressees = io.BytesIO()
+    compresser(flux_donnees_compressees, io.BytesIO(octets), longueur_max_code=longueur_max_code)
+    flux_donnees_compressees.seek(3 + 4)
+    assert max(lire_longueurs(flux_donnees_compressees).values()) <= longueur_max_code
+    flux_donnees_decompressees = io.BytesIO()
+    decompresser(flux_donnees_decompressees, flux_donnees_compressees)
+    assert flux_donnees_decompressees.getvalue() == octets
+
+@pytest.mark.parametrize("octets",
+                         [b"A" * 10 + b"B" * 3 + b"C" * 266,
+                          b"\n" * 10 + b"AB" * 0x0A0A
+                        ])
+def test_compresser_decompresser_entete_avec_octets_10(octets):
+    flux_donnees_compressees = io.BytesIO()
+    compresser(flux_donnees_compressees, io.BytesIO(octets))
+    flux_donnees_decompressees = io.BytesIO()
+    decompresser(flux_donnees_decompressees, flux_donnees_compressees)
+    assert flux_donnees_decompressees.getvalue() == octets
+
+@pytest.mark.parametrize("nb_processus", [1, 3])
+def test_statistiques_paralleles(tmp_path, monkeypatch, nb_processus):
+    monkeypatch.setattr(compresseur_module, "decouper_en_tranches",
+                        lambda longueur, nb: decouper_en_tranches(longueur, nb, 1000))
+    octets = bytes(random.Random(8).choices(range(256), weights=range(1, 257), k=10007))
+    (tmp_path / "source").write_bytes(octets)
+    stats_paralleles, longueur = statistiques_paralleles(str(tmp_path / "source"), nb_processus)
+    assert (stats_paralleles, longueur) == statistiques(io.BytesIO(octets))
+    with open(tmp_path / "source", 'rb') as source:
+        assert statistiques(source, nb_processus) == (stats_paralleles, longueur)
+        flux1, flux2 = io.BytesIO(), io.BytesIO()
+        compresser(flux1, source, nb_processus=nb_processus)
+        compresser(flux2, io.BytesIO(octets))
+        assert flux1.getvalue() == flux2.getvalue()
@@ -1,7 +1,7 @@
 #!/usr/bin/python3
 
 import pytest
-from huffman.compteur import Compteur
+from huffman.compteur import Compteur, CompteurOctets
 
 @pytest.fixture(scope="function")
 def compteur_vide():
@@ -63,3 +63,39 @@ def test_elements_par_nb_occurences(compteur_non_vide):
                         ])
 def test_repr(compteur):
     assert eval(repr(compteur)) == compteur
+
+@pytest.fixture(scope="function")
+def compteur_octets():
+    return CompteurOctets({65: 2, 66: 1, 67: 3, 68: 1})
+
+def test_compteur_octets_meme_interface(compteur_octets):
+    compteur = Compteur({65: 2, 66: 1, 67: 3, 68: 1})
+    assert compteur_octets == compteur and compteur == compteur_octets
+    assert list(compteur_octets.elements) == [65, 66, 67, 68]
+    assert compteur_octets.nb_occurrences(67) == 3 and compteur_octets.nb_occurrences('z') == 0
+    assert compteur_octets.elements_moins_frequents() == {66, 68}
+    assert compteur_octets.elements_plus_frequents() == {67}
+    assert compteur_octets.elements_par_nb_occurrences() == compteur.elements_par_nb_occurrences()
+    assert str(compteur_octets) == str(compteur)
+    assert eval(repr(compteur_octets)) == compteur_octets
+    assert CompteurOctets().elements == set() and CompteurOctets().elements_plus_frequents() == set()
+
+def test_compteur_octets_incrementer_fixer(compteur_octets):
+    compteur_octets.incrementer(65)
+    compteur_octets.incrementer(0)
+    compteur_octets.fixer(66, 0)
+    assert compteur_octets == CompteurOctets({0: 1, 65: 3, 67: 3, 68: 1})
+    with pytest.raises(ValueError):
+        compteur_octets.incrementer(256)
+    with pytest.raises(ValueError):
+        compteur_octets.fixer('a', 1)
+
+def test_compteur_octets_ajouter_octets_et_fusionner(compteur_octets):
+    compteur_octets.ajouter_octets(b"AAE")
+    assert compteur_octets == CompteurOctets({65: 4, 66: 1, 67: 3, 68: 1, 69: 1})
+    autre = CompteurOctets.depuis_occurrences([1] * 256)
+    compteur_octets.fusionner(autre)
+    assert compteur_octets.nb_occurrences(65) == 5 and compteur_octets.nb_occurrences(0) == 1
+    compteur_octets.fusionner(Compteur({0: 2}))
+    assert compteur_octets.nb_occurrences(0) == 3
+    assert len(compteur_octets.occurrences) == 256
@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+import io
+import random
+import pytest
+from huffman.decodeur import TableDeDecodage, CodeInvalideErreur, valeur_du_code
+from huffman.compresseur import statistiques, arbre_de_huffman, codes_binaire, compresser, decompresser
+from huffman.code_binaire import Bit, CodeBinaire
+
+@pytest.fixture(scope="function")
+def codes():
+    return {65: CodeBinaire(Bit.BIT_0),
+            66: CodeBinaire(Bit.BIT_1, Bit.BIT_0),
+            67: CodeBinaire(Bit.BIT_1, Bit.BIT_1)}
+
+def octets_fibonacci(nb_symboles):
+    a, b = 1, 1
+    resultat = b""
+    for symbole in range(nb_symboles):
+        resultat += bytes([symbole]) * a
+        a, b = b, a + b
+    return resultat
+
+@pytest.mark.parametrize("code, resultat",
+                         [(CodeBinaire(Bit.BIT_1), 1),
+                          (CodeBinaire(Bit.BIT_0, Bit.BIT_1), 2),
+                          (CodeBinaire(Bit.BIT_1, Bit.BIT_1, Bit.BIT_0, Bit.BIT_1), 11)
+                        ])
+def test_valeur_du_code(code, resultat):
+    assert valeur_du_code(code) == resultat
+
+@pytest.mark.parametrize("bits_par_pas, nb_tables",
+                         [(1, 2),
+                          (2, 1),
+                          (10, 1)
+                        ])
+def test_nb_tables(codes, bits_par_pas, nb_tables):
+    assert TableDeDecodage(codes, bits_par_pas).nb_tables == nb_tables
+
+@pytest.mark.parametrize("bits_par_pas", [1, 2, 3, 10])
+def test_decoder(codes, bits_par_pas):
+    destination = io.BytesIO()
+    TableDeDecodage(codes, bits_par_pas).decoder(destination, io.BytesIO(bytes([0b00000111])), 4)
+    assert destination.getvalue() == b"CBAA"
+
+def test_bits_par_pas_erreur(codes):
+    with pytest.raises(ValueError):
+        TableDeDecodage(codes, 0)
+
+def test_code_invalide_erreur():
+    table = TableDeDecodage({65: CodeBinaire(Bit.BIT_0, Bit.BIT_0)})
+    with pytest.raises(CodeInvalideErreur):
+        table.decoder(io.BytesIO(), io.BytesIO(bytes([0b11])), 1)
+
+@pytest.mark.parametrize("bits_par_pas", [1, 4, 10])
+def test_decoder_codes_longs(bits_par_pas):
+    octets = octets_fibonacci(20)
+    stats, longueur = statistiques(io.BytesIO(octets))
+    codes = codes_binaire(arbre_de_huffman(stats))
+    assert max(len(code) for code in codes.values()) == 19
+    flux = io.BytesIO()
+    compresser(flux, io.BytesIO(octets))
+    flux.seek(3 + 4 + 256 * 4)
+    destination = io.BytesIO()
+    TableDeDecodage(codes, bits_par_pas).decoder(destination, flux, longueur)
+    assert destination.getvalue() == octets
+
+def test_compresser_decompresser_aleatoire():
+    generateur = random.Random(42)
+    octets = bytes(generateur.choices(range(256), weights=range(1, 257), k=200000))
+    flux_compresse = io.BytesIO()
+    compresser(flux_compresse, io.BytesIO(octets))
+    flux_decompresse = io.BytesIO()
+    decompresser(flux_decompresse, flux_compresse)
+    assert flux_decompresse.getvalue() == octets
@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+import io
+import random
+import pytest
+from huffman import encodeur
+from huffman.compresseur import statistiques, arbre_de_huffman, codes_binaire, ecrire_codes
+from huffman.code_binaire import Bit, CodeBinaire
+
+pytest.importorskip("numpy")
+
+@pytest.fixture(scope="function")
+def codes():
+    return {65: CodeBinaire(Bit.BIT_0),
+            66: CodeBinaire(Bit.BIT_1, Bit.BIT_0),
+            67: CodeBinaire(Bit.BIT_1, Bit.BIT_1)}
+
+def ecrire_codes_bit_a_bit(source, codes, monkeypatch):
+    destination = io.BytesIO()
+    with monkeypatch.context() as contexte:
+        contexte.setattr(encodeur, "np", None)
+        ecrire_codes(destination, source, codes)
+    return destination.getvalue()
+
+@pytest.mark.parametrize("octets, resultat",
+                         [(b"CBAA", bytes([0b00000111])),
+                          (b"CBAACC", bytes([0b11000111, 0b00000011])),
+                          (b"AAAAAAAA", bytes([0])),
+                          (b"AAAAAAAAA", bytes([0])),
+                          (b"AAAAAAAAB", bytes([0, 1]))
+                        ])
+def test_encoder_par_blocs(codes, octets, resultat):
+    destination = io.BytesIO()
+    encodeur.encoder_par_blocs(destination, io.BytesIO(octets), codes)
+    assert destination.getvalue() == resultat
+
+@pytest.mark.parametrize("taille_bloc", [1, 3, 1000, 1 << 14])
+def test_encoder_par_blocs_identique_bit_a_bit(monkeypatch, taille_bloc):
+    octets = bytes(random.Random(3).choices(range(40), weights=range(1, 41), k=20000))
+    codes = codes_binaire(arbre_de_huffman(statistiques(io.BytesIO(octets))[0]))
+    destination = io.BytesIO()
+    encodeur.encoder_par_blocs(destination, io.BytesIO(octets), codes, taille_bloc)
+    assert destination.getvalue() == ecrire_codes_bit_a_bit(io.BytesIO(octets), codes, monkeypatch)
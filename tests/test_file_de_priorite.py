@@ -59,3 +59,22 @@ def test_vide_erreur(file_vide):
 def test_non_comparable_erreur(file_non_vide):
     with pytest.raises(ElementNonComparableErreur):
         file_non_vide.enfiler("a")
+
+def test_non_comparable_erreur_construction():
+    with pytest.raises(ElementNonComparableErreur):
+        FileDePriorite((1, "a", 2))
+
+def test_ordre_d_arrivee_a_cle_egale():
+    file = FileDePriorite(((1, "a"), (0, "b"), (1, "c")), cle=lambda e: e[0])
+    file.enfiler((1, "d"))
+    file.enfiler((0, "e"))
+    assert [file.defiler()[1] for _ in range(len(file))] == ["b", "e", "a", "c", "d"]
+
+def test_construction_en_bloc_identique_a_enfiler():
+    elements = [(i * 7919) % 1000 for i in range(5000)]
+    file_en_bloc = FileDePriorite(elements, cle=lambda e: e // 10)
+    file_enfilee = FileDePriorite(cle=lambda e: e // 10)
+    for element in elements:
+        file_enfilee.enfiler(element)
+    assert [file_en_bloc.defiler() for _ in range(len(elements))] == \
+        [file_enfilee.defiler() for _ in range(len(elements))]
@@ -0,0 +1,36 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+import random
+import pytest
+from huffman import histogramme as module_histogramme
+from huffman.histogramme import ajouter_occurrences, decouper_en_tranches, \
+    occurrences_de_la_tranche
+
+@pytest.fixture(scope="function", params=["numpy", "bibliotheque_standard"])
+def moteur(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(module_histogramme, "np", None)
+    return request.param
+
+def test_ajouter_occurrences(moteur):
+    occurrences = [0] * 256
+    occurrences[65] = 2
+    ajouter_occurrences(occurrences, b"ABA\n")
+    assert occurrences[65] == 4 and occurrences[66] == 1 and occurrences[10] == 1
+    assert sum(occurrences) == 6
+
+@pytest.mark.parametrize("longueur, nb_tranches, taille_min, nb_attendu",
+                         [(100, 4, 10, 4), (100, 4, 60, 1), (5, 4, 10, 1), (0, 3, 10, 1), (103, 3, 1, 3)])
+def test_decouper_en_tranches(longueur, nb_tranches, taille_min, nb_attendu):
+    tranches = decouper_en_tranches(longueur, nb_tranches, taille_min)
+    assert len(tranches) == nb_attendu
+    assert tranches[0][0] == 0 and tranches[-1][1] == longueur
+    assert all(fin == debut for (_, fin), (debut, _) in zip(tranches, tranches[1:]))
+
+def test_occurrences_de_la_tranche(moteur, tmp_path):
+    octets = bytes(random.Random(2).choices(range(256), k=5000))
+    (tmp_path / "source").write_bytes(octets)
+    occurrences = occurrences_de_la_tranche(str(tmp_path / "source"), 1000, 3000, 7)
+    assert occurrences == [octets[1000:3000].count(octet) for octet in range(256)]
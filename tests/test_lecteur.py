@@ -0,0 +1,49 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+import io
+import random
+import pytest
+from huffman.blocs import compresser_blocs, IndexDeBlocsErreur
+from huffman.compresseur import compresser
+from huffman.lecteur import LecteurHuffman, ouvrir_huffman
+
+octets_a_compresser = bytes(random.Random(8).choices(range(256), weights=range(256, 0, -1), k=10000))
+
+@pytest.fixture(scope="function")
+def lecteur():
+    flux_compresse = io.BytesIO()
+    compresser_blocs(flux_compresse, io.BytesIO(octets_a_compresser), 1000)
+    return LecteurHuffman(flux_compresse)
+
+def test_taille(lecteur):
+    assert lecteur.taille == 10000
+    assert lecteur.nb_blocs == 10
+
+@pytest.mark.parametrize("offset, taille",
+                         [(0, 10),
+                          (995, 10),
+                          (1000, 1000),
+                          (1500, 3000),
+                          (0, 10000),
+                          (9990, 100),
+                          (20000, 5),
+                          (42, 0)
+                        ])
+def test_lire(lecteur, offset, taille):
+    assert lecteur.lire(offset, taille) == octets_a_compresser[offset:offset + taille]
+
+def test_lire_erreur(lecteur):
+    with pytest.raises(ValueError):
+        lecteur.lire(-1, 3)
+
+def test_lecteur_sans_index():
+    flux_compresse = io.BytesIO()
+    compresser(flux_compresse, io.BytesIO(b"BACFGABDDACEACG"))
+    with pytest.raises(IndexDeBlocsErreur):
+        LecteurHuffman(flux_compresse)
+
+def test_ouvrir_huffman(tmp_path):
+    with open(tmp_path / "compresse", 'wb') as fichier:
+        compresser_blocs(fichier, io.BytesIO(octets_a_compresser), 4096)
+    with ouvrir_huffman(tmp_path / "compresse") as lecteur:
+        assert lecteur.lire(4000, 200) == octets_a_compresser[4000:4200]
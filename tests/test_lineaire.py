@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+import io
+import random
+import pytest
+from huffman.lineaire import arbre_de_huffman_deux_files, longueurs_moffat_katajainen
+from huffman.compteur import Compteur
+from huffman.compresseur import arbre_de_huffman, codes_binaire, compresser, decompresser, \
+    MOTEUR_LINEAIRE
+from huffman.canonique import longueurs_des_codes
+from huffman.blocs import compresser_blocs
+
+def compteur_aleatoire(graine, nb_elements, nb_max):
+    generateur = random.Random(graine)
+    return Compteur({element: generateur.randint(1, nb_max) for element in range(nb_elements)})
+
+@pytest.mark.parametrize("stats",
+                         [Compteur({65: 3, 66: 5}),
+                          Compteur({65: 1, 66: 1, 67: 1, 68: 1}),
+                          Compteur({i: 2 ** i for i in range(20)}),
+                          compteur_aleatoire(1, 256, 3),
+                          compteur_aleatoire(2, 256, 1000),
+                          compteur_aleatoire(3, 2000, 10)
+                        ])
+def test_meme_arbre_et_memes_longueurs(stats):
+    arbre = arbre_de_huffman(stats)
+    assert codes_binaire(arbre_de_huffman_deux_files(stats)) == codes_binaire(arbre)
+    assert longueurs_moffat_katajainen(stats) == longueurs_des_codes(arbre)
+
+def test_un_seul_element():
+    stats = Compteur({65: 7})
+    assert arbre_de_huffman_deux_files(stats).element == 65
+    assert longueurs_moffat_katajainen(stats) == {65: 1}
+    assert longueurs_moffat_katajainen(Compteur()) == {}
+
+@pytest.mark.parametrize("canonique", [False, True])
+def test_compresser_meme_resultat(canonique):
+    octets = bytes(random.Random(4).choices(range(256), weights=[i % 5 + 1 for i in range(256)], k=5000))
+    flux1, flux2 = io.BytesIO(), io.BytesIO()
+    compresser(flux1, io.BytesIO(octets), canonique=canonique)
+    compresser(flux2, io.BytesIO(octets), canonique=canonique, moteur=MOTEUR_LINEAIRE, cache=None)
+    assert flux1.getvalue() == flux2.getvalue()
+    flux_decompresse = io.BytesIO()
+    decompresser(flux_decompresse, flux2, moteur=MOTEUR_LINEAIRE, cache=None)
+    assert flux_decompresse.getvalue() == octets
+
+def test_compresser_blocs_meme_resultat():
+    octets = bytes(random.Random(5).choices(range(40), k=5000))
+    flux1, flux2 = io.BytesIO(), io.BytesIO()
+    compresser_blocs(flux1, io.BytesIO(octets), 500)
+    compresser_blocs(flux2, io.BytesIO(octets), 500, moteur=MOTEUR_LINEAIRE)
+    assert flux1.getvalue() == flux2.getvalue()
+
+def test_moteur_inconnu():
+    with pytest.raises(ValueError):
+        compresser(io.BytesIO(), io.BytesIO(b"ABC"), moteur="inconnu")
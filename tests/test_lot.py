@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+import io
+import random
+import pytest
+from huffman import histogramme as module_histogramme
+from huffman import lot as module_lot
+from huffman.histogramme import histogrammes
+from huffman.lot import compresser_lot, decompresser_lot
+from huffman.cache import CacheDeTables
+from huffman.compresseur import compresser, decompresser
+from huffman.modele import Modele, ECHAPPEMENT
+
+def lot_aleatoire(graine, nb_donnees):
+    generateur = random.Random(graine)
+    lot = [bytes(generateur.choices(b"abcdefgh\n", k=generateur.randint(0, 300))) \
+           for _ in range(nb_donnees)]
+    return lot + [b"", b"A", b"AB", b"AAAA", bytes(range(256)), lot[0]]
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_histogrammes(monkeypatch, numpy):
+    if numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(module_histogramme, "np", None)
+    lot = lot_aleatoire(1, 20)
+    assert histogrammes(lot) == [[donnees.count(octet) for octet in range(256)] for donnees in lot]
+    assert histogrammes([memoryview(b"AB"), bytearray(b"B")])[1][66] == 1
+
+@pytest.mark.parametrize("canonique", [False, True])
+def test_identique_a_compresser(canonique):
+    lot = lot_aleatoire(2, 50)
+    attendus = []
+    for donnees in lot:
+        destination = io.BytesIO()
+        compresser(destination, io.BytesIO(donnees), canonique=canonique, cache=None)
+        attendus.append(destination.getvalue())
+    cache = CacheDeTables()
+    compresses = compresser_lot(lot, canonique=canonique, cache=cache)
+    assert compresses == attendus
+    assert cache.nb_succes >= 1    # la dernière donnée répète la première
+    attendus = []
+    for compresse in compresses:
+        destination = io.BytesIO()
+        decompresser(destination, io.BytesIO(compresse), cache=None)
+        attendus.append(destination.getvalue())
+    assert decompresser_lot(compresses, cache=cache) == attendus
+    assert decompresser_lot(compresses)[3] == lot[3]
+
+def test_repartition_sur_plusieurs_processus():
+    lot = lot_aleatoire(3, 30)
+    compresses = compresser_lot(lot, nb_processus=3)
+    assert compresses == compresser_lot(lot, cache=None)
+    assert decompresser_lot(compresses, nb_processus=3) == decompresser_lot(compresses)
+
+def test_sans_cache(monkeypatch):
+    lot = lot_aleatoire(4, 10)
+    attendus = compresser_lot(lot)
+    monkeypatch.setattr(module_lot, "CacheDeTables", None)    # None : aucun cache n'est créé
+    assert compresser_lot(lot, cache=None) == attendus
+    assert decompresser_lot(attendus, cache=None) == decompresser_lot(attendus)
+
+def test_avec_modele():
+    modele = Modele({97: 2, 98: 2, 99: 2, ECHAPPEMENT: 2})
+    lot = [b"abc", b"", b"abz\xff"]
+    compresses = compresser_lot(iter(lot), modele=modele)
+    assert all(compresse[2] == 6 for compresse in compresses)
+    assert decompresser_lot(compresses, modeles=[modele]) == lot
@@ -0,0 +1,71 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+import io
+import random
+import pytest
+from huffman.modele import Modele, entrainer_modele, compresser_avec_modele, ECHAPPEMENT, \
+    NB_BITS_ECHAPPEMENT, ModeleInvalideErreur, ModeleInconnuErreur
+from huffman.compteur import CompteurOctets
+from huffman.compresseur import compresser, decompresser
+from huffman.projection import taille_decompressee
+
+@pytest.fixture(scope="module")
+def corpus():
+    generateur = random.Random(22)
+    return bytes(generateur.choices(b'{"id": 12, "nom": "abc"}\n', k=20000))
+
+@pytest.fixture(scope="module")
+def modele(corpus):
+    stats = CompteurOctets()
+    stats.ajouter_octets(corpus)
+    return Modele.depuis_statistiques(stats)
+
+def test_codes_et_echappement(modele, corpus):
+    codes = modele.codes()
+    assert len(codes) == 256
+    assert set(modele.longueurs) == set(corpus) | {ECHAPPEMENT}
+    assert len(codes[0xE9]) == modele.longueurs[ECHAPPEMENT] + NB_BITS_ECHAPPEMENT
+    assert len(codes[ord('"')]) == modele.longueurs[ord('"')]
+
+@pytest.mark.parametrize("octets", [b"", b'{"id": 7, "nom": "xy\xe9z"}', bytes(range(256))])
+def test_compresser_decompresser(modele, octets):
+    flux_compresse, flux_decompresse = io.BytesIO(), io.BytesIO()
+    compresser_avec_modele(flux_compresse, io.BytesIO(octets), modele)
+    assert flux_compresse.getvalue()[:7] == b"\x34\x32\x06" + modele.identifiant.to_bytes(4, 'big')
+    assert taille_decompressee(flux_compresse) == len(octets)
+    decompresser(flux_decompresse, flux_compresse, modeles=[Modele({ECHAPPEMENT: 1}), modele])
+    assert flux_decompresse.getvalue() == octets
+
+def test_plus_petit_qu_avec_statistiques(modele):
+    octets = b'{"id": 21, "nom": "cab"}\n'
+    avec_modele, sans_modele = io.BytesIO(), io.BytesIO()
+    compresser_avec_modele(avec_modele, io.BytesIO(octets), modele)
+    compresser(sans_modele, io.BytesIO(octets))
+    assert len(avec_modele.getvalue()) < len(octets) < len(sans_modele.getvalue())
+
+def test_modele_inconnu(modele):
+    flux_compresse = io.BytesIO()
+    compresser_avec_modele(flux_compresse, io.BytesIO(b"abc"), modele)
+    with pytest.raises(ModeleInconnuErreur):
+        decompresser(io.BytesIO(), flux_compresse)
+
+def test_enregistrer_charger_entrainer(tmp_path, modele, corpus):
+    (tmp_path / "corpus1").write_bytes(corpus[:5000])
+    (tmp_path / "corpus2").write_bytes(corpus[5000:])
+    modele_entraine = entrainer_modele([tmp_path / "corpus1", tmp_path / "corpus2"])
+    assert modele_entraine == modele and modele_entraine.identifiant == modele.identifiant
+    assert entrainer_modele([tmp_path / "corpus1", io.BytesIO(corpus[5000:])]) == modele
+    modele.enregistrer(tmp_path / "modele")
+    assert Modele.charger(tmp_path / "modele") == modele
+    assert eval(repr(modele)) == modele
+
+@pytest.mark.parametrize("contenu",
+                         [b"\x34\x32\x05", b"\x34\x32\x4d\x00\x00\x00\x00" + bytes(10),
+                          b"\x34\x32\x4d\x00\x00\x00\x00" + bytes(256) + b"\x01"])
+def test_lire_erreur(contenu):
+    with pytest.raises(ModeleInvalideErreur):
+        Modele.lire(io.BytesIO(contenu))
+
+def test_sans_echappement():
+    with pytest.raises(ModeleInvalideErreur):
+        Modele({65: 1})
@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+import io
+import random
+import pytest
+from huffman.projection import FluxProjete, projeter_en_lecture, projeter_en_ecriture, \
+    taille_decompressee
+from huffman.compresseur import compresser, decompresser
+from huffman.blocs import compresser_blocs
+from huffman.adaptatif import compresser_adaptatif
+
+octets_a_compresser = bytes(random.Random(11).choices(range(256), weights=range(256, 0, -1), k=20000))
+
+def test_flux_projete_lecture():
+    flux = FluxProjete(b"ABC\nDEF")
+    assert isinstance(flux.read(2), memoryview)
+    assert flux.readline() == b"C\n"
+    assert bytes(flux.read()) == b"DEF"
+    assert bytes(flux.read(5)) == b""
+    assert flux.seek(-2, io.SEEK_END) == 5
+    assert flux.readline(1) == b"E"
+    assert not flux.writable()
+    with pytest.raises(io.UnsupportedOperation):
+        flux.write(b"X")
+
+def test_flux_projete_ecriture():
+    memoire = bytearray(4)
+    flux = FluxProjete(memoire)
+    flux.write(b"AB")
+    flux.write(memoryview(b"CD"))
+    assert memoire == b"ABCD"
+    with pytest.raises(ValueError):
+        flux.write(b"E")
+
+@pytest.mark.parametrize("octets, canonique",
+                         [(b"A" * 10, False),
+                          (b"BACFGABDDACEACG", False),
+                          (b"\n\n\nA\nB\n", False),
+                          (octets_a_compresser, False),
+                          (octets_a_compresser, True)
+                        ])
+def test_compresser_decompresser_projete(tmp_path, octets, canonique):
+    (tmp_path / "source").write_bytes(octets)
+    with projeter_en_lecture(tmp_path / "source") as source:
+        with open(tmp_path / "compresse", 'wb') as destination:
+            compresser(destination, source, canonique=canonique)
+    flux_compresse = io.BytesIO()
+    compresser(flux_compresse, io.BytesIO(octets), canonique=canonique)
+    assert (tmp_path / "compresse").read_bytes() == flux_compresse.getvalue()
+    with projeter_en_lecture(tmp_path / "compresse") as source:
+        taille = taille_decompressee(source)
+        with projeter_en_ecriture(tmp_path / "decompresse", taille) as destination:
+            decompresser(destination, source)
+    attendu = octets + b"\n" if len(set(octets)) == 1 else octets
+    assert (tmp_path / "decompresse").read_bytes() == attendu
+
+def test_taille_decompressee():
+    flux = io.BytesIO()
+    compresser_blocs(flux, io.BytesIO(octets_a_compresser), 5000)
+    assert taille_decompressee(flux) == len(octets_a_compresser)
+    flux = io.BytesIO()
+    compresser(flux, io.BytesIO(b""))
+    assert taille_decompressee(flux) == 0
+    flux = io.BytesIO()
+    compresser_adaptatif(flux, io.BytesIO(octets_a_compresser))
+    assert taille_decompressee(flux) is None
+    assert taille_decompressee(io.BytesIO(b"pas compresse")) is None
@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+import io
+import random
+from array import array
+import pytest
+from huffman.table_des_codes import TableDesCodes
+from huffman.arbre_huffman import ArbreHuffman
+from huffman.compteur import Compteur
+from huffman.compresseur import arbre_de_huffman, codes_binaire, table_des_codes, ecrire_codes, \
+    compresser, decompresser
+from huffman.code_binaire import Bit, CodeBinaire
+
+@pytest.fixture(scope="function")
+def arbre():
+    return ArbreHuffman(65, 3) + (ArbreHuffman(66, 1) + ArbreHuffman(67, 2))
+
+def test_depuis_arbre(arbre):
+    table = table_des_codes(arbre)
+    assert table[65] == (0b0, 1) and table[66] == (0b01, 2) and table[67] == (0b11, 2)
+    assert table[68] == (0, 0)
+    assert isinstance(table.valeurs, array) and table.longueur_max == 2
+    assert table.en_dict() == codes_binaire(arbre)
+    assert TableDesCodes.depuis_codes(table.en_dict()) == table
+    assert eval(repr(table)) == table
+
+def test_feuille_seule():
+    assert table_des_codes(ArbreHuffman(65, 3)).en_dict() == {65: CodeBinaire(Bit.BIT_0)}
+
+def test_taille_incorrecte():
+    with pytest.raises(ValueError):
+        TableDesCodes(array('Q', [0]), array('B', [1]))
+
+def test_meme_codes_que_codes_binaire():
+    generateur = random.Random(11)
+    arbre = arbre_de_huffman(Compteur({octet: generateur.randint(1, 500) for octet in range(256)}))
+    assert table_des_codes(arbre).en_dict() == codes_binaire(arbre)
+
+@pytest.mark.parametrize("vectorise", [False, True])
+def test_codes_de_plus_de_64_bits(monkeypatch, vectorise):
+    if vectorise:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr("huffman.encodeur.np", None)
+    fibonacci = [1, 1]
+    while len(fibonacci) < 80:
+        fibonacci.append(fibonacci[-1] + fibonacci[-2])
+    arbre = arbre_de_huffman(Compteur(dict(enumerate(fibonacci))))
+    table = table_des_codes(arbre)
+    assert table.longueur_max > 64 and isinstance(table.valeurs, list)
+    assert table.en_dict() == codes_binaire(arbre)
+    octets = bytes(range(80))
+    destination_table, destination_dict = io.BytesIO(), io.BytesIO()
+    ecrire_codes(destination_table, io.BytesIO(octets), table)
+    ecrire_codes(destination_dict, io.BytesIO(octets), codes_binaire(arbre))
+    assert destination_table.getvalue() == destination_dict.getvalue()
+
+def test_compresser_decompresser():
+    octets = bytes(random.Random(12).choices(range(256), k=3000))
+    flux_compresse, flux_decompresse = io.BytesIO(), io.BytesIO()
+    compresser(flux_compresse, io.BytesIO(octets))
+    flux_compresse.seek(0)
+    decompresser(flux_decompresse, flux_compresse)
+    assert flux_decompresse.getvalue() == octets